@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Excel report generation
+Times generate_excel_report on a synthetic league (default: 20 teams,
+double round robin = 380 games) without touching frontend/public/data.
+
+Usage:
+    python bench/bench_excel_report.py [--teams 20] [--players 16] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_excel_report import collect_team_games, create_workbook
+
+
+def make_league(num_teams: int = 20, players_per_team: int = 16, lineup_size: int = 14, seed: int = 42) -> list:
+    """Create a double round robin league in the game-centric JSON format"""
+    rng = random.Random(seed)
+    teams = [f"TSV Team {i:02d}" for i in range(num_teams)]
+    rosters = {team: [f"Spieler {j:02d} {team[-2:]}" for j in range(players_per_team)] for team in teams}
+
+    def lineup(team):
+        players = []
+        for name in rng.sample(rosters[team], min(lineup_size, players_per_team)):
+            seven_meters = rng.choice([0, 0, 0, 1, 2])
+            players.append({
+                'name': name,
+                'goals': rng.randint(0, 8),
+                'two_min_penalties': rng.choice([0, 0, 1]),
+                'yellow_cards': rng.choice([0, 1]),
+                'red_cards': 0,
+                'blue_cards': 0,
+                'seven_meters': seven_meters,
+                'seven_meters_goals': rng.randint(0, seven_meters)
+            })
+        return players
+
+    games = []
+    for home in teams:
+        for away in teams:
+            if home == away:
+                continue
+            order = len(games)
+            games.append({
+                'game_id': f"handball4all.bench.{order}",
+                'order': order,
+                'date': "Sa, 20.09.",
+                'home': {'team_name': home, 'players': lineup(home)},
+                'away': {'team_name': away, 'players': lineup(away)}
+            })
+    return games
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Excel report generation")
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--players', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    games = make_league(args.teams, args.players)
+    print(f"📊 Excel-Benchmark: {args.teams} Teams, {len(games)} Spiele, {args.repeat} Durchläufe")
+
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = Path(tmp) / "bench.xlsx"
+        for run in range(1, args.repeat + 1):
+            start = time.perf_counter()
+            # Silence the per-team progress lines
+            with contextlib.redirect_stdout(io.StringIO()):
+                wb = create_workbook(collect_team_games(games))
+                wb.save(output_file)
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+            print(f"   [{run}/{args.repeat}] {elapsed:.2f} s ({output_file.stat().st_size / 1024:.0f} KB)")
+
+    print(f"✅ Bester Lauf: {min(timings):.2f} s, Mittel: {sum(timings) / len(timings):.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Goal timeline graphics
+Renders synthetic games with generate_goal_graphic.render_goal_graphics and
+reports throughput (graphics per second) and average file size for each
+output format and worker count.
+
+Usage:
+    python bench/bench_goal_graphics.py [--games 40] [--goals 55] [--workers 1 2 4]
+                                        [--formats png svg json]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_goal_graphic import render_goal_graphics, OUTPUT_FORMATS
+
+
+def make_game(idx: int, num_goals: int, rng: random.Random) -> dict:
+    """Create a game with a random, time-sorted goals_timeline"""
+    times = sorted(rng.randint(0, 60 * 60 - 1) for _ in range(num_goals))
+    goals_timeline = [{
+        'minute': t // 60,
+        'second': t % 60,
+        'scorer': f"Spieler {rng.randint(1, 14)}",
+        'team': rng.choice(['home', 'away']),
+        'seven_meter': rng.random() < 0.1
+    } for t in times]
+    return {
+        'game_id': f"handball4all.bench.{idx}",
+        'date': "Sa, 20.09.",
+        'home': {'team_name': f"TSV Heim {idx}", 'players': []},
+        'away': {'team_name': f"SG Gast {idx}", 'players': []},
+        'goals_timeline': goals_timeline
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark goal graphic rendering")
+    parser.add_argument('--games', type=int, default=40)
+    parser.add_argument('--goals', type=int, default=55)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--formats', nargs='+', default=['png', 'svg', 'json'], choices=OUTPUT_FORMATS)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    games = [make_game(idx, args.goals, rng) for idx in range(args.games)]
+    print(f"🎨 Grafik-Benchmark: {args.games} Spiele à {args.goals} Tore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for output_format in args.formats:
+            print(f"   {output_format.upper()}:")
+            for workers in args.workers:
+                tasks = [{
+                    'game_data': game,
+                    'output_path': str(Path(tmp) / f"{workers}_{idx}.{output_format}"),
+                    'half_duration': 30,
+                    'output_format': output_format
+                } for idx, game in enumerate(games)]
+
+                start = time.perf_counter()
+                # Silence the per-graphic progress lines
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results = render_goal_graphics(tasks, workers=workers)
+                elapsed = time.perf_counter() - start
+
+                errors = sum(1 for r in results if r['error'])
+                sizes = [Path(r['output_path']).stat().st_size for r in results if r['output_path']]
+                avg_kb = sum(sizes) / len(sizes) / 1024 if sizes else 0
+                print(f"      {workers} Worker: {elapsed:.2f} s, {len(tasks) / elapsed:.1f} Grafiken/s, "
+                      f"Ø {avg_kb:.1f} KB" + (f" ({errors} Fehler)" if errors else ""))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Lineup page parsers
+Parses Aufstellung pages with every DOM backend of utility.parsing and
+with the embedded-state extractor (utility.page_state), checks that all
+of them return the same players as the bs4 reference, and reports the
+parse time per page.
+
+Without --corpus, synthetic pages shaped like handball.net lineup pages are
+generated (navigation headings, doubled team headings, embedded state
+script, card images). With --corpus DIR every *.html file below DIR is used;
+pages without embedded lineup data are only parsed by the DOM backends. The
+embedded state is matched to the page's game, whose id comes from the
+corpus index (a recording, see utility.replay) or the file name.
+
+Usage:
+    python bench/bench_html_parsers.py [--pages 40] [--repeat 5] [--corpus DIR]
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utility.parsing import parse_aufstellung_page, set_parser_backend, PARSER_BACKENDS
+from utility.page_state import parse_lineup_state
+
+REFERENCE_BACKEND = 'bs4'
+GAME_ID_RE = re.compile(r'handball4all\.[\w-]+\.\d+')
+
+
+def make_lineup_page(idx: int, rng: random.Random) -> str:
+    """Create a lineup page with two teams, rendered and as embedded state"""
+    teams = [f"TSV Heim {idx}", f"SG Gäst {idx}"]
+    nav = ''.join(f"<h3>{name}</h3>" for name in ['Fan-Services', 'Vereinsservices', 'News'])
+
+    def make_player(number):
+        return {
+            'number': number,
+            'firstname': rng.choice(['Max', 'Jonas', 'Lukas', 'Felix', 'Jörg']),
+            'lastname': f"Muster {number}",
+            'goals': rng.choice([0, 0, rng.randint(1, 9)]),
+            'penalties': rng.choice([0, 0, 1, 2]),
+            'cards': rng.sample(['yellow', 'red', 'blue'], rng.choice([0, 0, 0, 1, 2]))
+        }
+
+    lineups = [[make_player(number) for number in rng.sample(range(1, 99), rng.randint(9, 16))] for _ in teams]
+
+    def row(player):
+        cards = ''.join(f'<img src="/img/card-{color}.svg" alt="">' for color in player['cards'])
+        goals = str(player['goals']) if player['goals'] or rng.random() < 0.5 else ''
+        penalties = str(player['penalties']) if player['penalties'] else ''
+        return (f"<tr><td>{player['number']}</td><td><a href='/spieler/{idx}{player['number']}'>"
+                f"<span>{player['firstname']} {player['lastname']}</span></a></td><td>{goals}</td>"
+                f"<td>{penalties}</td><td>{cards}</td><td><!-- 7m -->{rng.randint(0, 2)}/{rng.randint(0, 3)}</td></tr>")
+
+    def table(players):
+        body = ''.join(row(player) for player in players)
+        tbody = f"<tbody>{body}<tr><td></td><td>GESAMT</td><td>30</td></tr></tbody>"
+        if rng.random() < 0.2:
+            tbody = body  # some tables come without tbody
+        return (f"<table class='w-full'><thead><tr><th>Nr</th><th>Name</th><th>Tore</th>"
+                f"<th>2min</th><th>Karten</th><th>7m</th></tr></thead>{tbody}</table>")
+
+    def state_player(player):
+        return {
+            'id': f"p{idx}.{player['number']}",
+            'number': player['number'],
+            'firstname': player['firstname'],
+            'lastname': player['lastname'],
+            'goals': player['goals'],
+            'penalties': player['penalties'],
+            'yellowCards': player['cards'].count('yellow'),
+            'redCards': player['cards'].count('red'),
+            'blueCards': player['cards'].count('blue')
+        }
+
+    state = {'props': {'pageProps': {
+        'game': {
+            'id': f"handball4all.baden-wuerttemberg.{8000000 + idx}",
+            'homeTeam': {'id': f"t{idx}h", 'name': teams[0]},
+            'awayTeam': {'id': f"t{idx}a", 'name': teams[1]},
+            'startsAt': 1758380400000 + idx * 86400000
+        },
+        'lineup': {'home': [state_player(p) for p in lineups[0]], 'away': [state_player(p) for p in lineups[1]]},
+        'navigation': [{'title': f"Link {i}", 'href': f"/seite/{i}"} for i in range(1500)]
+    }}}
+
+    sections = ''.join(
+        f"<section><h3><span>{team}</span></h3><div class='hidden md:block'><h3>{team}</h3></div>{table(players)}</section>"
+        for team, players in zip(teams, lineups)
+    )
+    return (
+        "<!DOCTYPE html><html lang='de'><head><meta charset='utf-8'><title>Aufstellung</title>"
+        "<style>.a{color:red}</style></head><body>"
+        f"<header><nav>{nav}</nav></header>"
+        f"<main><div class='text-sm'>So, {idx % 28 + 1:02d}.{idx % 12 + 1:02d}. 17:00 Uhr</div>{sections}</main>"
+        "<footer><h3>Kontakt</h3><h3>mein.handball.net</h3></footer>"
+        f"<script id='__NEXT_DATA__' type='application/json'>{json.dumps(state, ensure_ascii=False)}</script>"
+        "</body></html>"
+    )
+
+
+def game_id(name: str) -> str:
+    """handball4all game id in a page URL or file name, None if there is none"""
+    match = GAME_ID_RE.search(name)
+    return match.group(0) if match else None
+
+
+def load_corpus(corpus: Path) -> list:
+    """All *.html files below corpus as (name, html, game_id)"""
+    urls = {}
+    index_file = corpus / 'index.json'
+    if index_file.exists():
+        with open(index_file, 'r', encoding='utf-8') as f:
+            urls = {entry['file']: url for url, entry in json.load(f).get('entries', {}).items() if entry.get('file')}
+    pages = []
+    for path in sorted(corpus.rglob('*.html')):
+        name = str(path.relative_to(corpus))
+        pages.append((name, path.read_text(encoding='utf-8', errors='replace'), game_id(urls.get(name, name))))
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lineup page parsers")
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--corpus', type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.corpus:
+        pages = load_corpus(args.corpus)
+        print(f"🔍 Parser-Benchmark: {len(pages)} Seiten aus {args.corpus}")
+    else:
+        rng = random.Random(42)
+        pages = [(f"synthetic_{idx}", make_lineup_page(idx, rng), f"handball4all.baden-wuerttemberg.{8000000 + idx}")
+                 for idx in range(args.pages)]
+        print(f"🔍 Parser-Benchmark: {len(pages)} synthetische Seiten")
+
+    if not pages:
+        print("❌ Keine Seiten gefunden")
+        sys.exit(1)
+
+    backends = [name for name in PARSER_BACKENDS if set_parser_backend(name) == name]
+    reference = {name: parse_aufstellung_page(html, backend=REFERENCE_BACKEND) for name, html, _ in pages}
+
+    mismatches = 0
+    for backend in backends:
+        if backend == REFERENCE_BACKEND:
+            continue
+        for name, html, _ in pages:
+            if parse_aufstellung_page(html, backend=backend) != reference[name]:
+                mismatches += 1
+                print(f"   ❌ {backend}: abweichendes Ergebnis für {name}")
+
+    # Embedded state only carries the players, compare those
+    state_pages = [(name, html, gid) for name, html, gid in pages if gid and parse_lineup_state(html, gid)]
+    for name, html, gid in state_pages:
+        if parse_lineup_state(html, gid) != reference[name][0]:
+            mismatches += 1
+            print(f"   ❌ state: abweichende Spieler für {name}")
+
+    def time_parser(parse, subset):
+        per_page = []
+        for _, html, gid in subset:
+            runs = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                parse(html, gid)
+                runs.append(time.perf_counter() - start)
+            per_page.append(min(runs))
+        return statistics.median(per_page) * 1000
+
+    kb = sum(len(html) for _, html, _ in pages) / len(pages) / 1024
+    timings = {}
+    for backend in backends:
+        timings[backend] = time_parser(lambda html, _: parse_aufstellung_page(html, backend=backend), pages)
+        print(f"   {backend:5s} {timings[backend]:7.2f} ms/Seite (Median, Ø {kb:.0f} KB/Seite)")
+    if state_pages:
+        timings['state'] = time_parser(parse_lineup_state, state_pages)
+        print(f"   state {timings['state']:7.2f} ms/Seite ({len(state_pages)} Seiten mit eingebetteten Daten)")
+
+    if REFERENCE_BACKEND in timings:
+        for backend, ms in timings.items():
+            if backend != REFERENCE_BACKEND:
+                print(f"   ⚡ {backend} ist {timings[REFERENCE_BACKEND] / ms:.1f}× schneller als {REFERENCE_BACKEND}")
+
+    if mismatches:
+        print(f"❌ {mismatches} Abweichungen")
+        sys.exit(1)
+    print(f"✅ Alle Backends liefern identische Ergebnisse")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Nightly no-op run
+Measures what `python scraper.py` costs when no Spielplan changed: the
+HTTP pre-check answers 304 and the run ends before Chrome, graphics and
+Excel. Each run is a fresh interpreter (as in CI), timed end to end, next
+to the first full run that fills the data and the Spielplan cache.
+
+Pages come from a replay corpus (synthetic by default, see
+bench_scrape_replay.py) through utility.replay.replay_http_fetcher, which
+answers conditional requests like a web server with ETags. Everything
+runs in a temporary directory.
+
+Usage:
+    python bench/bench_noop_run.py [--games 200] [--repeat 5]
+    python bench/bench_noop_run.py --corpus DIR
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'bench'))
+
+from utility import replay
+
+
+def run_scraper(workdir: Path, config_file: Path, corpus_dir: Path) -> dict:
+    """One scraper run in a fresh interpreter: wall time and its run report"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(ROOT / 'scraper.py'), '--config', str(config_file), '--replay', str(corpus_dir),
+         '--quiet'],
+        cwd=workdir, capture_output=True, text=True
+    )
+    seconds = time.perf_counter() - start
+    if result.returncode != 0:
+        print(result.stdout[-2000:], result.stderr[-2000:])
+        raise SystemExit(f"❌ scraper.py beendet mit {result.returncode}")
+    with open(workdir / 'frontend/public/data/run_report.json', 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    return {'seconds': seconds, 'report': report}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a scraper run without Spielplan changes")
+    parser.add_argument('--corpus', type=Path, default=None)
+    parser.add_argument('--games', type=int, default=200, help="Games of the synthetic corpus")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        workdir = Path(scratch)
+        corpus_dir = workdir / 'corpus'
+        if args.corpus:
+            shutil.copytree(args.corpus, corpus_dir)
+            corpus = replay.Corpus(corpus_dir)
+        else:
+            from bench_scrape_replay import build_synthetic_corpus
+            corpus = build_synthetic_corpus(corpus_dir, args.games)
+        if not corpus.meta:
+            raise SystemExit(f"❌ Kein Replay-Korpus in {args.corpus}")
+
+        meta = corpus.meta
+        config_file = workdir / 'config.json'
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump({'ref': {'base_url': meta['base_url']},
+                       'crawler': {'date_from': meta['date_from'], 'date_to': meta['date_to']},
+                       'leagues': meta['leagues']}, f)
+
+        print(f"🌙 No-Op-Benchmark: {len(meta['leagues'])} Liga(n), {len(corpus)} Korpus-Einträge")
+        full = run_scraper(workdir, config_file, corpus_dir)
+        print(f"   Erster Lauf (alles neu):   {full['seconds']:7.2f} s")
+
+        runs = [run_scraper(workdir, config_file, corpus_dir) for _ in range(args.repeat)]
+
+    noop_seconds = statistics.median(run['seconds'] for run in runs)
+    in_process = statistics.median(run['report']['wall_seconds'] for run in runs)
+    report = runs[-1]['report']
+    browser_pages = sum(stats['count'] for stage, stats in report['stages'].items()
+                        if stage.startswith('fetch.') and stage != 'fetch.spielplan_http')
+    print(f"   No-Op-Lauf (Median von {len(runs)}): {noop_seconds * 1000:7.0f} ms, "
+          f"davon im Scraper {in_process * 1000:.0f} ms")
+    print(f"   Ligen unverändert (304): {report['counters'].get('precheck.not_modified', 0)}, "
+          f"Browser-Seiten: {browser_pages}")
+
+
+if __name__ == '__main__':
+    main()
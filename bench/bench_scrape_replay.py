@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Scrape pipeline against a replay corpus
+Runs utility.scraping.scrape_daily end to end for every league of a recorded
+corpus (python scraper.py --record DIR), without network or browser, and
+reports games/s plus the utility.metrics stage timings (fetch and parse
+per page type, PDF download and parse).
+
+Pages come straight from disk, or with --server through the local stand-in
+HTTP server of utility.replay. Output JSON is written to a temporary
+directory, the real frontend/public/data is not touched.
+
+Without --corpus a synthetic corpus is generated (Spielplan pages, lineup
+pages from bench_html_parsers and info pages, no PDFs), each rendered as
+markup and as embedded state like the live pages.
+
+Usage:
+    python bench/bench_scrape_replay.py --corpus DIR [--server] [--repeat 3] [--parser lxml|bs4]
+    python bench/bench_scrape_replay.py [--games 200]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'bench'))
+
+from utility import log, metrics, replay, scraping
+from utility.parsing import set_parser_backend, get_parser_backend
+from utility.pdf_parser import set_pdf_fetcher
+from utility.report_urls import set_report_fetcher
+
+BASE_URL = 'https://www.handball.net'
+LEAGUE_PREFIX = 'handball4all.baden-wuerttemberg.'
+
+def build_synthetic_corpus(root: Path, games: int) -> replay.Corpus:
+    """Spielplan, lineup and info pages for a league with `games` games"""
+    from bench_html_parsers import make_lineup_page
+
+    rng = random.Random(7)
+    corpus = replay.Corpus(root)
+    name = 'synthetic'
+    date_from = date(2025, 9, 6)
+    date_to = date_from + timedelta(days=games // 6 + 1)
+    league_url = (f"{BASE_URL}/ligen/{LEAGUE_PREFIX}{name}/spielplan"
+                  f"?dateFrom={date_from.isoformat()}&dateTo={date_to.isoformat()}")
+
+    items = []
+    rows = []
+    for idx in range(games):
+        game_id = f"{LEAGUE_PREFIX}{8000000 + idx}"
+        starts_at = datetime(2025, 9, 6, 16, tzinfo=timezone.utc) + timedelta(days=idx // 6)
+        items.append({
+            'id': game_id,
+            'homeTeam': {'name': f"TSV Heim {idx}"},
+            'awayTeam': {'name': f"SG Gäst {idx}"},
+            'startsAt': starts_at.isoformat()
+        })
+        weekday = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So'][starts_at.weekday()]
+        rows.append(f"<div class='game'><div>{weekday}, {starts_at:%d.%m.}</div>"
+                    f"<a href='/spiele/{game_id}/info'><span>TSV Heim {idx}</span><span>SG Gäst {idx}</span></a></div>")
+        corpus.add_page(f"{BASE_URL}/spiele/{game_id}/aufstellung", None, make_lineup_page(idx, rng))
+        officials = [{'role': 'Schiedsrichter', 'person': {'firstname': 'Sven', 'lastname': f"Pfiff {idx}"}},
+                     {'role': 'Zeitnehmer', 'name': f"Uhr {idx}"}]
+        info_state = {'props': {'pageProps': {'game': items[-1], 'officials': officials}}}
+        official_items = (f"<li class='w-full'><div>Schiedsrichter</div><div>Sven Pfiff {idx}</div></li>"
+                          f"<li class='w-full'><div>Zeitnehmer</div><div>Uhr {idx}</div></li>")
+        corpus.add_page(f"{BASE_URL}/spiele/{game_id}/info", None,
+                        f"<html><body><h3>Spielinfo</h3><ul>{official_items}</ul>"
+                        "<script id='__NEXT_DATA__' type='application/json'>"
+                        f"{json.dumps(info_state, ensure_ascii=False)}</script></body></html>")
+
+    per_page = 50
+    for page in range(1, games // per_page + 2):
+        chunk = items[(page - 1) * per_page:page * per_page]
+        state = {'props': {'pageProps': {'schedule': {'total': games, 'items': chunk}}}}
+        markup = ''.join(rows[(page - 1) * per_page:page * per_page])
+        corpus.add_page(f"{league_url}&page={page}", None,
+                        f"<html><body><div class='text-sm'>{games} Spiele gefunden</div>{markup}"
+                        "<script id='__NEXT_DATA__' type='application/json'>"
+                        f"{json.dumps(state, ensure_ascii=False)}</script></body></html>")
+
+    corpus.meta = {
+        'base_url': BASE_URL,
+        'date_from': date_from.isoformat(),
+        'date_to': date_to.isoformat(),
+        'leagues': [{'name': name, 'display_name': 'Synthetische Liga', 'half_duration': 30}],
+        'recorded_at': datetime.combine(date_to + timedelta(days=1), datetime.min.time()).isoformat()
+    }
+    corpus.save()
+    return corpus
+
+
+def run_once(corpus: replay.Corpus, server_url, verbose: bool) -> dict:
+    """Replay every league of the corpus once in a scratch directory"""
+    meta = corpus.meta
+    scraping.configure({
+        'ref': {'base_url': meta['base_url']},
+        'crawler': {'date_from': meta['date_from'], 'date_to': meta['date_to']},
+        'leagues': meta['leagues']
+    })
+    scraping.WAIT_SCALE = 0
+    scraping.REFERENCE_TIME = datetime.fromisoformat(meta['recorded_at'])
+
+    source = replay.ReplaySource(corpus, server_url)
+    driver = replay.ReplayDriver(source)
+    set_pdf_fetcher(replay.replay_pdf_fetcher(source))
+    set_report_fetcher(replay.replay_report_fetcher(source))
+
+    end_date = min(date.fromisoformat(meta['date_to']), scraping.REFERENCE_TIME.date()).isoformat()
+    games = 0
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        metrics.reset()
+        start = time.perf_counter()
+        try:
+            with contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO()):
+                for league in meta['leagues']:
+                    with metrics.league(league['name']):
+                        stats = scraping.scrape_daily(driver, league['name'], f"{LEAGUE_PREFIX}{league['name']}",
+                                                      meta['date_from'], end_date)
+                    games += stats['games_total']
+        finally:
+            seconds = time.perf_counter() - start
+            os.chdir(cwd)
+            set_pdf_fetcher(None)
+            set_report_fetcher(None)
+
+    return {'games': games, 'seconds': seconds, 'report': metrics.METRICS.report(),
+            'served': source.served, 'misses': len(source.misses)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrape pipeline against a replay corpus")
+    parser.add_argument('--corpus', type=Path, default=None)
+    parser.add_argument('--games', type=int, default=200, help="Games of the synthetic corpus")
+    parser.add_argument('--server', action='store_true', help="Serve pages through the local HTTP stand-in")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--parser', choices=['lxml', 'bs4'], default=None)
+    parser.add_argument('--verbose', action='store_true', help="Show scraper output")
+    args = parser.parse_args()
+
+    if args.parser:
+        set_parser_backend(args.parser)
+    log.configure_logging('info' if args.verbose else 'quiet')
+
+    with tempfile.TemporaryDirectory() as synthetic_dir:
+        if args.corpus:
+            corpus = replay.Corpus(args.corpus)
+            if not len(corpus) or not corpus.meta:
+                print(f"❌ Kein Replay-Korpus in {args.corpus}")
+                sys.exit(1)
+            print(f"⏯️  Replay-Benchmark: {len(corpus)} Einträge aus {args.corpus}")
+        else:
+            corpus = build_synthetic_corpus(Path(synthetic_dir), args.games)
+            print(f"⏯️  Replay-Benchmark: synthetischer Korpus mit {args.games} Spielen")
+
+        server, server_url = replay.serve_corpus(corpus) if args.server else (None, None)
+        print(f"   Quelle: {server_url or 'Festplatte'}, HTML-Parser: {get_parser_backend()}")
+        try:
+            runs = [run_once(corpus, server_url, args.verbose) for _ in range(args.repeat)]
+        finally:
+            if server:
+                server.shutdown()
+
+    best = min(runs, key=lambda run: run['seconds'])
+    games_per_second = best['games'] / best['seconds'] if best['seconds'] else 0.0
+    print(f"   {best['games']} Spiele in {best['seconds']:.2f} s → {games_per_second:.1f} Spiele/s "
+          f"(bester von {len(runs)} Läufen)")
+    print(f"   {best['served']} Seiten/PDFs ausgeliefert, {best['misses']} nicht im Korpus")
+    print()
+    metrics.print_summary(best['report'], top=len(best['report']['stages']))
+
+if __name__ == '__main__':
+    main()
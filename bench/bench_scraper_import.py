@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Scraper import time
+Imports scraper modules in fresh interpreters and reports the median
+import time and which heavy dependencies got loaded.
+
+Usage:
+    python bench/bench_scraper_import.py [--repeat 5] [--modules scraper utility.parsing utility.scraping]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ['selenium', 'bs4', 'requests', 'pdfplumber']
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import module once in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper import time")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--modules', nargs='+', default=['scraper', 'utility.parsing', 'utility.scraping'])
+    args = parser.parse_args()
+
+    print(f"⏱️  Import-Benchmark ({args.repeat} Läufe, Median)")
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(run['ms'] for run in runs)
+        loaded = ', '.join(runs[-1]['loaded']) or '-'
+        print(f"   {module:20s} {median_ms:7.1f} ms   geladen: {loaded}")
+
+
+if __name__ == '__main__':
+    main()
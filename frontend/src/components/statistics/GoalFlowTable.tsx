@@ -0,0 +1,129 @@
+import { useState, useEffect } from 'react';
+import { dataService } from '../../services/dataService';
+import { GoalFlowStats, LeagueConfig } from '../../types/handball';
+
+interface GoalFlowTableProps {
+  league: LeagueConfig;
+}
+
+const formatMinutes = (seconds: number, games: number): string =>
+  games > 0 ? (seconds / 60 / games).toFixed(1) : '0.0';
+
+export function GoalFlowTable({ league }: GoalFlowTableProps) {
+  const [stats, setStats] = useState<GoalFlowStats | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    const loadData = async () => {
+      try {
+        setLoading(true);
+        setError(null);
+        const flow = await dataService.getGoalFlowStats(league.name);
+        setStats(flow);
+      } catch (err) {
+        setError(err instanceof Error ? err.message : 'Spielverlauf-Statistiken konnten nicht geladen werden');
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    loadData();
+  }, [league]);
+
+  if (loading) {
+    return <div className="text-center text-gray-500 dark:text-gray-400 py-12">Laden...</div>;
+  }
+
+  if (error) {
+    return <div className="text-red-600 dark:text-red-400 py-6">{error}</div>;
+  }
+
+  if (!stats || stats.teams.length === 0) {
+    return <div className="text-gray-500 dark:text-gray-400 py-6">Keine Spiele mit Tor-Timeline gefunden</div>;
+  }
+
+  const teams = [...stats.teams].sort((a, b) => b.lead_share - a.lead_share);
+
+  return (
+    <div className="space-y-6">
+      <div className="bg-white dark:bg-slate-900 rounded-lg shadow-lg overflow-hidden">
+        <div className="overflow-x-auto">
+          <table className="w-full">
+            <thead>
+              <tr className="bg-blue-900 dark:bg-blue-600 text-white">
+                <th className="px-4 py-3 text-left font-bold">Rang</th>
+                <th className="px-4 py-3 text-left font-bold">Team</th>
+                <th className="px-4 py-3 text-center font-bold">Führung (Min/Spiel)</th>
+                <th className="px-4 py-3 text-center font-bold">Rückstand (Min/Spiel)</th>
+                <th className="px-4 py-3 text-center font-bold">Läufe (3+)</th>
+                <th className="px-4 py-3 text-center font-bold">Längster Lauf</th>
+                <th className="px-4 py-3 text-center font-bold">Comebacks</th>
+                <th className="px-4 py-3 text-center font-bold">Führung verspielt</th>
+                <th className="px-4 py-3 text-center font-bold">Spiele</th>
+              </tr>
+            </thead>
+            <tbody>
+              {teams.map((team, idx) => (
+                <tr
+                  key={team.team_name}
+                  className={idx % 2 === 0 ? 'bg-white dark:bg-slate-900' : 'bg-gray-50 dark:bg-slate-800'}
+                >
+                  <td className="px-4 py-3 font-bold text-blue-900 dark:text-blue-400">{idx + 1}</td>
+                  <td className="px-4 py-3 font-semibold text-gray-900 dark:text-gray-100">{team.team_name}</td>
+                  <td className="px-4 py-3 text-center text-gray-900 dark:text-gray-100 font-bold">
+                    {formatMinutes(team.lead_seconds, team.games)}
+                  </td>
+                  <td className="px-4 py-3 text-center text-gray-900 dark:text-gray-100">
+                    {formatMinutes(team.deficit_seconds, team.games)}
+                  </td>
+                  <td className="px-4 py-3 text-center text-gray-900 dark:text-gray-100">{team.scoring_runs}</td>
+                  <td className="px-4 py-3 text-center text-gray-900 dark:text-gray-100">{team.longest_run}</td>
+                  <td className="px-4 py-3 text-center text-green-600 dark:text-green-400 font-bold">
+                    {team.comebacks}
+                    {team.max_deficit_overcome > 0 && (
+                      <span className="text-xs text-gray-500 dark:text-gray-400 font-normal"> (max. −{team.max_deficit_overcome})</span>
+                    )}
+                  </td>
+                  <td className="px-4 py-3 text-center text-red-600 dark:text-red-400">{team.blown_leads}</td>
+                  <td className="px-4 py-3 text-center text-gray-900 dark:text-gray-100">{team.games}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      </div>
+
+      <div className="bg-white dark:bg-slate-900 rounded-lg shadow-lg overflow-hidden">
+        <div className="overflow-x-auto">
+          <table className="w-full text-sm">
+            <thead>
+              <tr className="bg-blue-900 dark:bg-blue-600 text-white">
+                <th className="px-3 py-3 text-left font-bold">Tore je {stats.bucket_minutes} Min</th>
+                {stats.buckets.map(bucket => (
+                  <th key={bucket} className="px-2 py-3 text-center font-bold whitespace-nowrap">{bucket}'</th>
+                ))}
+              </tr>
+            </thead>
+            <tbody>
+              {teams.map((team, idx) => (
+                <tr
+                  key={team.team_name}
+                  className={idx % 2 === 0 ? 'bg-white dark:bg-slate-900' : 'bg-gray-50 dark:bg-slate-800'}
+                >
+                  <td className="px-3 py-2 font-semibold text-gray-900 dark:text-gray-100 whitespace-nowrap">{team.team_name}</td>
+                  {team.goals_for_by_bucket.map((goals, bucketIdx) => (
+                    <td key={bucketIdx} className="px-2 py-2 text-center text-gray-900 dark:text-gray-100 whitespace-nowrap">
+                      {goals}
+                      <span className="text-gray-400 dark:text-gray-500">:{team.goals_against_by_bucket[bucketIdx]}</span>
+                    </td>
+                  ))}
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      </div>
+    </div>
+  );
+}
@@ -9,8 +9,9 @@ import { TeamDefenseTable } from '../components/statistics/TeamDefenseTable';
 import { TeamDisciplineTable } from '../components/statistics/TeamDisciplineTable';
 import { GoalDistributionTable } from '../components/statistics/GoalDistributionTable';
 import { RefereeStatisticsTable } from '../components/statistics/RefereeStatisticsTable';
+import { GoalFlowTable } from '../components/statistics/GoalFlowTable';
 
-type StatisticTab = 'scorers' | 'seven-meter' | 'ratio' | 'offense' | 'defense' | 'discipline' | 'goal-distribution' | 'referees';
+type StatisticTab = 'scorers' | 'seven-meter' | 'ratio' | 'offense' | 'defense' | 'discipline' | 'goal-distribution' | 'goal-flow' | 'referees';
 
 export function StatisticsPage() {
   const { selectedLeague } = useLeague();
@@ -66,6 +67,7 @@ export function StatisticsPage() {
     { id: 'ratio', label: 'Torverhältnis', icon: '⚖️' },
     { id: 'offense', label: 'Bester Angriff', icon: '⚔️' },
     { id: 'goal-distribution', label: 'Verteilung', icon: '🎲' },
+    { id: 'goal-flow', label: 'Spielverlauf', icon: '📈' },
     { id: 'defense', label: 'Beste Verteidigung', icon: '🛡️' },
     { id: 'discipline', label: 'Fair-Play', icon: '📋' },
     { id: 'referees', label: 'Schiedsrichter', icon: '🧑‍⚖️' },
@@ -116,6 +118,7 @@ export function StatisticsPage() {
             {activeTab === 'ratio' && <TeamRatioTable league={selectedLeague} />}
             {activeTab === 'offense' && <TeamOffenseTable league={selectedLeague} />}
             {activeTab === 'goal-distribution' && <GoalDistributionTable league={selectedLeague} />}
+            {activeTab === 'goal-flow' && <GoalFlowTable league={selectedLeague} />}
             {activeTab === 'defense' && <TeamDefenseTable league={selectedLeague} />}
             {activeTab === 'discipline' && <TeamDisciplineTable league={selectedLeague} />}
             {activeTab === 'referees' && <RefereeStatisticsTable league={selectedLeague} />}
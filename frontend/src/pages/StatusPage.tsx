@@ -1,6 +1,7 @@
 import { useEffect, useState } from 'react';
 import { Card } from '../components/ui/card';
 import { dataService } from '../services/dataService';
+import { RunReport } from '../types/handball';
 
 interface MetaData {
   last_updated: string;
@@ -31,6 +32,7 @@ interface ErrorLogData {
 export function StatusPage() {
   const [meta, setMeta] = useState<MetaData | null>(null);
   const [errorLog, setErrorLog] = useState<ErrorLogData | null>(null);
+  const [runReport, setRunReport] = useState<RunReport | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -53,6 +55,13 @@ export function StatusPage() {
           // Error log might not exist yet, which is fine
           console.log('No error log found');
         }
+
+        // Run report of the last scraper run (optional as well)
+        try {
+          setRunReport(await dataService.loadRunReport());
+        } catch (e) {
+          console.log('No run report found');
+        }
       } catch (err) {
         console.error('Error loading meta.json:', err);
         setError(err instanceof Error ? err.message : 'Unknown error');
@@ -104,6 +113,15 @@ export function StatusPage() {
 
   const stats = getTotalStats();
 
+  const formatBytes = (bytes: number) => {
+    if (bytes >= 1024 * 1024) return `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+    return `${(bytes / 1024).toFixed(0)} KB`;
+  };
+
+  const runStages = runReport
+    ? Object.entries(runReport.stages).sort(([, a], [, b]) => b.total_s - a.total_s)
+    : [];
+
   if (loading) {
     return (
       <div className="max-w-6xl mx-auto">
@@ -233,6 +251,58 @@ export function StatusPage() {
         ))}
       </div>
 
+      {/* Last Run Report */}
+      {runReport && (
+        <Card className="p-6 border-l-4 border-l-green-500">
+          <div className="flex justify-between items-start mb-4">
+            <h3 className="text-xl font-bold text-gray-900 dark:text-gray-100">
+              ⏱️ Letzter Scraper-Lauf
+            </h3>
+            <div className="text-right text-xs text-gray-600 dark:text-gray-400">
+              <p>{formatDate(runReport.finished_at)}</p>
+              <p className="font-mono">{Math.round(runReport.wall_seconds)} s</p>
+            </div>
+          </div>
+          <div className="overflow-x-auto">
+            <table className="w-full text-sm">
+              <thead>
+                <tr className="text-left text-gray-600 dark:text-gray-400 border-b border-gray-200 dark:border-slate-700">
+                  <th className="py-2 pr-4">Stufe</th>
+                  <th className="py-2 pr-4 text-right">Anzahl</th>
+                  <th className="py-2 pr-4 text-right">Summe (s)</th>
+                  <th className="py-2 pr-4 text-right">p50 (ms)</th>
+                  <th className="py-2 text-right">p95 (ms)</th>
+                </tr>
+              </thead>
+              <tbody>
+                {runStages.map(([stage, stageStats]) => (
+                  <tr key={stage} className="border-b border-gray-100 dark:border-slate-800 font-mono">
+                    <td className="py-1 pr-4">{stage}</td>
+                    <td className="py-1 pr-4 text-right">{stageStats.count}</td>
+                    <td className="py-1 pr-4 text-right">{stageStats.total_s.toFixed(1)}</td>
+                    <td className="py-1 pr-4 text-right">{stageStats.p50_ms.toFixed(0)}</td>
+                    <td className="py-1 text-right">{stageStats.p95_ms.toFixed(0)}</td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          </div>
+          <div className="mt-4 text-xs text-gray-600 dark:text-gray-400 space-y-1">
+            {Object.keys(runReport.bytes).length > 0 && (
+              <p>
+                📦 Übertragen:{' '}
+                {Object.entries(runReport.bytes).map(([kind, size]) => `${kind} ${formatBytes(size)}`).join(', ')}
+              </p>
+            )}
+            {Object.keys(runReport.counters).length > 0 && (
+              <p>
+                🔢 {Object.entries(runReport.counters).map(([name, value]) => `${name}: ${value}`).join(' | ')}
+              </p>
+            )}
+          </div>
+        </Card>
+      )}
+
       {/* Failed Games Section */}
       {errorLog && errorLog.total_failed > 0 && (
         <Card className="p-6 border-l-4 border-l-orange-500 bg-orange-50 dark:bg-orange-900/10">
@@ -1,4 +1,4 @@
-import { LeagueConfig, GameData, AppConfig } from '../types/handball';
+import { LeagueConfig, GameData, AppConfig, GoalFlowStats, RunReport } from '../types/handball';
 
 // Bestimme den Basis-Pfad abhängig von der Umgebung
 const getBasePath = (): string => {
@@ -355,7 +355,9 @@ class DataService {
    */
   async getPlayerStatistics(outName: string) {
     const gameData = await this.getAggregatedGameData(outName);
-    const playerStats = new Map<string, {
+    // Keyed by player_id (stable per league); older files without it by name and team
+    const playerStats = new Map<string | number, {
+      name: string;
       goals: number;
       sevenMetersGoals: number;
       sevenMetersAttempts: number;
@@ -366,9 +368,10 @@ class DataService {
     gameData.games.forEach(game => {
       // Home team players
       game.home.players.forEach(player => {
-        const key = `${player.name}|${game.home.team_name}`;
+        const key = player.player_id ?? `${player.name}|${game.home.team_name}`;
         if (!playerStats.has(key)) {
           playerStats.set(key, {
+            name: player.name,
             goals: 0,
             sevenMetersGoals: 0,
             sevenMetersAttempts: 0,
@@ -385,9 +388,10 @@ class DataService {
 
       // Away team players
       game.away.players.forEach(player => {
-        const key = `${player.name}|${game.away.team_name}`;
+        const key = player.player_id ?? `${player.name}|${game.away.team_name}`;
         if (!playerStats.has(key)) {
           playerStats.set(key, {
+            name: player.name,
             goals: 0,
             sevenMetersGoals: 0,
             sevenMetersAttempts: 0,
@@ -404,11 +408,10 @@ class DataService {
     });
 
     // Convert to sorted array
-    return Array.from(playerStats.entries())
-      .map(([key, stats]) => {
-        const name = key.split('|')[0];
+    return Array.from(playerStats.values())
+      .map(stats => {
         return {
-          name,
+          name: stats.name,
           team: stats.team,
           goals: stats.goals,
           sevenMetersGoals: stats.sevenMetersGoals,
@@ -865,6 +868,26 @@ class DataService {
 
     return result;
   }
+
+  /**
+   * Get season goal flow statistics (runs, lead time, comebacks, goals per 5 minutes).
+   * Precomputed by generate_flow_stats.py into data/stats/{league}.flow.json.
+   */
+  async getGoalFlowStats(leagueId: string): Promise<GoalFlowStats> {
+    const response = await fetch(`${getBasePath()}/data/stats/${leagueId}.flow.json?t=${Date.now()}`);
+    if (!response.ok) {
+      throw new Error(`No goal flow statistics available for ${leagueId}`);
+    }
+    return response.json();
+  }
+
+  async loadRunReport(): Promise<RunReport | null> {
+    const response = await fetch(`${getBasePath()}/data/run_report.json?t=${Date.now()}`);
+    if (!response.ok) {
+      return null;
+    }
+    return response.json();
+  }
 }
 
 export const dataService = new DataService();
@@ -1,6 +1,7 @@
 // Handball League & Game Data Types
 
 export interface PlayerStats {
+  player_id?: number;
   name: string;
   goals: number;
   two_min_penalties: number;
@@ -22,6 +23,8 @@ export interface GoalEvent {
   scorer: string;
   team: 'home' | 'away';
   seven_meter?: boolean;
+  number?: number;
+  player_id?: number | null;
 }
 
 export interface Game {
@@ -82,3 +85,54 @@ export interface GameTotals {
   red_cards: number;
   blue_cards: number;
 }
+
+// Season goal flow per team (generate_flow_stats.py → data/stats/{league}.flow.json)
+export interface TeamGoalFlow {
+  team_name: string;
+  games: number;
+  goals_for: number;
+  goals_against: number;
+  goals_for_by_bucket: number[];
+  goals_against_by_bucket: number[];
+  scoring_runs: number;
+  longest_run: number;
+  lead_seconds: number;
+  tie_seconds: number;
+  deficit_seconds: number;
+  lead_share: number;
+  comebacks: number;
+  blown_leads: number;
+  max_deficit_overcome: number;
+}
+
+export interface GoalFlowStats {
+  version: number;
+  league: string;
+  games: number;
+  half_duration: number;
+  bucket_minutes: number;
+  buckets: string[];
+  teams: TeamGoalFlow[];
+}
+
+export interface RunStageStats {
+  count: number;
+  total_s: number;
+  p50_ms: number;
+  p95_ms: number;
+  max_ms: number;
+}
+
+export interface RunReportSection {
+  stages: Record<string, RunStageStats>;
+  counters: Record<string, number>;
+  bytes: Record<string, number>;
+}
+
+export interface RunReport extends RunReportSection {
+  version: number;
+  started_at: string;
+  finished_at: string;
+  wall_seconds: number;
+  leagues: Record<string, RunReportSection>;
+}
@@ -4,13 +4,19 @@ Generate Excel report from game-centric handball_games.json
 Shows for each team: HOME and AWAY games with all player statistics
 """
 
+import hashlib
 import json
 import openpyxl
 import sys
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.drawing.image import Image as XLImage
+from openpyxl.utils import get_column_letter
 from collections import OrderedDict
 from pathlib import Path
+from utility.parallel import run_leagues, print_timings
+from utility.profiling import ProfileSession, parse_profile_flag
 
 def load_config(config_file: str = "config.json"):
     """Load config from specified file"""
@@ -68,18 +74,441 @@ def load_games_data(data_folder):
     # Return combined data
     return {'games': all_games}
 
+# Bump when the sheet layout changes so every manifest entry is invalidated
+REPORT_VERSION = 2
+
+# Statistic columns per game (and in the summary block)
+LABELS = ["Tore", "7m Vers.", "7m Tore", "2-Min", "Gelb", "Rot", "Blau"]
+SUMMARY_LABELS = ["Tore\nGesamt", "7m\nVers.", "7m\nTore", "2-Min\nGesamt", "Gelb", "Rot", "Blau"]
+STATS_PER_GAME = len(LABELS)
+
+
+def _fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def build_named_styles():
+    """
+    Create the shared named styles used by all team sheets.
+    
+    Write-only worksheets reference these by name, so every cell shares one
+    style record instead of carrying its own Font/PatternFill/Border objects.
+    """
+    border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+    c_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    l_align = Alignment(horizontal="left", vertical="center", wrap_text=True)
+    
+    h_fill = _fill("4472C4")
+    s_fill = _fill("D9E1F2")
+    total_fill = _fill("FFF2CC")
+    # Alternating row fills for players (lighter colors)
+    row_fills = {'': _fill("FFFFFF"), '_alt': _fill("F0F0F0")}  # White / light gray
+    
+    styles = [
+        NamedStyle(name='report_header', font=Font(color="FFFFFF", bold=True, size=10), fill=h_fill, alignment=c_align, border=border),
+        NamedStyle(name='report_subheader', font=Font(bold=True, size=9), fill=s_fill, alignment=c_align, border=border),
+        NamedStyle(name='report_total_label', font=Font(bold=True, size=10), fill=total_fill, alignment=l_align, border=border),
+        NamedStyle(name='report_total', font=Font(bold=True, size=10), fill=total_fill, alignment=c_align, border=border),
+    ]
+    for suffix, row_fill in row_fills.items():
+        styles.extend([
+            NamedStyle(name=f'report_player{suffix}', font=Font(bold=True), fill=row_fill, alignment=l_align, border=border),
+            NamedStyle(name=f'report_stat{suffix}', font=DEFAULT_FONT, fill=row_fill, alignment=c_align, border=border),
+            NamedStyle(name=f'report_summary{suffix}', font=Font(bold=True), fill=row_fill, alignment=c_align, border=border),
+        ])
+    return styles
+
+
+def collect_team_games(games):
+    """
+    Group games by team (home and away).
+    
+    Returns:
+        Dict team_name -> OrderedDict game_id -> game entry from this team's view
+    """
+    team_games = {}
+    
+    for game in games:
+        home_team = game['home']['team_name']
+        away_team = game['away']['team_name']
+        game_id = game['game_id']
+        order = game.get('order', 0)
+        date = game.get('date', 'Unknown')
+        
+        if not home_team or not away_team:
+            continue
+        
+        # Calculate score from player data
+        home_goals = sum(p['goals'] for p in game['home']['players'])
+        away_goals = sum(p['goals'] for p in game['away']['players'])
+        score = f"{home_goals}:{away_goals}"
+        
+        # Get graphic path if available
+        graphic_path = game.get('graphic_path')
+        
+        # Home game
+        if home_team not in team_games:
+            team_games[home_team] = OrderedDict()
+        team_games[home_team][game_id] = {
+            'order': order,
+            'date': date,
+            'score': score,
+            'opponent': away_team,
+            'is_home': True,
+            'players': game['home']['players'],
+            'graphic_path': graphic_path
+        }
+        
+        # Away game
+        if away_team not in team_games:
+            team_games[away_team] = OrderedDict()
+        team_games[away_team][game_id] = {
+            'order': order,
+            'date': date,
+            'score': score,
+            'opponent': home_team,
+            'is_home': False,
+            'players': game['away']['players'],
+            'graphic_path': graphic_path
+        }
+    
+    return team_games
+
+
+def index_player_stats(sorted_games):
+    """
+    Index player stats per game once, so building the sheet is a dict lookup
+    per (player, game) instead of a scan over the game's roster.
+    
+    Returns:
+        List (one entry per game, in sheet order) of dicts player_name -> stats list
+    """
+    index = []
+    for _, game_data in sorted_games:
+        by_name = {}
+        for player in game_data['players']:
+            # Keep the first entry if a name appears twice in a lineup
+            if player['name'] in by_name:
+                continue
+            by_name[player['name']] = [
+                player['goals'],
+                player.get('seven_meters', 0),
+                player.get('seven_meters_goals', 0),
+                player['two_min_penalties'],
+                player['yellow_cards'],
+                player['red_cards'],
+                player['blue_cards']
+            ]
+        index.append(by_name)
+    return index
+
+
+def format_stats(stats, show_zero_goals):
+    """
+    Format a block of 7 stats for display.
+    
+    - Tore (idx=0): "-" if 0, unless show_zero_goals
+    - 7m Tore (idx=2): "-" only if no 7m Vers. attempt (stats[1] == 0)
+    - 7m Vers., 2-Min, Gelb, Rot, Blau (idx=1,3,4,5,6): "-" if 0
+    """
+    values = []
+    for idx, stat_val in enumerate(stats):
+        if idx == 0:
+            values.append(stat_val if show_zero_goals or stat_val > 0 else "-")
+        elif idx == 2:
+            values.append(stat_val if stats[1] > 0 else "-")
+        else:
+            values.append(stat_val if stat_val > 0 else "-")
+    return values
+
+
+def _styled(ws, value, style):
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def write_team_sheet(wb, team_name, games_dict):
+    """
+    Write one team sheet into a write-only workbook.
+    
+    Layout: row 1 match headers (7 merged columns per game), row 2 stat labels,
+    one row per player, GESAMT row, then the goal graphics below.
+    """
+    sname = team_name.replace('/', '-').replace('?', '').replace('[', '').replace(']', '')[:31]
+    ws = wb.create_sheet(title=sname)
+    
+    # Sort games by order from Spielplan
+    sorted_games = sorted(
+        games_dict.items(),
+        key=lambda x: x[1]['order']
+    )
+    stats_index = index_player_stats(sorted_games)
+    
+    players = sorted({name for by_name in stats_index for name in by_name})
+    
+    print(f"      -> {len(players)} Spieler, {len(games_dict)} Spiele (Heim + Auswärts)")
+    
+    num_games = len(sorted_games)
+    last_game_col = 1 + num_games * STATS_PER_GAME  # Summary columns keep the default width
+    totals_row = len(players) + 3
+    graphic_row = totals_row + 2  # Leave one blank row
+    
+    # Sheet layout must be configured before the first row is streamed
+    ws.column_dimensions['A'].width = 25
+    for c in range(2, last_game_col + 1):
+        ws.column_dimensions[get_column_letter(c)].width = 10
+    ws.row_dimensions[1].height = 80
+    ws.row_dimensions[2].height = 20
+    
+    # Freeze panes: column A and row 2
+    ws.freeze_panes = 'B3'
+    
+    # Row 1: match headers
+    header_row = [_styled(ws, "Match", 'report_header')]
+    for game_idx, (game_id, game_data) in enumerate(sorted_games):
+        date = game_data.get('date', 'Unknown')
+        score = game_data.get('score', 'Unknown')
+        
+        # Show teams in correct order: home vs away
+        # But ONLY show icon for the current team (the one this tab is for)
+        if game_data['is_home']:
+            header = f"{date}\n🏠 {team_name}\nvs\n{game_data['opponent']}\n{score}"
+        else:
+            header = f"{date}\n{game_data['opponent']}\nvs\n🏃 {team_name}\n{score}"
+        
+        col = 2 + game_idx * STATS_PER_GAME
+        ws.merged_cells.add(f"{get_column_letter(col)}1:{get_column_letter(col + STATS_PER_GAME - 1)}1")
+        header_row.append(_styled(ws, header, 'report_header'))
+        header_row.extend(_styled(ws, None, 'report_header') for _ in range(STATS_PER_GAME - 1))
+    
+    # Row 2: stat labels per game plus summary headers
+    label_row = [_styled(ws, "Player", 'report_subheader')]
+    for _ in sorted_games:
+        label_row.extend(_styled(ws, label, 'report_subheader') for label in LABELS)
+    label_row.extend(_styled(ws, label, 'report_subheader') for label in SUMMARY_LABELS)
+    
+    # Graphics under GESAMT row: merge 7 columns per game (1 row) and size the row
+    images = []
+    for game_idx, (game_id, game_data) in enumerate(sorted_games):
+        graphic_path = game_data.get('graphic_path')
+        if not graphic_path or not Path(graphic_path).exists():
+            continue
+        # Excel only embeds raster images (SVG/JSON graphics are for the web)
+        if Path(graphic_path).suffix.lower() != '.png':
+            continue
+        
+        col = 2 + game_idx * STATS_PER_GAME
+        try:
+            # Insert image - full width, height proportional
+            # Grafik: 560px wide, 140px high (4:1 ratio)
+            img = XLImage(graphic_path)
+            img.width = 560   # 7 Spalten × 80 pixels
+            img.height = 140  # Proportional: 560 × (4/16)
+        except Exception as e:
+            print(f"       ⚠️  Grafik-Einbettung fehlgeschlagen: {str(e)[:50]}")
+            continue
+        
+        ws.merged_cells.add(f"{get_column_letter(col)}{graphic_row}:{get_column_letter(col + STATS_PER_GAME - 1)}{graphic_row}")
+        # Excel: 1 point ≈ 1.33 pixels, 140 pixels ≈ 105 points
+        ws.row_dimensions[graphic_row].height = 105
+        images.append((img, f'{get_column_letter(col)}{graphic_row}'))
+    
+    for img, anchor in images:
+        ws.add_image(img, anchor)
+    
+    ws.append(header_row)
+    ws.append(label_row)
+    
+    game_totals = [[0] * STATS_PER_GAME for _ in sorted_games]
+    
+    for player_idx, player_name in enumerate(players):
+        # Alternating row colors
+        suffix = '' if player_idx % 2 == 0 else '_alt'
+        stat_style = f'report_stat{suffix}'
+        
+        row = [_styled(ws, player_name, f'report_player{suffix}')]
+        player_all_stats = [0] * STATS_PER_GAME  # Total stats for this player across all games
+        
+        for game_idx, by_name in enumerate(stats_index):
+            stats = by_name.get(player_name)
+            
+            if stats is None:
+                # Did not participate
+                row.extend(_styled(ws, "-", stat_style) for _ in range(STATS_PER_GAME))
+                continue
+            
+            totals = game_totals[game_idx]
+            for i, val in enumerate(stats):
+                totals[i] += val
+                player_all_stats[i] += val
+            
+            row.extend(_styled(ws, value, stat_style) for value in format_stats(stats, show_zero_goals=True))
+        
+        # Summary columns for this player - Tore always shows a number
+        summary_style = f'report_summary{suffix}'
+        row.extend(_styled(ws, value, summary_style) for value in format_stats(player_all_stats, show_zero_goals=True))
+        ws.append(row)
+    
+    # GESAMT row
+    totals_cells = [_styled(ws, "GESAMT", 'report_total_label')]
+    summary_totals = [0] * STATS_PER_GAME
+    for stats in game_totals:
+        totals_cells.extend(_styled(ws, value, 'report_total') for value in format_stats(stats, show_zero_goals=False))
+        for i, stat_val in enumerate(stats):
+            summary_totals[i] += stat_val
+    totals_cells.extend(_styled(ws, stat_val if stat_val > 0 else "-", 'report_total') for stat_val in summary_totals)
+    ws.append(totals_cells)
+    
+    if images:
+        # Blank spacer row, then the (empty) graphics row carrying the row height
+        ws.append([])
+        ws.append([])
+    
+    return ws
+
+
+def create_workbook(team_games):
+    """Build a write-only workbook with one sheet per team (alphabetical)"""
+    wb = openpyxl.Workbook(write_only=True)
+    for style in build_named_styles():
+        wb.add_named_style(style)
+    
+    # Sort teams alphabetically, but preserve game order from Spielplan
+    for tidx, (team_name, games_dict) in enumerate(sorted(team_games.items()), 1):
+        print(f"   [{tidx}/{len(team_games)}] {team_name}...")
+        write_team_sheet(wb, team_name, games_dict)
+    
+    return wb
+
+
+def team_content_hash(team_name, games_dict):
+    """
+    Hash everything that ends up on a team's sheet.
+    
+    Embedded graphics are covered by path, size and mtime, so a redrawn
+    graphic invalidates the sheet as well.
+    """
+    games = []
+    for game_id, game_data in games_dict.items():
+        graphic = None
+        graphic_path = game_data.get('graphic_path')
+        if graphic_path and Path(graphic_path).exists():
+            stat = Path(graphic_path).stat()
+            graphic = [graphic_path, stat.st_size, stat.st_mtime_ns]
+        games.append([game_id, {**game_data, 'graphic_path': graphic}])
+    
+    payload = json.dumps(
+        {'version': REPORT_VERSION, 'team': team_name, 'games': games},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def load_manifest(manifest_file):
+    """Load per-team content hashes of the last generated report"""
+    if not manifest_file.exists():
+        return {}
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f).get('teams', {})
+    except Exception as e:
+        print(f"   ⚠️  Manifest nicht lesbar ({e}), erstelle Report neu")
+        return {}
+
+
+def save_manifest(manifest_file, team_hashes):
+    """Save per-team content hashes next to the report"""
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': REPORT_VERSION, 'teams': team_hashes}, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def generate_league_report(league_config, force=False):
+    """
+    Generate output/{league}.xlsx for a single league.
+    
+    A manifest (output/{league}.manifest.json) stores a content hash per team
+    sheet. If no team changed since the last run, the existing file is left
+    alone. Otherwise the workbook is written again as a whole: an xlsx is a
+    single archive with a shared string table, so sheets cannot be swapped
+    individually.
+    
+    Args:
+        league_config: League entry from config
+        force: Rebuild even if the manifest says nothing changed
+    
+    Returns:
+        Dict with output_file, sheets_total, sheets_changed, sheets_skipped
+        or None if no data was found
+    """
+    league_name = league_config['name']
+    data_folder = league_config['name']
+    output_file = f"output/{league_name}.xlsx"
+    manifest_file = Path(f"output/{league_name}.manifest.json")
+    
+    print(f"\n📊 Generiere Excel Report für: {league_config['display_name']}")
+    print(f"   Lade Spieldaten...")
+    
+    try:
+        data = load_games_data(data_folder)
+    except FileNotFoundError:
+        print(f"   ⚠️  JSON-Datei nicht gefunden für: {league_config['display_name']}")
+        return None
+    
+    team_games = collect_team_games(data['games'])
+    print(f"   📋 {len(team_games)} Teams gefunden")
+    
+    team_hashes = {team: team_content_hash(team, games_dict) for team, games_dict in team_games.items()}
+    previous_hashes = load_manifest(manifest_file)
+    changed_teams = [team for team, digest in team_hashes.items() if previous_hashes.get(team) != digest]
+    removed_teams = set(previous_hashes) - set(team_hashes)
+    
+    result = {
+        'output_file': output_file,
+        'sheets_total': len(team_games),
+        'sheets_changed': len(changed_teams),
+        'sheets_skipped': 0
+    }
+    
+    if not force and not changed_teams and not removed_teams and Path(output_file).exists():
+        result['sheets_skipped'] = len(team_games)
+        print(f"   ⊘ Unverändert, {len(team_games)} Sheets übersprungen: {output_file}")
+        return result
+    
+    if previous_hashes and not force:
+        print(f"   🔄 {len(changed_teams)} von {len(team_games)} Teams geändert")
+    
+    wb = create_workbook(team_games)
+    wb.save(output_file)
+    save_manifest(manifest_file, team_hashes)
+    print(f"   ✅ Gespeichert: {output_file}")
+    return result
+
+
 def create_report():
     # Parse command line arguments properly
     config_file = "config.json"  # Default
     league_name_arg = None
+    force = False
+    jobs = 1
+    profile_mode = None
     
-    # Manual parsing to handle --config flag
+    # Manual parsing to handle --config, --jobs, --force and --profile flags
     i = 1
     while i < len(sys.argv):
         arg = sys.argv[i]
         if arg == "--config" and i + 1 < len(sys.argv):
             config_file = sys.argv[i + 1]
             i += 2  # Skip both --config and its value
+        elif arg == "--jobs" and i + 1 < len(sys.argv):
+            jobs = int(sys.argv[i + 1])
+            i += 2
+        elif arg == "--force":
+            force = True
+            i += 1
+        elif parse_profile_flag(arg):
+            profile_mode = parse_profile_flag(arg)
+            i += 1
         else:
             league_name_arg = arg
             i += 1
@@ -94,353 +523,41 @@ def create_report():
         # Process all configured leagues
         leagues_to_process = config['leagues']
     
-    # Process each league
-    for league_config in leagues_to_process:
-        league_name = league_config['name']
-        data_folder = league_config['name']
-        output_file = f"output/{league_name}.xlsx"
-        
-        print(f"\n📊 Generiere Excel Report für: {league_config['display_name']}")
-        print(f"   Lade Spieldaten...")
-        
-        try:
-            data = load_games_data(data_folder)
-        except FileNotFoundError:
-            print(f"   ⚠️  JSON-Datei nicht gefunden für: {league_config['display_name']}")
-            continue
-        
-        games = data['games']
-        
-        # Collect all teams and their games (home and away)
-        team_games = {}
-        
-        for game in games:
-            home_team = game['home']['team_name']
-            away_team = game['away']['team_name']
-            game_id = game['game_id']
-            order = game.get('order', 0)
-            date = game.get('date', 'Unknown')
-            
-            if not home_team or not away_team:
-                continue
-            
-            # Calculate score from player data
-            home_goals = sum(p['goals'] for p in game['home']['players'])
-            away_goals = sum(p['goals'] for p in game['away']['players'])
-            score = f"{home_goals}:{away_goals}"
-            
-            # Get graphic path if available
-            graphic_path = game.get('graphic_path')
-            
-            # Home game
-            if home_team not in team_games:
-                team_games[home_team] = OrderedDict()
-            team_games[home_team][game_id] = {
-                'order': order,
-                'date': date,
-                'score': score,
-                'opponent': away_team,
-                'is_home': True,
-                'players': game['home']['players'],
-                'graphic_path': graphic_path
-            }
-            
-            # Away game
-            if away_team not in team_games:
-                team_games[away_team] = OrderedDict()
-            team_games[away_team][game_id] = {
-                'order': order,
-                'date': date,
-                'score': score,
-                'opponent': home_team,
-                'is_home': False,
-                'players': game['away']['players'],
-                'graphic_path': graphic_path
-            }
-        
-        print(f"   📋 {len(team_games)} Teams gefunden")
-        
-        wb = openpyxl.Workbook()
-        wb.remove(wb.active)
-        
-        h_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        h_font = Font(color="FFFFFF", bold=True, size=10)
-        s_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        s_font = Font(bold=True, size=9)
-        p_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        p_fill_alt = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
-        p_font = Font(bold=True)
-        c_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        l_align = Alignment(horizontal="left", vertical="center", wrap_text=True)
-        border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-        total_fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-        total_font = Font(bold=True, size=10)
-        
-        # Alternating row fills for players (lighter colors)
-        row_fill_1 = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")  # White
-        row_fill_2 = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")  # Light gray
-        
-        labels = ["Tore", "7m Vers.", "7m Tore", "2-Min", "Gelb", "Rot", "Blau"]
-        
-        # Sort teams alphabetically, but preserve game order from Spielplan
-        for tidx, (team_name, games_dict) in enumerate(sorted(team_games.items()), 1):
-            print(f"   [{tidx}/{len(team_games)}] {team_name}...")
-            
-            sname = team_name.replace('/', '-').replace('?', '').replace('[', '').replace(']', '')[:31]
-            ws = wb.create_sheet(title=sname)
-            
-            all_players_set = set()
-            for game_data in games_dict.values():
-                for player in game_data['players']:
-                    all_players_set.add(player['name'])
-            
-            players = sorted(list(all_players_set))
-            
-            # Sort games by order from Spielplan
-            sorted_games = sorted(
-                games_dict.items(),
-                key=lambda x: x[1]['order']
-            )
-            
-            print(f"      -> {len(players)} Spieler, {len(games_dict)} Spiele (Heim + Auswärts)")
-            
-            col = 2
-            for game_id, game_data in sorted_games:
-                order = game_data['order']
-                date = game_data.get('date', 'Unknown')
-                score = game_data.get('score', 'Unknown')
-                
-                # Show teams in correct order: home vs away
-                # But ONLY show icon for the current team (the one this tab is for)
-                if game_data['is_home']:
-                    # Home game: our team at home (show icon for our team)
-                    header = f"{date}\n🏠 {team_name}\nvs\n{game_data['opponent']}\n{score}"
-                else:
-                    # Away game: opponent at home, our team away (show icon for our team)
-                    header = f"{date}\n{game_data['opponent']}\nvs\n🏃 {team_name}\n{score}"
-                
-                ws.merge_cells(start_row=1, start_column=col, end_row=1, end_column=col + 6)
-                cell = ws.cell(row=1, column=col)
-                cell.value = header
-                cell.font = h_font
-                cell.fill = h_fill
-                cell.alignment = c_align
-                cell.border = border
-                
-                col += 7
-            
-            col = 2
-            for _ in sorted_games:
-                for label in labels:
-                    cell = ws.cell(row=2, column=col)
-                    cell.value = label
-                    cell.font = s_font
-                    cell.fill = s_fill
-                    cell.alignment = c_align
-                    cell.border = border
-                    col += 1
-            
-            # Add summary headers
-            summary_labels = ["Tore\nGesamt", "7m\nVers.", "7m\nTore", "2-Min\nGesamt", "Gelb", "Rot", "Blau"]
-            for label in summary_labels:
-                cell = ws.cell(row=2, column=col)
-                cell.value = label
-                cell.font = s_font
-                cell.fill = s_fill
-                cell.alignment = c_align
-                cell.border = border
-                col += 1
-            
-            a1 = ws.cell(row=1, column=1)
-            a1.value = "Match"
-            a1.font = h_font
-            a1.fill = h_fill
-            a1.alignment = c_align
-            a1.border = border
-            
-            a2 = ws.cell(row=2, column=1)
-            a2.value = "Player"
-            a2.font = s_font
-            a2.fill = s_fill
-            a2.alignment = c_align
-            a2.border = border
-            
-            game_totals = {}
-            player_game_stats = {}  # Track per-player, per-game stats for summary
-            
-            for prow, player_name in enumerate(players, start=3):
-                # Alternating row colors
-                is_even_row = (prow - 3) % 2 == 0  # 0-indexed row from player start
-                row_fill = row_fill_1 if is_even_row else row_fill_2
-                
-                ca = ws.cell(row=prow, column=1)
-                ca.value = player_name
-                ca.font = p_font
-                ca.fill = row_fill
-                ca.alignment = l_align
-                ca.border = border
-                
-                col = 2
-                game_idx = 0
-                player_all_stats = [0, 0, 0, 0, 0, 0, 0]  # Total stats for this player across all games
-                
-                for game_id, game_data in sorted_games:
-                    if game_idx not in game_totals:
-                        game_totals[game_idx] = [0, 0, 0, 0, 0, 0, 0]
-                    
-                    player_stats = None
-                    for player in game_data['players']:
-                        if player['name'] == player_name:
-                            player_stats = player
-                            break
-                    
-                    if player_stats:
-                        stats = [
-                            player_stats['goals'],
-                            player_stats.get('seven_meters', 0),
-                            player_stats.get('seven_meters_goals', 0),
-                            player_stats['two_min_penalties'],
-                            player_stats['yellow_cards'],
-                            player_stats['red_cards'],
-                            player_stats['blue_cards']
-                        ]
-                        for i, val in enumerate(stats):
-                            game_totals[game_idx][i] += val
-                            player_all_stats[i] += val
-                    else:
-                        stats = [0, 0, 0, 0, 0, 0, 0]
-                    
-                    for idx, stat_val in enumerate(stats):
-                        cell = ws.cell(row=prow, column=col)
-                        # Tore (idx=0): "-" only if not participated (player_stats is None)
-                        if idx == 0:
-                            cell.value = stat_val if player_stats else "-"
-                        # 7m Tore (idx=2): "-" only if no 7m Vers. attempt (stats[1] == 0)
-                        elif idx == 2:
-                            cell.value = stat_val if stats[1] > 0 else "-"
-                        # 7m Vers., 2-Min, Gelb, Rot, Blau (idx=1,3,4,5,6): "-" if 0
-                        elif idx in [1, 3, 4, 5, 6]:
-                            cell.value = stat_val if stat_val > 0 else "-"
-                        else:
-                            cell.value = stat_val
-                        cell.alignment = c_align
-                        cell.border = border
-                        cell.fill = row_fill
-                        col += 1
-                    
-                    game_idx += 1
-                
-                # Add summary columns for this player
-                for idx, stat_val in enumerate(player_all_stats):
-                    cell = ws.cell(row=prow, column=col)
-                    # Tore (idx=0): Always show number (0 instead of "-")
-                    if idx == 0:
-                        cell.value = stat_val
-                    # 7m Tore (idx=2): "-" only if no 7m Vers. attempts (player_all_stats[1] == 0)
-                    elif idx == 2:
-                        cell.value = stat_val if player_all_stats[1] > 0 else "-"
-                    # 7m Vers., 2-Min, Gelb, Rot, Blau (idx=1,3,4,5,6): "-" if 0
-                    elif idx in [1, 3, 4, 5, 6]:
-                        cell.value = stat_val if stat_val > 0 else "-"
-                    else:
-                        cell.value = stat_val
-                    cell.alignment = c_align
-                    cell.border = border
-                    cell.fill = row_fill
-                    cell.font = Font(bold=True)
-                    col += 1
-            
-            totals_row = len(players) + 3
-            
-            ta = ws.cell(row=totals_row, column=1)
-            ta.value = "GESAMT"
-            ta.font = total_font
-            ta.fill = total_fill
-            ta.alignment = l_align
-            ta.border = border
-            
-            col = 2
-            for game_idx in range(len(games_dict)):
-                stats = game_totals[game_idx]
-                for idx, stat_val in enumerate(stats):
-                    cell = ws.cell(row=totals_row, column=col)
-                    # Tore (idx=0): "-" if no goals scored
-                    if idx == 0:
-                        cell.value = stat_val if stat_val > 0 else "-"
-                    # 7m Tore (idx=2): "-" only if no 7m Vers. attempts (stats[1] == 0)
-                    elif idx == 2:
-                        cell.value = stat_val if stats[1] > 0 else "-"
-                    # 7m Vers., 2-Min, Gelb, Rot, Blau (idx=1,3,4,5,6): "-" if 0
-                    elif idx in [1, 3, 4, 5, 6]:
-                        cell.value = stat_val if stat_val > 0 else "-"
-                    else:
-                        cell.value = stat_val
-                    cell.font = total_font
-                    cell.fill = total_fill
-                    cell.alignment = c_align
-                    cell.border = border
-                    col += 1
-            
-            # Add totals for summary columns
-            summary_totals = [0, 0, 0, 0, 0, 0, 0]
-            for game_idx in range(len(games_dict)):
-                stats = game_totals[game_idx]
-                for i, stat_val in enumerate(stats):
-                    summary_totals[i] += stat_val
-            
-            for stat_val in summary_totals:
-                cell = ws.cell(row=totals_row, column=col)
-                cell.value = stat_val if stat_val > 0 else "-"
-                cell.font = total_font
-                cell.fill = total_fill
-                cell.alignment = c_align
-                cell.border = border
-                col += 1
-            
-            # Embed graphics under GESAMT row
-            current_graphic_row = totals_row + 2  # Leave one blank row
-            col = 2
-            for game_id, game_data in sorted_games:
-                graphic_path = game_data.get('graphic_path')
-                
-                if graphic_path and Path(graphic_path).exists():
-                    try:
-                        # Merge cells HORIZONTALLY only (7 columns per game, 1 row)
-                        ws.merge_cells(start_row=current_graphic_row, start_column=col, 
-                                      end_row=current_graphic_row, end_column=col + 6)
-                        
-                        # Set row height to accommodate the image
-                        # Grafik: 560px wide, 140px high (4:1 ratio)
-                        # Excel: 1 point ≈ 1.33 pixels
-                        # 140 pixels ≈ 105 points
-                        ws.row_dimensions[current_graphic_row].height = 105
-                        
-                        # Insert image - full width, height proportional
-                        img = XLImage(graphic_path)
-                        img.width = 560   # 7 Spalten × 80 pixels
-                        img.height = 140  # Proportional: 560 × (4/16)
-                        
-                        ws.add_image(img, f'{openpyxl.utils.get_column_letter(col)}{current_graphic_row}')
-                        
-                    except Exception as e:
-                        print(f"       ⚠️  Grafik-Einbettung fehlgeschlagen: {str(e)[:50]}")
-                
-                col += 7
-            
-            ws.column_dimensions['A'].width = 25
-            for c in range(2, col):
-                ws.column_dimensions[openpyxl.utils.get_column_letter(c)].width = 10
-            
-            ws.row_dimensions[1].height = 80
-            ws.row_dimensions[2].height = 20
-            
-            # Freeze panes: column A and row 2
-            ws.freeze_panes = 'B3'
-        
-        wb.save(output_file)
-        print(f"   ✅ Gespeichert: {output_file}")
+    # The profiler only sees this process: profile each league inline
+    worker = generate_league_report
+    session = None
+    if profile_mode:
+        session = ProfileSession('excel', profile_mode)
+        worker = session.wrap(generate_league_report)
+        if jobs > 1:
+            print("🔬 Profiling: --jobs auf 1 gesetzt")
+        jobs = 1
+    
+    # Process each league (leagues are independent, --jobs N fans them out)
+    outcomes = run_leagues(worker, leagues_to_process, jobs=jobs, force=force)
+    if session:
+        session.finish()
+    
+    sheets_total = 0
+    sheets_skipped = 0
+    for outcome in outcomes:
+        if outcome['result']:
+            sheets_total += outcome['result']['sheets_total']
+            sheets_skipped += outcome['result']['sheets_skipped']
     
-    print(f"\n✅ Alle Excel Reports erstellt")
+    failed = [o for o in outcomes if o['error']]
+    print()
+    print_timings(outcomes)
+    
+    if failed:
+        print(f"\n❌ {len(failed)} von {len(outcomes)} Excel Reports fehlgeschlagen")
+    else:
+        print(f"\n✅ Alle Excel Reports erstellt")
+    if sheets_skipped > 0:
+        print(f"⊘ {sheets_skipped} von {sheets_total} Sheets übersprungen (unverändert)")
+    
+    if failed:
+        sys.exit(1)
 
 if __name__ == '__main__':
     create_report()
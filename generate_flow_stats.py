@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+GENERATE GOAL FLOW STATISTICS
+Season goal flow metrics per team (runs, lead time, comebacks, goals per
+5 minutes) for the statistics page.
+Writes frontend/public/data/stats/{league}.flow.json per league.
+"""
+
+import json
+import sys
+from pathlib import Path
+from goal_visualization import calculate_season_flow
+from utility.parallel import run_leagues, print_timings
+
+
+STATS_DIR = Path('frontend/public/data/stats')
+
+
+def load_config(config_file: str = "config.json") -> dict:
+    """Load configuration from specified file"""
+    config_path = Path(config_file)
+    if not config_path.exists():
+        config_path = Path("config") / config_file
+
+    if not config_path.exists():
+        print(f"❌ Config file not found: {config_path}")
+        sys.exit(1)
+
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
+def load_league_games(data_folder: Path) -> list:
+    """Load the games of all yyyymmdd.json files of a league in date order"""
+    games = []
+    for json_path in sorted(data_folder.glob('*.json')):
+        if not (json_path.stem.isdigit() and len(json_path.stem) == 8):
+            continue
+        with open(json_path, 'r', encoding='utf-8') as f:
+            games.extend(json.load(f).get('games', []))
+    return games
+
+
+def process_league(league: dict) -> dict:
+    """
+    Compute and save the goal flow statistics of one league.
+
+    Args:
+        league: League entry from config
+
+    Returns:
+        Dict with output_file, games and teams, or None without data
+    """
+    league_name = league.get('display_name', league.get('name', 'Unknown'))
+    data_folder_name = league.get('name', 'unknown')
+    half_duration = league.get('half_duration', 30)
+
+    data_folder = Path('frontend/public/data') / data_folder_name
+
+    print(f"📂 {league_name}")
+
+    if not data_folder.exists():
+        print(f"   ⚠️  Daten-Ordner nicht gefunden: {data_folder}\n")
+        return None
+
+    flow = calculate_season_flow(load_league_games(data_folder), half_duration=half_duration)
+    if flow['games'] == 0:
+        print(f"   ⊘ Keine Spiele mit Tor-Timeline\n")
+        return None
+
+    flow['league'] = data_folder_name
+    output_file = STATS_DIR / f"{data_folder_name}.flow.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(flow, f, ensure_ascii=False, indent=2)
+
+    print(f"   ✅ {flow['games']} Spiele, {len(flow['teams'])} Teams: {output_file}\n")
+
+    return {'output_file': str(output_file), 'games': flow['games'], 'teams': len(flow['teams'])}
+
+
+def main():
+    """Compute goal flow statistics for all leagues defined in config"""
+
+    config_file = "config.json"  # Default
+    jobs = 1
+
+    # Manual parsing to handle --config and --jobs flags
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == "--config" and i + 1 < len(sys.argv):
+            config_file = sys.argv[i + 1]
+            i += 2
+        elif arg == "--jobs" and i + 1 < len(sys.argv):
+            jobs = int(sys.argv[i + 1])
+            i += 2
+        else:
+            i += 1
+
+    config = load_config(config_file)
+
+    leagues = config.get('leagues', [])
+    if not leagues:
+        print("❌ Keine Leagues in config definiert")
+        return
+
+    print("\n" + "=" * 70)
+    print(f"📈 GENERIERE SPIELVERLAUF-STATISTIKEN ({len(leagues)} Ligen)")
+    print("=" * 70 + "\n")
+
+    outcomes = run_leagues(process_league, leagues, jobs=jobs)
+    failed = [o for o in outcomes if o['error']]
+    written = [o for o in outcomes if o['result']]
+
+    print("=" * 70)
+    if failed:
+        print(f"❌ SPIELVERLAUF-STATISTIKEN MIT FEHLERN ({len(failed)} Ligen)")
+    else:
+        print(f"✅ SPIELVERLAUF-STATISTIKEN ABGESCHLOSSEN")
+    print("=" * 70)
+    print(f"✓ {len(written)} Ligen geschrieben nach {STATS_DIR}/\n")
+    print_timings(outcomes)
+    print()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
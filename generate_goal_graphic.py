@@ -2,17 +2,65 @@
 """
 GOAL TIMELINE GRAPHIC GENERATOR
 Create visualization graphics for goal progression.
+
+matplotlib is imported lazily: only processes that actually render PNGs
+(the main process with 1 worker, or the pool workers) pay for it. The SVG
+and JSON output formats do not need matplotlib at all.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Circle, Rectangle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
+from xml.sax.saxutils import escape
+import contextlib
+import hashlib
+import io
+import json
 import os
 
 
-def generate_goal_timeline_graphic(game_data: Dict, output_path: str = None, half_duration: int = None) -> str:
+# Bump whenever the rendered output changes, so cached graphics are redrawn
+RENDERER_VERSION = 1
+
+# png: matplotlib raster, svg: hand-written vector, json: graphic data only
+OUTPUT_FORMATS = ('png', 'svg', 'json')
+
+# SVG pixels per data unit (one minute); the PNG is about 80 px per minute
+SVG_SCALE = 40
+
+# One figure per process, reused for every graphic (see _get_figure)
+_figure = None
+_axes = None
+_default_subplot_params = None
+
+
+def graphic_output_path(game_data: Dict, output_format: str = 'png') -> str:
+    """Default output path (output/graphics/) for a game's graphic"""
+    output_dir = Path('output/graphics')
+    
+    # Create filename from teams and date
+    game_date = game_data.get('date', 'Unknown')
+    safe_home = game_data['home']['team_name'].replace('/', '_').replace(' ', '_')[:20]
+    safe_away = game_data['away']['team_name'].replace('/', '_').replace(' ', '_')[:20]
+    safe_date = game_date.replace(', ', '_').replace('.', '').replace(' ', '')
+    filename = f"{safe_home}_vs_{safe_away}_{safe_date}.{output_format}"
+    return str(output_dir / filename)
+
+
+def graphic_cache_key(goals_timeline: List[Dict], half_duration: int) -> str:
+    """
+    Key identifying a rendered graphic: same timeline, half duration and
+    renderer version produce the same image.
+    """
+    payload = json.dumps(
+        {'goals': goals_timeline, 'half_duration': half_duration, 'version': RENDERER_VERSION},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def generate_goal_timeline_graphic(game_data: Dict, output_path: str = None, half_duration: int = None,
+                                   output_format: str = 'png') -> str:
     """
     Generate goal timeline graphic showing both halves.
     
@@ -20,6 +68,7 @@ def generate_goal_timeline_graphic(game_data: Dict, output_path: str = None, hal
         game_data: Dict with game info and goals_timeline
         output_path: Where to save the graphic (default: output/graphics/)
         half_duration: Minutes per half (default: from game_data or 30)
+        output_format: 'png', 'svg' or 'json' (see OUTPUT_FORMATS)
     
     Returns:
         Path to generated graphic
@@ -41,23 +90,42 @@ def generate_goal_timeline_graphic(game_data: Dict, output_path: str = None, hal
     
     # Calculate game flow
     print(f"       📊 Generiere Grafik: {home_team} vs {away_team} ({final_score})")
-    game_flow = calculate_game_flow(game_data['goals_timeline'])
+    game_flow = calculate_game_flow(game_data['goals_timeline'], half_duration=half_duration)
     graphic_data = prepare_graphic_data(game_flow, half_duration=half_duration)
     
-    game_date = game_data.get('date', 'Unknown')
+    # Determine output path
+    if not output_path:
+        output_path = graphic_output_path(game_data, output_format)
+    os.makedirs(Path(output_path).parent, exist_ok=True)
+    
+    if output_format == 'svg':
+        _write_svg(output_path, graphic_data)
+    elif output_format == 'json':
+        _write_graphic_json(output_path, game_data, graphic_data)
+    elif output_format == 'png':
+        _write_png(output_path, graphic_data, home_team, away_team)
+    else:
+        raise ValueError(f"Unbekanntes Grafikformat: {output_format}")
+    
+    # Get file size
+    file_size_kb = Path(output_path).stat().st_size / 1024
+    total_goals = len(game_data['goals_timeline'])
+    
+    print(f"          ✅ Grafik gespeichert: {Path(output_path).name} ({file_size_kb:.1f} KB, {total_goals} Tore)")
     
-    # Create figure - reduced height, no title
-    fig, axes = plt.subplots(2, 1, figsize=(16, 4))
-    # Remove the figure title completely
+    return output_path
+
+
+def _write_png(output_path: str, graphic_data: Dict, home_team: str, away_team: str):
+    """Render graphic_data with matplotlib and save it as PNG"""
+    # Reused figure - reduced height, no title
+    fig, axes = _get_figure()
     
     # Render both halves
     for half_idx, (ax, half_data) in enumerate(zip(axes, graphic_data['halves'])):
-        duration = half_data['duration_minutes']
-        goals_count = len(half_data['home_goals']) + len(half_data['away_goals'])
-        
         _render_half(
             ax, 
-            duration,
+            half_data['duration_minutes'],
             half_data['home_goals'],
             half_data['away_goals'],
             home_team,
@@ -65,32 +133,187 @@ def generate_goal_timeline_graphic(game_data: Dict, output_path: str = None, hal
             half_number=half_idx + 1
         )
     
-    plt.tight_layout()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+
+
+def _write_graphic_json(output_path: str, game_data: Dict, graphic_data: Dict):
+    """
+    Save the prepare_graphic_data() structure, so a client can draw the
+    timeline itself.
+    """
+    payload = {
+        'home': game_data['home']['team_name'],
+        'away': game_data['away']['team_name'],
+        'renderer_version': RENDERER_VERSION,
+        **graphic_data
+    }
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def _num(value: float) -> str:
+    """Short number for SVG attributes (3 decimals, no trailing zeros)"""
+    return f"{value:.3f}".rstrip('0').rstrip('.')
+
+
+def _write_svg(output_path: str, graphic_data: Dict):
+    """
+    Write the timeline as a small SVG without matplotlib.
+    
+    Same layout as the PNG: one band per half, home goals above and away
+    goals below a dashed line, minute labels every 5 minutes. Coordinates
+    are in data units (1 = one minute) and flipped to SVG's y-down.
+    """
+    from goal_visualization import determine_circle_color, prepare_circle_arrays
+    
+    duration = max(half['duration_minutes'] for half in graphic_data['halves'])
+    band = 3.0
+    width = duration + 2
+    height = band * len(graphic_data['halves'])
+    
+    # One CSS class per situation keeps the per-goal elements short
+    styles = []
+    for situation in ('lead', 'tie', 'deficit'):
+        color = determine_circle_color(situation, 'home')
+        styles.append(
+            f".{situation}{{fill:{color['fill']};stroke:{color['edge']};"
+            f"fill-opacity:{color['alpha']};stroke-opacity:{color['alpha']}}}"
+        )
+    
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="-1 0 {_num(width)} {_num(height)}" '
+        f'width="{round(width * SVG_SCALE)}" height="{round(height * SVG_SCALE)}">',
+        '<style>'
+        'circle{stroke-width:.05}'
+        'text{font-family:sans-serif;text-anchor:middle}'
+        '.m{font-size:.3px}'
+        '.n{font-size:.22px;font-weight:bold;fill:#fff;dominant-baseline:central}'
+        + ''.join(styles) +
+        '</style>'
+    ]
     
-    # Determine output path
-    if not output_path:
-        output_dir = Path('output/graphics')
-        output_dir.mkdir(parents=True, exist_ok=True)
+    for half_idx, half_data in enumerate(graphic_data['halves']):
+        half_duration = half_data['duration_minutes']
+        mid = band * half_idx + band / 2
+        start_minute = half_idx * half_duration
         
-        # Create filename from teams and date
-        safe_home = game_data['home']['team_name'].replace('/', '_').replace(' ', '_')[:20]
-        safe_away = game_data['away']['team_name'].replace('/', '_').replace(' ', '_')[:20]
-        safe_date = game_date.replace(', ', '_').replace('.', '').replace(' ', '')
-        filename = f"{safe_home}_vs_{safe_away}_{safe_date}.png"
-        output_path = str(output_dir / filename)
-    
-    # Save figure
-    os.makedirs(Path(output_path).parent, exist_ok=True)
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+        parts.append(
+            f'<line x1="-1" y1="{_num(mid)}" x2="{_num(half_duration + 1)}" y2="{_num(mid)}" '
+            f'stroke="#000" stroke-opacity=".3" stroke-width=".03" stroke-dasharray=".12 .06"/>'
+        )
+        for minute_offset in range(0, half_duration + 1, 5):
+            parts.append(
+                f'<text class="m" x="{minute_offset}" y="{_num(mid + 1.3)}">'
+                f"{start_minute + minute_offset}'</text>"
+            )
+        
+        for team, y in (('home', mid - 0.6), ('away', mid + 0.6)):
+            goals = half_data[f'{team}_goals']
+            if not goals:
+                continue
+            arrays = prepare_circle_arrays(goals, team)
+            labels = dict(arrays['labels'])
+            for idx, goal in enumerate(goals):
+                x = _num(arrays['x'][idx])
+                title = escape(f"{goal['score_home']}:{goal['score_away']} {goal['scorer']}")
+                parts.append(
+                    f'<circle class="{goal["situation"]}" cx="{x}" cy="{_num(y)}" '
+                    f'r="{_num(arrays["radius"][idx])}"><title>{title}</title></circle>'
+                )
+                if idx in labels:
+                    parts.append(f'<text class="n" x="{x}" y="{_num(y)}">{labels[idx]}</text>')
     
-    # Get file size
-    file_size_kb = Path(output_path).stat().st_size / 1024
-    total_goals = len(game_data['goals_timeline'])
+    parts.append('</svg>')
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(parts))
+
+
+def _get_figure():
+    """
+    Return this process' 2-row figure with cleared axes.
     
-    print(f"          ✅ Grafik gespeichert: {Path(output_path).name} ({file_size_kb:.1f} KB, {total_goals} Tore)")
+    Allocating a figure per game dominated render time, so it is created
+    once per process (Agg canvas, no pyplot state) and reset between games.
+    """
+    global _figure, _axes, _default_subplot_params
     
-    return output_path
+    if _figure is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        _figure = Figure(figsize=(16, 4))
+        FigureCanvasAgg(_figure)
+        _axes = _figure.subplots(2, 1)
+        params = _figure.subplotpars
+        _default_subplot_params = {
+            'left': params.left, 'right': params.right, 'bottom': params.bottom,
+            'top': params.top, 'wspace': params.wspace, 'hspace': params.hspace
+        }
+    else:
+        for ax in _axes:
+            ax.clear()
+        # tight_layout() of the previous game moved the axes; start from defaults
+        _figure.subplots_adjust(**_default_subplot_params)
+    
+    return _figure, _axes
+
+
+def _init_render_worker():
+    """Pool initializer: create the figure up front in each worker"""
+    _get_figure()
+
+
+def _render_task(task: Dict) -> Dict:
+    """
+    Render one graphic and never raise, so a pool keeps going.
+    
+    Output of pool workers is captured and returned, the caller prints it in
+    order.
+    """
+    buffer = io.StringIO()
+    result = {'output_path': None, 'error': None, 'output': ''}
+    with contextlib.redirect_stdout(buffer) if task.get('capture') else contextlib.nullcontext():
+        try:
+            result['output_path'] = generate_goal_timeline_graphic(
+                task['game_data'],
+                output_path=task.get('output_path'),
+                half_duration=task.get('half_duration'),
+                output_format=task.get('output_format', 'png')
+            )
+        except Exception as e:
+            result['error'] = str(e)
+    result['output'] = buffer.getvalue()
+    return result
+
+
+def render_goal_graphics(tasks: List[Dict], workers: int = 1) -> List[Dict]:
+    """
+    Render many goal graphics, optionally on a process pool.
+    
+    Args:
+        tasks: Dicts with game_data, output_path, half_duration and
+            (optionally) output_format
+        workers: Number of render processes (1 = render in this process)
+    
+    Returns:
+        One dict per task (same order) with output_path and error
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [_render_task(task) for task in tasks]
+    
+    tasks = [{**task, 'capture': True} for task in tasks]
+    chunksize = max(1, len(tasks) // (workers * 4))
+    
+    # Only PNG rendering needs the matplotlib figure in each worker
+    needs_figure = any(task.get('output_format', 'png') == 'png' for task in tasks)
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker if needs_figure else None) as pool:
+        for result in pool.map(_render_task, tasks, chunksize=chunksize):
+            print(result['output'], end='')
+            results.append(result)
+    return results
 
 
 def _render_half(ax, duration: int, 
@@ -110,8 +333,6 @@ def _render_half(ax, duration: int,
         half_number: 1 for first half, 2 for second half (for minute labels)
     """
     
-    from goal_visualization import determine_circle_color, calculate_circle_size
-    
     # Setup axis
     ax.set_xlim(-1, duration + 1)
     ax.set_ylim(-1.5, 1.5)
@@ -147,50 +368,70 @@ def _render_half(ax, duration: int,
     ax.spines['left'].set_visible(False)
     ax.spines['bottom'].set_visible(False)
     
-    # Draw goals for home team (top)
-    for goal in home_goals:
-        x = goal['time_in_minutes']
-        y = 0.6  # Home team row
-        
-        color_info = determine_circle_color(goal['situation'], 'home')
-        radius = calculate_circle_size(goal['momentum'])
-        
-        circle = Circle(
-            (x, y),
-            radius,
-            color=color_info['fill'],
-            ec=color_info['edge'],
-            linewidth=2,
-            alpha=color_info['alpha'],
-            zorder=3
-        )
-        ax.add_patch(circle)
-        
-        # Add momentum number only for high momentum
-        if goal['momentum'] > 3:
-            ax.text(x, y, str(goal['momentum']), 
-                   ha='center', va='center', fontsize=7, fontweight='bold', color='white')
+    # Draw goals: home team on top row, away team on bottom row
+    _draw_goal_row(ax, home_goals, 0.6, 'home')
+    _draw_goal_row(ax, away_goals, -0.6, 'away')
+
+
+def _draw_goal_row(ax, goals: list, y: float, team: str):
+    """
+    Draw all goal circles of one row as ellipse collections.
     
-    # Draw goals for away team (bottom)
-    for goal in away_goals:
-        x = goal['time_in_minutes']
-        y = -0.6  # Away team row
-        
-        color_info = determine_circle_color(goal['situation'], 'away')
-        radius = calculate_circle_size(goal['momentum'])
-        
-        circle = Circle(
-            (x, y),
-            radius,
-            color=color_info['fill'],
-            ec=color_info['edge'],
-            linewidth=2,
-            alpha=color_info['alpha'],
-            zorder=3
-        )
-        ax.add_patch(circle)
+    EllipseCollection draws the same unit-circle path with one affine per
+    goal as a Circle patch does, so the output stays pixel-identical.
+    Circles are batched between momentum labels, keeping the stacking order
+    of circles and labels the same as drawing each goal on its own.
+    
+    A batch of one is drawn as a Circle patch: matplotlib renders
+    one-element collections as markers snapped to whole pixels.
+    """
+    from matplotlib.collections import EllipseCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.patches import Circle
+    from goal_visualization import prepare_circle_arrays
+    
+    if not goals:
+        return
+    
+    arrays = prepare_circle_arrays(goals, team)
+    facecolors = to_rgba_array(arrays['fill'], alpha=arrays['alpha'])
+    edgecolors = to_rgba_array(arrays['edge'], alpha=arrays['alpha'])
+    diameters = [2 * radius for radius in arrays['radius']]
+    offsets = [(x, y) for x in arrays['x']]
+    
+    # Batch boundaries: a labelled goal closes its batch, its label follows
+    start = 0
+    for end, momentum in arrays['labels'] + [(len(goals) - 1, None)]:
+        if end == start:
+            ax.add_patch(Circle(
+                offsets[start],
+                arrays['radius'][start],
+                facecolor=facecolors[start],
+                edgecolor=edgecolors[start],
+                linewidth=2,
+                zorder=3
+            ))
+            start = end + 1
+        elif end > start:
+            batch = slice(start, end + 1)
+            collection = EllipseCollection(
+                widths=diameters[batch],
+                heights=diameters[batch],
+                angles=0,
+                units='xy',
+                offsets=offsets[batch],
+                offset_transform=ax.transData,
+                facecolors=facecolors[batch],
+                edgecolors=edgecolors[batch],
+                linewidths=2,
+                # Patch defaults, so edges render exactly like Circle patches
+                joinstyle='miter',
+                capstyle='butt',
+                zorder=3
+            )
+            ax.add_collection(collection, autolim=False)
+            start = end + 1
         
-        # Add momentum number only for high momentum
-        if goal['momentum'] > 3:
-            ax.text(x, y, str(goal['momentum']), 
+        if momentum is not None:
+            ax.text(arrays['x'][end], y, str(momentum), 
                    ha='center', va='center', fontsize=7, fontweight='bold', color='white')
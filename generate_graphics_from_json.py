@@ -8,7 +8,9 @@ Uses config.json to determine which JSON files to process.
 import json
 import sys
 from pathlib import Path
-from generate_goal_graphic import generate_goal_timeline_graphic
+from generate_goal_graphic import render_goal_graphics, graphic_output_path, graphic_cache_key, OUTPUT_FORMATS
+from utility.parallel import run_leagues, print_timings
+from utility.profiling import ProfileSession, parse_profile_flag
 
 
 def load_config(config_file: str = "config.json") -> dict:
@@ -25,32 +27,72 @@ def load_config(config_file: str = "config.json") -> dict:
         return json.load(f)
 
 
-def process_json_files(data_folder: Path, league_name: str, half_duration: int):
+def load_graphics_manifest(manifest_file: Path) -> dict:
+    """Load graphic path -> cache key mapping of previous runs"""
+    if not manifest_file.exists():
+        return {}
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f).get('graphics', {})
+    except Exception as e:
+        print(f"   ⚠️  Grafik-Manifest nicht lesbar ({e}), zeichne alle Grafiken neu")
+        return {}
+
+
+def save_graphics_manifest(manifest_file: Path, graphics: dict):
+    """Save graphic path -> cache key mapping"""
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump({'graphics': graphics}, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def process_json_files(data_folder: Path, league_name: str, half_duration: int, render_workers: int = 1,
+                       output_format: str = 'png'):
     """
     Process all spieltag JSON files in a data folder and generate graphics.
     
+    A graphic is only redrawn if its cache key (goals_timeline, half_duration,
+    renderer version) changed or the file is missing. Keys are kept in
+    output/graphics/{league}.manifest.json. A spieltag file is only rewritten
+    if a graphic_path changed.
+    
     Args:
         data_folder: Path to folder with yyyymmdd.json files
         league_name: Name of the league (for display)
         half_duration: Minutes per half from config
+        render_workers: Number of processes rendering graphics (1 = inline)
+        output_format: 'png', 'svg' or 'json' (graphic data only)
+    
+    Returns:
+        (success_count, skip_count, total_size_kb, unchanged_count)
     """
     
     if not data_folder.exists():
         print(f"   ⚠️  Daten-Ordner nicht gefunden: {data_folder}")
-        return 0, 0, 0
+        return 0, 0, 0, 0
     
     # Get all yyyymmdd.json files
     json_files = sorted(list(data_folder.glob('*.json')))
     
     if not json_files:
         print(f"   ⚠️  Keine Spieltag-Dateien gefunden in {data_folder}")
-        return 0, 0, 0
+        return 0, 0, 0, 0
+    
+    manifest_file = Path('output/graphics') / f"{data_folder.name}.manifest.json"
+    previous_keys = load_graphics_manifest(manifest_file)
+    current_keys = {}
     
-    # Generate graphics
     success_count = 0
     skip_count = 0
+    unchanged_count = 0
     total_size_kb = 0
     
+    # Pass 1: find graphics that are missing or outdated
+    day_files = []   # (json_path, data)
+    graphics = []    # (day_file_idx, game, graphic_path, cache_key)
+    tasks = []       # render tasks, index-aligned with pending
+    pending = []     # indices into graphics that need rendering
+    
     for json_path in json_files:
         with open(json_path, 'r') as f:
             data = json.load(f)
@@ -59,36 +101,115 @@ def process_json_files(data_folder: Path, league_name: str, half_duration: int):
         if not games:
             continue
         
-        for idx, game in enumerate(games, 1):
+        day_files.append((json_path, data))
+        
+        for game in games:
             # Skip games without goals
             if not game.get('goals_timeline'):
                 skip_count += 1
                 continue
             
-            # Attempt to generate graphic
             try:
-                graphic_path = generate_goal_timeline_graphic(
-                    game,
-                    half_duration=half_duration
-                )
-                
-                if graphic_path and Path(graphic_path).exists():
-                    success_count += 1
-                    file_size = Path(graphic_path).stat().st_size / 1024
-                    total_size_kb += file_size
-                    
-                    # Update game data with graphic path
-                    game['graphic_path'] = graphic_path
-                
+                graphic_path = graphic_output_path(game, output_format)
+                cache_key = graphic_cache_key(game['goals_timeline'], half_duration)
             except Exception as e:
                 print(f"   ⚠️  Fehler bei {json_path.name}: {e}")
                 skip_count += 1
+                continue
+            
+            graphics.append((len(day_files) - 1, game, graphic_path, cache_key))
+            
+            if previous_keys.get(graphic_path) == cache_key and Path(graphic_path).exists():
+                # Same input, same renderer: keep the existing file
+                unchanged_count += 1
+            else:
+                pending.append(len(graphics) - 1)
+                tasks.append({
+                    'game_data': game,
+                    'output_path': graphic_path,
+                    'half_duration': half_duration,
+                    'output_format': output_format
+                })
+    
+    # Pass 2: render outdated graphics (optionally on a process pool)
+    failed = set()
+    for graphic_idx, result in zip(pending, render_goal_graphics(tasks, workers=render_workers)):
+        rendered_path = result['output_path']
+        if result['error'] or not rendered_path or not Path(rendered_path).exists():
+            day_idx = graphics[graphic_idx][0]
+            reason = result['error'] or "keine Grafik erzeugt"
+            print(f"   ⚠️  Fehler bei {day_files[day_idx][0].name}: {reason}")
+            skip_count += 1
+            failed.add(graphic_idx)
+        else:
+            success_count += 1
+    
+    # Pass 3: update graphic paths, rewrite only changed spieltag files
+    changed_days = set()
+    for graphic_idx, (day_idx, game, graphic_path, cache_key) in enumerate(graphics):
+        if graphic_idx in failed:
+            continue
+        
+        current_keys[graphic_path] = cache_key
+        total_size_kb += Path(graphic_path).stat().st_size / 1024
         
-        # Save updated JSON with graphic paths
+        # Update game data with graphic path
+        if game.get('graphic_path') != graphic_path:
+            game['graphic_path'] = graphic_path
+            changed_days.add(day_idx)
+    
+    # Save updated JSON with graphic paths
+    for day_idx in sorted(changed_days):
+        json_path, data = day_files[day_idx]
         with open(json_path, 'w') as f:
             json.dump(data, f, indent=2)
     
-    return success_count, skip_count, total_size_kb
+    if current_keys != previous_keys:
+        save_graphics_manifest(manifest_file, current_keys)
+    
+    return success_count, skip_count, total_size_kb, unchanged_count
+
+
+def process_league(league: dict, render_workers: int = 1, output_format: str = 'png') -> tuple:
+    """
+    Generate graphics for one league (runs in a worker process with --jobs).
+    
+    Args:
+        league: League entry from config
+        render_workers: Processes rendering this league's graphics
+        output_format: 'png', 'svg' or 'json'
+    
+    Returns:
+        (success_count, skip_count, total_size_kb, unchanged_count)
+    """
+    league_name = league.get('display_name', league.get('name', 'Unknown'))
+    data_folder_name = league.get('name', 'unknown')
+    half_duration = league.get('half_duration', 30)
+    
+    data_folder = Path('frontend/public/data') / data_folder_name
+    
+    print(f"📂 {league_name}")
+    print(f"   🏐 ({half_duration} Min pro Halbzeit)")
+    
+    success_count, skip_count, total_size_kb, unchanged_count = process_json_files(
+        data_folder, 
+        league_name,
+        half_duration,
+        render_workers=render_workers,
+        output_format=output_format
+    )
+    
+    if success_count > 0 or skip_count > 0 or unchanged_count > 0:
+        print(f"   ✅ {success_count} Grafiken generiert")
+        if unchanged_count > 0:
+            print(f"   ♻️  {unchanged_count} Grafiken unverändert")
+        if skip_count > 0:
+            print(f"   ⊘ {skip_count} Spiele übersprungen (keine Tore)")
+        if total_size_kb > 0:
+            print(f"   📁 Größe: {total_size_kb:.1f} KB")
+    print()
+    
+    return success_count, skip_count, total_size_kb, unchanged_count
 
 
 def main():
@@ -99,17 +220,42 @@ def main():
     
     # Parse command line arguments properly
     config_file = "config.json"  # Default
+    jobs = 1
+    render_workers = 1
+    output_format = 'png'
+    league_filter = None
+    profile_mode = None
     
-    # Manual parsing to handle --config flag
+    # Manual parsing to handle --config, --jobs, --render-workers, --format,
+    # --league and --profile flags
     i = 1
     while i < len(sys.argv):
         arg = sys.argv[i]
         if arg == "--config" and i + 1 < len(sys.argv):
             config_file = sys.argv[i + 1]
             i += 2  # Skip both --config and its value
+        elif arg == "--jobs" and i + 1 < len(sys.argv):
+            jobs = int(sys.argv[i + 1])
+            i += 2
+        elif arg == "--render-workers" and i + 1 < len(sys.argv):
+            render_workers = int(sys.argv[i + 1])
+            i += 2
+        elif arg == "--format" and i + 1 < len(sys.argv):
+            output_format = sys.argv[i + 1].lower()
+            i += 2
+        elif arg == "--league" and i + 1 < len(sys.argv):
+            league_filter = sys.argv[i + 1]
+            i += 2
+        elif parse_profile_flag(arg):
+            profile_mode = parse_profile_flag(arg)
+            i += 1
         else:
             i += 1
     
+    if output_format not in OUTPUT_FORMATS:
+        print(f"❌ Unbekanntes Format: {output_format} (erlaubt: {', '.join(OUTPUT_FORMATS)})")
+        sys.exit(1)
+    
     # Load config
     config = load_config(config_file)
     
@@ -118,52 +264,68 @@ def main():
         print("❌ Keine Leagues in config definiert")
         return
     
+    if league_filter:
+        leagues = [league for league in leagues if league.get('name') == league_filter]
+        if not leagues:
+            print(f"❌ Liga nicht gefunden: {league_filter}")
+            sys.exit(1)
+    
+    # The profiler only sees this process: profile each league inline
+    worker = process_league
+    session = None
+    if profile_mode:
+        session = ProfileSession('graphics', profile_mode)
+        worker = session.wrap(process_league)
+        if jobs > 1 or render_workers > 1:
+            print("🔬 Profiling: --jobs und --render-workers auf 1 gesetzt")
+        jobs = render_workers = 1
+    
     print("\n" + "=" * 70)
-    print(f"🎨 GENERIERE GRAFIKEN ({len(leagues)} Ligen)")
+    print(f"🎨 GENERIERE GRAFIKEN ({len(leagues)} Ligen, {output_format.upper()})")
     print("=" * 70 + "\n")
     
+    # Leagues are independent, --jobs N processes them in parallel;
+    # --render-workers N renders the graphics of each league on a pool
+    outcomes = run_leagues(worker, leagues, jobs=jobs, render_workers=render_workers,
+                           output_format=output_format)
+    if session:
+        session.finish()
+    
     total_success = 0
     total_skip = 0
+    total_unchanged = 0
     grand_total_kb = 0
     
-    for league in leagues:
-        league_name = league.get('display_name', league.get('name', 'Unknown'))
-        data_folder_name = league.get('name', 'unknown')
-        half_duration = league.get('half_duration', 30)
-        
-        data_folder = Path('frontend/public/data') / data_folder_name
-        
-        print(f"📂 {league_name}")
-        print(f"   🏐 ({half_duration} Min pro Halbzeit)")
-        
-        success_count, skip_count, total_size_kb = process_json_files(
-            data_folder, 
-            league_name,
-            half_duration
-        )
-        
-        total_success += success_count
-        total_skip += skip_count
-        grand_total_kb += total_size_kb
-        
-        if success_count > 0 or skip_count > 0:
-            print(f"   ✅ {success_count} Grafiken generiert")
-            if skip_count > 0:
-                print(f"   ⊘ {skip_count} Spiele übersprungen (keine Tore)")
-            if total_size_kb > 0:
-                print(f"   📁 Größe: {total_size_kb:.1f} KB")
-        print()
+    for outcome in outcomes:
+        if outcome['result']:
+            success_count, skip_count, total_size_kb, unchanged_count = outcome['result']
+            total_success += success_count
+            total_skip += skip_count
+            total_unchanged += unchanged_count
+            grand_total_kb += total_size_kb
+    
+    failed = [o for o in outcomes if o['error']]
     
     print("=" * 70)
-    print(f"✅ GRAFIK-GENERIERUNG ABGESCHLOSSEN")
+    if failed:
+        print(f"❌ GRAFIK-GENERIERUNG MIT FEHLERN ({len(failed)} Ligen)")
+    else:
+        print(f"✅ GRAFIK-GENERIERUNG ABGESCHLOSSEN")
     print("=" * 70)
     print(f"✓ {total_success} Grafiken gesamt generiert")
+    if total_unchanged > 0:
+        print(f"♻️  {total_unchanged} Grafiken unverändert (nicht neu gezeichnet)")
     if total_skip > 0:
         print(f"⊘ {total_skip} Spiele übersprungen (keine Tore)")
     if grand_total_kb > 0:
         print(f"📁 Gesamtgröße: {grand_total_kb:.1f} KB")
     print(f"📂 Speicherort: frontend/public/graphics/")
-    print(f"📄 JSON-Dateien aktualisiert\n")
+    print(f"📄 JSON-Dateien mit geänderten Grafik-Pfaden aktualisiert\n")
+    print_timings(outcomes)
+    print()
+    
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -6,9 +6,17 @@ Generate graphics showing goal progression during handball matches.
 
 from typing import List, Dict
 from collections import defaultdict
+import math
 
 
-def calculate_game_flow(goals_timeline: List[Dict]) -> Dict:
+# Bump whenever the season flow artifact changes shape or meaning
+FLOW_STATS_VERSION = 1
+
+# Consecutive goals of one team that count as a scoring run
+RUN_MIN_GOALS = 3
+
+
+def calculate_game_flow(goals_timeline: List[Dict], half_duration: int = 30) -> Dict:
     """
     Calculate complete game flow including:
     - Running score for each team
@@ -17,6 +25,7 @@ def calculate_game_flow(goals_timeline: List[Dict]) -> Dict:
     
     Args:
         goals_timeline: List of goals with {minute, second, scorer, team, seven_meter}
+        half_duration: Minutes per half (splits half1_goals / half2_goals)
     
     Returns:
         Dict with enriched goal data including score, momentum, situation
@@ -83,8 +92,8 @@ def calculate_game_flow(goals_timeline: List[Dict]) -> Dict:
         enriched_goals.append(enriched_goal)
     
     # Separate into halves
-    half1_goals = [g for g in enriched_goals if g['minute'] < 30]
-    half2_goals = [g for g in enriched_goals if g['minute'] >= 30]
+    half1_goals = [g for g in enriched_goals if g['minute'] < half_duration]
+    half2_goals = [g for g in enriched_goals if g['minute'] >= half_duration]
     
     return {
         'goals': enriched_goals,
@@ -216,3 +225,238 @@ def calculate_circle_size(momentum: int) -> float:
     base_radius = 0.12
     momentum_factor = 0.04  # Reduced from 0.15 to 0.04
     return base_radius + (momentum * momentum_factor)
+
+
+def prepare_circle_arrays(goals: List[Dict], team: str) -> Dict:
+    """
+    Precompute circle positions, sizes and colors for one row of goals.
+    
+    Lets the renderer draw a whole row as one collection instead of one
+    patch per goal.
+    
+    Args:
+        goals: Goals of one team in one half (from prepare_graphic_data)
+        team: 'home' or 'away'
+    
+    Returns:
+        Dict with parallel lists x, radius, fill, edge, alpha and
+        labels: list of (goal_index, momentum) for high-momentum goals
+    """
+    arrays = {
+        'x': [],
+        'radius': [],
+        'fill': [],
+        'edge': [],
+        'alpha': [],
+        'labels': []
+    }
+    
+    # Only three situations - look each color up once
+    color_cache = {}
+    
+    for idx, goal in enumerate(goals):
+        situation = goal['situation']
+        if situation not in color_cache:
+            color_cache[situation] = determine_circle_color(situation, team)
+        color_info = color_cache[situation]
+        
+        arrays['x'].append(goal['time_in_minutes'])
+        arrays['radius'].append(calculate_circle_size(goal['momentum']))
+        arrays['fill'].append(color_info['fill'])
+        arrays['edge'].append(color_info['edge'])
+        arrays['alpha'].append(color_info['alpha'])
+        
+        # Momentum number only for high momentum
+        if goal['momentum'] > 3:
+            arrays['labels'].append((idx, goal['momentum']))
+    
+    return arrays
+
+
+def build_season_arrays(games: List[Dict], half_duration: int = 30) -> Dict:
+    """
+    Flatten the goals_timeline of all games of a league into parallel arrays.
+    
+    Games without goals_timeline are left out. Goals keep their order
+    within a game; offsets[g]:offsets[g + 1] are the goals of game g.
+    
+    Args:
+        games: Games in the game-centric JSON format
+        half_duration: Minutes per half if a game has no half_duration
+    
+    Returns:
+        Dict with teams (names, index = team id) and numpy arrays
+        home_team, away_team, game_end (seconds) and offsets per game,
+        game, second and is_home per goal
+    """
+    import numpy as np
+    
+    team_index = {}
+    home_team = []
+    away_team = []
+    game_end = []
+    offsets = [0]
+    seconds = []
+    is_home = []
+    
+    for game in games:
+        timeline = game.get('goals_timeline')
+        if not timeline:
+            continue
+        
+        home_team.append(team_index.setdefault(game['home']['team_name'], len(team_index)))
+        away_team.append(team_index.setdefault(game['away']['team_name'], len(team_index)))
+        
+        for goal in timeline:
+            seconds.append(goal['minute'] * 60 + goal['second'])
+            is_home.append(goal['team'] == 'home')
+        
+        # Goals in overtime extend the game
+        regular_end = 2 * game.get('half_duration', half_duration) * 60
+        game_end.append(max(regular_end, seconds[-1]))
+        offsets.append(len(seconds))
+    
+    offsets = np.array(offsets, dtype=np.int64)
+    return {
+        'teams': list(team_index),
+        'home_team': np.array(home_team, dtype=np.int64),
+        'away_team': np.array(away_team, dtype=np.int64),
+        'game_end': np.array(game_end, dtype=np.float64),
+        'offsets': offsets,
+        'game': np.repeat(np.arange(len(home_team)), np.diff(offsets)),
+        'second': np.array(seconds, dtype=np.float64),
+        'is_home': np.array(is_home, dtype=bool)
+    }
+
+
+def calculate_season_flow(games: List[Dict], half_duration: int = 30, bucket_minutes: int = 5) -> Dict:
+    """
+    Season goal flow metrics per team, computed for all games at once.
+    
+    Works on the flat arrays of build_season_arrays() instead of running
+    calculate_game_flow() per game:
+    - goals scored/conceded per bucket_minutes bucket
+    - scoring runs (RUN_MIN_GOALS+ consecutive goals) and longest run
+    - seconds in lead, tied and behind
+    - comebacks (won after trailing), blown leads (lost after leading)
+      and the largest deficit turned into a win
+    
+    Args:
+        games: Games of one league in the game-centric JSON format
+        half_duration: Minutes per half (from league config)
+        bucket_minutes: Width of the goal buckets in minutes
+    
+    Returns:
+        Dict with games, half_duration, buckets (labels) and one entry
+        per team (sorted by name)
+    """
+    import numpy as np
+    
+    arrays = build_season_arrays(games, half_duration)
+    n_teams = len(arrays['teams'])
+    n_games = len(arrays['home_team'])
+    n_buckets = math.ceil(2 * half_duration / bucket_minutes)
+    
+    result = {
+        'version': FLOW_STATS_VERSION,
+        'games': n_games,
+        'half_duration': half_duration,
+        'bucket_minutes': bucket_minutes,
+        'buckets': [
+            f"{i * bucket_minutes}-{min((i + 1) * bucket_minutes, 2 * half_duration)}"
+            for i in range(n_buckets)
+        ],
+        'teams': []
+    }
+    if n_games == 0:
+        return result
+    
+    home_team = arrays['home_team']
+    away_team = arrays['away_team']
+    offsets = arrays['offsets']
+    game = arrays['game']
+    second = arrays['second']
+    is_home = arrays['is_home']
+    starts = offsets[:-1]
+    ends = offsets[1:] - 1
+    
+    # Score difference (home - away) after every goal
+    running = np.cumsum(np.where(is_home, 1, -1))
+    before_game = np.concatenate(([0], running))[starts]
+    diff = running - before_game[game]
+    
+    scorer = np.where(is_home, home_team[game], away_team[game])
+    conceder = np.where(is_home, away_team[game], home_team[game])
+    
+    games_played = np.bincount(home_team, minlength=n_teams) + np.bincount(away_team, minlength=n_teams)
+    goals_for = np.bincount(scorer, minlength=n_teams)
+    goals_against = np.bincount(conceder, minlength=n_teams)
+    
+    # Goals per bucket, overtime goals count into the last bucket
+    bucket = np.minimum(second // (bucket_minutes * 60), n_buckets - 1).astype(np.int64)
+    for_by_bucket = np.zeros((n_teams, n_buckets), dtype=np.int64)
+    against_by_bucket = np.zeros((n_teams, n_buckets), dtype=np.int64)
+    np.add.at(for_by_bucket, (scorer, bucket), 1)
+    np.add.at(against_by_bucket, (conceder, bucket), 1)
+    
+    # Runs: a new run starts with every game and every change of scoring team
+    new_run = np.ones(len(second), dtype=bool)
+    new_run[1:] = is_home[1:] != is_home[:-1]
+    new_run[starts] = True
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.diff(np.append(run_starts, len(second)))
+    run_team = scorer[run_starts]
+    longest_run = np.zeros(n_teams, dtype=np.int64)
+    np.maximum.at(longest_run, run_team, run_lengths)
+    scoring_runs = np.bincount(run_team[run_lengths >= RUN_MIN_GOALS], minlength=n_teams)
+    
+    # Score after a goal holds until the next goal of the game (or its end);
+    # the game is tied until the first goal
+    next_second = np.append(second[1:], 0.0)
+    next_second[ends] = arrays['game_end']
+    held = np.clip(next_second - second, 0, None)
+    home_lead = np.bincount(game, weights=held * (diff > 0), minlength=n_games)
+    away_lead = np.bincount(game, weights=held * (diff < 0), minlength=n_games)
+    tied = np.bincount(game, weights=held * (diff == 0), minlength=n_games) + second[starts]
+    
+    def per_team(home_values, away_values):
+        return (np.bincount(home_team, weights=home_values, minlength=n_teams)
+                + np.bincount(away_team, weights=away_values, minlength=n_teams))
+    
+    lead_seconds = per_team(home_lead, away_lead)
+    deficit_seconds = per_team(away_lead, home_lead)
+    tie_seconds = per_team(tied, tied)
+    
+    # Comebacks from min/max score difference and final result per game
+    min_diff = np.minimum.reduceat(diff, starts)
+    max_diff = np.maximum.reduceat(diff, starts)
+    final_diff = diff[ends]
+    home_comeback = (min_diff < 0) & (final_diff > 0)
+    away_comeback = (max_diff > 0) & (final_diff < 0)
+    comebacks = per_team(home_comeback, away_comeback).astype(np.int64)
+    blown_leads = per_team(away_comeback, home_comeback).astype(np.int64)
+    max_deficit_overcome = np.zeros(n_teams, dtype=np.int64)
+    np.maximum.at(max_deficit_overcome, home_team[home_comeback], -min_diff[home_comeback])
+    np.maximum.at(max_deficit_overcome, away_team[away_comeback], max_diff[away_comeback])
+    
+    for team_id, team_name in sorted(enumerate(arrays['teams']), key=lambda item: item[1]):
+        played_seconds = lead_seconds[team_id] + tie_seconds[team_id] + deficit_seconds[team_id]
+        result['teams'].append({
+            'team_name': team_name,
+            'games': int(games_played[team_id]),
+            'goals_for': int(goals_for[team_id]),
+            'goals_against': int(goals_against[team_id]),
+            'goals_for_by_bucket': for_by_bucket[team_id].tolist(),
+            'goals_against_by_bucket': against_by_bucket[team_id].tolist(),
+            'scoring_runs': int(scoring_runs[team_id]),
+            'longest_run': int(longest_run[team_id]),
+            'lead_seconds': int(round(lead_seconds[team_id])),
+            'tie_seconds': int(round(tie_seconds[team_id])),
+            'deficit_seconds': int(round(deficit_seconds[team_id])),
+            'lead_share': round(lead_seconds[team_id] / played_seconds, 3) if played_seconds else 0.0,
+            'comebacks': int(comebacks[team_id]),
+            'blown_leads': int(blown_leads[team_id]),
+            'max_deficit_overcome': int(max_deficit_overcome[team_id])
+        })
+    
+    return result
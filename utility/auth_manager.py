@@ -0,0 +1,237 @@
+"""
+Login once per cookie lifetime, share the cookies with Chrome and HTTP.
+
+AuthManager keeps the cookie jar of a handball.net login on disk (outside
+frontend/public/data, which is published). As long as the jar is valid, no
+login happens at all; otherwise HandballNetSeleniumAuthenticator logs in
+once and the new jar is saved. The cookies are then
+
+- injected into every Chrome session (wrap the ManagedDriver factory with
+  driver_factory(), so a restarted browser is logged in again), and
+- loaded into one pooled requests.Session (session()), which lets the
+  report hop and PDF downloads of many workers run over plain HTTP. A
+  response that lands on /anmelden anyway (cookies revoked early) triggers
+  one new login, shared by all threads, and the request is repeated.
+
+Credentials come from HANDBALL_NET_USERNAME / HANDBALL_NET_PASSWORD (also
+read from a .env file if python-dotenv is installed) or config['auth'].
+Without credentials from_config() returns None and nothing changes.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+
+from utility import metrics
+from utility.log import get_logger
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+logger = get_logger(__name__)
+
+COOKIE_FILE = Path('~/.cache/handballnet_crawler/cookies.json')
+# Lifetime of a jar whose cookies carry no expiry (browser session cookies)
+SESSION_MAX_AGE_HOURS = 12
+# A jar is renewed this long before its first cookie expires
+EXPIRY_MARGIN_SECONDS = 10 * 60
+POOL_SIZE = 16
+# Cookie fields Selenium's add_cookie() accepts
+SELENIUM_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+
+def jar_expires_at(cookies: List[Dict], logged_in_at: float) -> float:
+    """Time (epoch seconds) until which a cookie jar can be used"""
+    session_end = logged_in_at + SESSION_MAX_AGE_HOURS * 3600
+    expiries = [cookie['expiry'] for cookie in cookies if cookie.get('expiry')]
+    return min(expiries + [session_end]) - EXPIRY_MARGIN_SECONDS
+
+
+def is_login_redirect(url: str) -> bool:
+    """Whether a response ended on the login page (cookies missing or expired)"""
+    return '/anmelden' in url
+
+
+class AuthSession(requests.Session):
+    """requests.Session that logs in again once if a response lands on the login page"""
+
+    def __init__(self, manager: 'AuthManager'):
+        super().__init__()
+        self.manager = manager  # not self.auth, that is requests' auth handler
+
+    def request(self, method, url, *args, **kwargs):
+        generation = self.manager.generation
+        response = super().request(method, url, *args, **kwargs)
+        if is_login_redirect(response.url) and not is_login_redirect(url) and self.manager.renew(generation):
+            response = super().request(method, url, *args, **kwargs)
+        return response
+
+
+class AuthManager:
+    """handball.net login shared by Chrome sessions and a pooled requests.Session"""
+
+    def __init__(self, base_url: str, username: str, password: str, cert_path: Optional[str] = None,
+                 cookie_file: Path = COOKIE_FILE):
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.cert_path = cert_path
+        self.cookie_file = Path(cookie_file).expanduser()
+        self.cookies: List[Dict] = []
+        self.expires_at = 0.0
+        self.generation = 0  # incremented by every login
+        self.login_failed = False  # no further attempts in this run
+        self._session = None
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: dict, cert_path: Optional[str] = None) -> Optional['AuthManager']:
+        """AuthManager for config, None if no credentials are configured"""
+        if load_dotenv is not None:
+            load_dotenv()
+        auth_config = config.get('auth', {})
+        username = os.environ.get('HANDBALL_NET_USERNAME') or auth_config.get('username')
+        password = os.environ.get('HANDBALL_NET_PASSWORD') or auth_config.get('password')
+        if not username or not password:
+            return None
+        return cls(config['ref']['base_url'], username, password, cert_path,
+                   auth_config.get('cookie_file', COOKIE_FILE))
+
+    def _load(self):
+        """Read the saved cookie jar, if any"""
+        if not self.cookie_file.exists():
+            return
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.cookies = data['cookies']
+            self.expires_at = data['expires_at']
+        except Exception as e:
+            logger.warning(f"   ⚠️  Cookie-Datei nicht lesbar ({e}), neue Anmeldung nötig")
+            self.cookies, self.expires_at = [], 0.0
+
+    def _save(self):
+        """Write the cookie jar, readable only by the current user"""
+        self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cookie_file.with_name(self.cookie_file.name + '.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'cookies': self.cookies, 'expires_at': self.expires_at}, f, indent=2)
+        os.replace(tmp_file, self.cookie_file)
+
+    def is_valid(self) -> bool:
+        """Whether the current cookie jar can still be used"""
+        return bool(self.cookies) and time.time() < self.expires_at
+
+    def ensure_login(self) -> bool:
+        """
+        Log in unless the saved cookies are still valid.
+
+        Returns:
+            True if valid cookies are available
+        """
+        with self._lock:
+            if self.is_valid():
+                logger.debug(f"🔑 Anmeldung aus Cookie-Datei (gültig bis {time.strftime('%d.%m. %H:%M', time.localtime(self.expires_at))})")
+                return True
+            return self._login()
+
+    def renew(self, generation: int) -> bool:
+        """
+        Log in again after a request (sent with cookies of generation) was
+        redirected to /anmelden; threads that hit the same expired cookies
+        share one login.
+
+        Returns:
+            True if newer cookies are available, so the request can be repeated
+        """
+        with self._lock:
+            if self.generation != generation:
+                return self.is_valid()
+            if self.login_failed:
+                return False
+            logger.warning("   ⚠️  Cookies abgelaufen, neue Anmeldung")
+            self.cookies, self.expires_at = [], 0.0
+            return self._login()
+
+    def _login(self) -> bool:
+        """Browser login; saves the new cookie jar on success"""
+        from utility.selenium_authenticator import HandballNetSeleniumAuthenticator
+
+        logger.info("🔑 Anmeldung bei handball.net ...")
+        authenticator = HandballNetSeleniumAuthenticator(self.base_url, self.username, self.password, self.cert_path)
+        try:
+            with metrics.timer('auth.login'):
+                logged_in = authenticator.login()
+            if not logged_in:
+                logger.error("   ❌ Anmeldung fehlgeschlagen, weiter ohne Login")
+                self.login_failed = True
+                return False
+            self.cookies = authenticator.get_cookie_jar()
+            self.expires_at = jar_expires_at(self.cookies, time.time())
+            self.generation += 1
+            self._save()
+            metrics.count('auth.login')
+            if self._session is not None:
+                self._load_into_session(self._session)
+            logger.info(f"   ✅ Angemeldet, Cookies gültig bis {time.strftime('%d.%m. %H:%M', time.localtime(self.expires_at))}")
+            return True
+        finally:
+            if authenticator.driver:
+                authenticator.driver.quit()
+
+    def apply_to_driver(self, driver):
+        """Add the cookies to a Chrome session (opens the site once to set its domain)"""
+        if not self.cookies:
+            return driver
+        driver.get(self.base_url)
+        for cookie in self.cookies:
+            try:
+                driver.add_cookie({key: cookie[key] for key in SELENIUM_COOKIE_FIELDS if key in cookie})
+            except Exception as e:
+                logger.debug(f"   Cookie {cookie.get('name')} nicht übernommen: {str(e)[:60]}")
+        return driver
+
+    def driver_factory(self, factory: Callable) -> Callable:
+        """Wrap a driver factory (see utility.browser.ManagedDriver) so every new browser is logged in"""
+        return lambda: self.apply_to_driver(factory())
+
+    def _load_into_session(self, session):
+        """Replace the cookies of a requests.Session with the jar"""
+        session.cookies.clear()
+        for cookie in self.cookies:
+            session.cookies.set_cookie(create_cookie(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                secure=cookie.get('secure', False), expires=cookie.get('expiry')
+            ))
+
+    def session(self) -> AuthSession:
+        """
+        Logged-in requests.Session with a connection pool for POOL_SIZE
+        threads; the same session is returned on every call.
+        """
+        with self._lock:
+            if self._session is None:
+                from utility.precheck import USER_AGENT
+
+                session = AuthSession(self)
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers['User-Agent'] = USER_AGENT
+                if self.cert_path:
+                    session.verify = self.cert_path
+                self._load_into_session(session)
+                self._session = session
+            return self._session
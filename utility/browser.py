@@ -0,0 +1,265 @@
+"""
+Chrome WebDriver setup for the scraper.
+
+selenium is imported inside setup_driver(), so only code paths that really
+start a browser pay for it.
+
+ManagedDriver wraps the driver for long runs: it restarts Chrome after a
+number of pages or once its memory grows too large, and replaces a crashed
+session transparently, reloading the page the scraper was on.
+"""
+
+import os
+from typing import Callable, Optional
+
+from utility import metrics
+from utility.log import get_logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = get_logger(__name__)
+
+# Defaults for config['crawler']['browser_max_pages'] / ['browser_max_rss_mb']
+MAX_PAGES = 250
+MAX_RSS_MB = 1500
+RSS_CHECK_EVERY = 10  # pages between memory checks
+
+# WebDriverException texts of a browser or chromedriver that is gone
+DEAD_SESSION_MESSAGES = (
+    'invalid session id',
+    'no such session',
+    'session deleted',
+    'chrome not reachable',
+    'disconnected',
+    'target window already closed',
+    'no such window',
+    'tab crashed',
+    'connection refused',
+    'max retries exceeded'
+)
+
+
+def setup_driver(cert_path: Optional[str] = None):
+    """
+    Setup Chrome driver with SSL certificate support
+
+    Args:
+        cert_path: Resolved CA bundle; exported as REQUESTS_CA_BUNDLE /
+            CURL_CA_BUNDLE once the driver is up
+
+    Returns:
+        Selenium Chrome WebDriver
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+
+    # Use certificate if available
+    if cert_path:
+        options.add_argument(f'--ssl-version=TLSv1.2')
+        logger.info(f"[SSL] Using certificate: {cert_path}")
+
+    # Strategy 1: Try system Chrome first (most reliable on macOS)
+    try:
+        logger.debug("[Chrome] Trying system Chrome first...")
+        chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+        if os.path.exists(chrome_path):
+            options.binary_location = chrome_path
+            driver = webdriver.Chrome(options=options)
+            # Set timeouts
+            driver.set_page_load_timeout(30)  # Page load timeout: 30 seconds
+            driver.implicitly_wait(10)  # Implicit wait: 10 seconds
+            logger.info(f"✓ Using system Chrome: {chrome_path}")
+
+            # Apply SSL certificate for system Chrome
+            if cert_path:
+                os.environ['REQUESTS_CA_BUNDLE'] = cert_path
+                os.environ['CURL_CA_BUNDLE'] = cert_path
+
+            return driver
+    except Exception as e:
+        logger.warning(f"[Chrome] System Chrome failed: {str(e)[:100]}")
+        logger.info("[Chrome] Falling back to Selenium's built-in manager...")
+
+    # Strategy 2: Use Selenium's built-in selenium-manager
+    # This automatically handles ChromeDriver download on all platforms (Linux, macOS, Windows)
+    try:
+        logger.debug("[Chrome] Initializing ChromeDriver via Selenium's built-in manager...")
+        driver = webdriver.Chrome(options=options)
+        # Set timeouts
+        driver.set_page_load_timeout(30)  # Page load timeout: 30 seconds
+        driver.implicitly_wait(10)  # Implicit wait: 10 seconds
+        logger.info(f"✓ ChromeDriver initialized successfully")
+
+        # Apply SSL certificate for subsequent requests
+        if cert_path:
+            os.environ['REQUESTS_CA_BUNDLE'] = cert_path
+            os.environ['CURL_CA_BUNDLE'] = cert_path
+
+        return driver
+    except Exception as e:
+        error_msg = str(e)[:100]
+        logger.error(f"\n[ERROR] Chrome initialization failed: {error_msg}")
+        raise
+
+
+def _process_tree_rss(pid: int) -> Optional[int]:
+    """Resident memory in bytes of pid and all its descendants (None if unknown)"""
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+
+    # Linux without psutil: walk /proc for the process tree
+    if not os.path.isdir('/proc'):
+        return None
+    children = {}
+    rss_pages = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+        rss_pages[int(entry)] = int(fields[21])
+    if pid not in rss_pages:
+        return None
+    total, todo = 0, [pid]
+    while todo:
+        current = todo.pop()
+        total += rss_pages.get(current, 0)
+        todo.extend(children.get(current, []))
+    return total * os.sysconf('SC_PAGE_SIZE')
+
+
+def is_dead_session(error: Exception) -> bool:
+    """True if error means the browser session is gone (not just a slow page)"""
+    try:
+        from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+        if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+            return True
+    except ImportError:
+        pass
+    if isinstance(error, OSError):
+        # chromedriver no longer answers
+        return True
+    message = str(error).lower()
+    return any(text in message for text in DEAD_SESSION_MESSAGES)
+
+
+class ManagedDriver:
+    """
+    Driver proxy that recycles and revives the browser.
+
+    Chrome is restarted (between two page loads) after max_pages pages or
+    when the browser's process tree uses more than max_rss_mb. If a call
+    fails because the session died, a new browser is started, the last URL
+    is loaded again and the call is repeated once, so the current game
+    continues instead of failing. Restarts are counted as
+    browser.restart.<reason> in utility.metrics.
+    """
+
+    def __init__(self, factory: Callable[[], object], max_pages: int = MAX_PAGES,
+                 max_rss_mb: Optional[float] = MAX_RSS_MB):
+        self._factory = factory
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.restarts = {}
+        self.pages = 0
+        self._url = None
+        self._driver = None
+        self._start()
+
+    def _start(self):
+        with metrics.timer('browser.start'):
+            self._driver = self._factory()
+        self.pages = 0
+
+    def _quit_current(self):
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+
+    def restart(self, reason: str):
+        """Replace the browser with a fresh one, counted under reason"""
+        self.restarts[reason] = self.restarts.get(reason, 0) + 1
+        metrics.count(f'browser.restart.{reason}')
+        logger.warning(f"🔄 Browser-Neustart ({reason}) nach {self.pages} Seiten")
+        self._quit_current()
+        self._start()
+
+    def rss_mb(self) -> Optional[float]:
+        """Memory of chromedriver plus browser processes in MB (None if unknown)"""
+        try:
+            pid = self._driver.service.process.pid
+        except AttributeError:
+            return None
+        rss = _process_tree_rss(pid)
+        return rss / 1024 / 1024 if rss is not None else None
+
+    def _recycle_if_due(self):
+        if self.max_pages and self.pages >= self.max_pages:
+            self.restart('pages')
+        elif self.max_rss_mb and self.pages and self.pages % RSS_CHECK_EVERY == 0:
+            rss = self.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                logger.info(f"   Browser belegt {rss:.0f} MB (Grenze {self.max_rss_mb:.0f} MB)")
+                self.restart('memory')
+
+    def _call(self, action: Callable, reload: bool = True):
+        """Run action(driver); on a dead session restart, reload the last URL and retry once"""
+        try:
+            return action(self._driver)
+        except Exception as e:
+            if not is_dead_session(e):
+                raise
+            logger.warning(f"   ⚠️  Browser-Sitzung verloren: {str(e).splitlines()[0][:80]}")
+            self.restart('crash')
+            if reload and self._url:
+                self._driver.get(self._url)
+                self.pages += 1
+            return action(self._driver)
+
+    def get(self, url: str):
+        self._recycle_if_due()
+        self._url = url
+        self._call(lambda driver: driver.get(url), reload=False)
+        self.pages += 1
+
+    @property
+    def page_source(self) -> str:
+        return self._call(lambda driver: driver.page_source)
+
+    @property
+    def current_url(self) -> str:
+        return self._call(lambda driver: driver.current_url)
+
+    def quit(self):
+        self._quit_current()
+        if self.restarts:
+            restarts = ', '.join(f"{reason}: {n}" for reason, n in sorted(self.restarts.items()))
+            logger.info(f"🔄 Browser-Neustarts: {restarts}")
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
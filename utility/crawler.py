@@ -1,26 +1,63 @@
-"""Main crawler module for extracting player data from handball.net"""
+"""
+Main crawler module for extracting player data from handball.net
+
+Team and game pages are fetched by a thread pool; all threads share one
+RateLimiter, so `delay` still bounds the request rate against handball.net
+as a whole. The iter_* methods yield players as soon as their page is
+parsed, the extract_* methods collect them in input order.
+"""
 
 import requests
+import threading
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import time
 
+from utility.parsing import extract_players_from_aufstellung
+
+
+class RateLimiter:
+    """Spaces request starts at least `interval` seconds apart, across threads"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the next request may start"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class HandballNetCrawler:
     """Crawls handball.net for player and team data"""
     
-    def __init__(self, session: requests.Session, base_url: str, delay: float = 1, cert_path: Optional[str] = None, verify_ssl: bool = True, date_from: Optional[str] = None, date_to: Optional[str] = None):
+    def __init__(self, session: requests.Session, base_url: str, delay: float = 1, cert_path: Optional[str] = None, verify_ssl: bool = True, date_from: Optional[str] = None, date_to: Optional[str] = None, workers: int = 4):
         self.session = session
         self.base_url = base_url
         self.delay = delay
+        self.workers = workers
+        self.rate_limiter = RateLimiter(delay)
         self.players_data = []
         self.teams_data = []
         self.verify_ssl = verify_ssl
         self.cert_path = self._resolve_cert_path(cert_path) if cert_path else None
         self.date_from = date_from
         self.date_to = date_to
+        
+        # One pooled connection per worker, otherwise urllib3 discards connections
+        if workers > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
     
     def _resolve_cert_path(self, cert_path: str) -> Optional[str]:
         """Resolve certificate path, expanding ~ to home directory"""
@@ -40,25 +77,61 @@ class HandballNetCrawler:
             f"tabelle"  # Use table view to get all teams
         )
     
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_html(self, url: str) -> Optional[str]:
         """
-        Fetch and parse a page
+        Fetch a page under the shared rate limit
         
         Args:
             url: URL to fetch
             
         Returns:
-            BeautifulSoup object or None if failed
+            Page HTML or None if failed
         """
+        self.rate_limiter.wait()
         try:
             verify = self.cert_path if self.cert_path else self.verify_ssl
             response = self.session.get(url, timeout=30, verify=verify)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return response.text
         except requests.exceptions.RequestException as e:
             print(f"✗ Error fetching {url}: {e}")
             return None
     
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a page
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        html = self.fetch_html(url)
+        return BeautifulSoup(html, 'html.parser') if html is not None else None
+    
+    def _map_pages(self, items: List[Any], work: Callable[[Any], Any]) -> Iterator[Tuple[int, Any, Any]]:
+        """
+        Run work(item) for all items on the thread pool
+        
+        Yields:
+            (index, item, result) in completion order; result is the raised
+            exception if work failed
+        """
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            futures = {pool.submit(work, item): (index, item) for index, item in enumerate(items)}
+            try:
+                for future in as_completed(futures):
+                    index, item = futures[future]
+                    try:
+                        yield index, item, future.result()
+                    except Exception as e:
+                        yield index, item, e
+            finally:
+                # Consumer stopped early: drop pages not started yet
+                for future in futures:
+                    future.cancel()
+    
     def get_teams(self, league_id: str, date_from: str, date_to: str) -> List[Dict[str, Any]]:
         """
         Extract all teams from a league
@@ -109,7 +182,6 @@ class HandballNetCrawler:
                         })
                         print(f"  ✓ {position}. {team_name}")
         
-        time.sleep(self.delay)
         return teams
     
     def get_players_for_team(self, team_url: str) -> List[Dict[str, Any]]:
@@ -131,9 +203,39 @@ class HandballNetCrawler:
         # Parse player information from page
         # TODO: Implement based on actual HTML structure
         
-        time.sleep(self.delay)
         return players
     
+    def _team_pages(self, league_id: str, date_from: str, date_to: str) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """(team index, players) of every team page, in completion order"""
+        print(f"Extracting teams from league: {league_id}")
+        teams = self.get_teams(league_id, date_from, date_to)
+        self.teams_data = teams
+        
+        print(f"Found {len(teams)} teams")
+        
+        teams_with_url = [team for team in teams if team.get('url')]
+        for done, (index, team, players) in enumerate(self._map_pages(teams_with_url, lambda team: self.get_players_for_team(team['url'])), 1):
+            if isinstance(players, Exception):
+                print(f"  ⚠ Error processing team {team.get('name', 'Unknown')}: {players}")
+                continue
+            print(f"Processed team {done}/{len(teams_with_url)}: {team.get('name', 'Unknown')}")
+            for player in players:
+                player['team'] = team.get('name')
+                player['team_id'] = team.get('id')
+            yield index, players
+    
+    def iter_players(self, league_id: str, date_from: str, date_to: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the players of all teams in a league as their pages complete
+        
+        Args:
+            league_id: League identifier
+            date_from: Start date
+            date_to: End date
+        """
+        for _, players in self._team_pages(league_id, date_from, date_to):
+            yield from players
+    
     def extract_all_players(self, league_id: str, date_from: str, date_to: str) -> List[Dict[str, Any]]:
         """
         Extract all players from all teams in a league
@@ -144,24 +246,10 @@ class HandballNetCrawler:
             date_to: End date
             
         Returns:
-            List of all players with their data
+            List of all players with their data, in table order
         """
-        print(f"Extracting teams from league: {league_id}")
-        teams = self.get_teams(league_id, date_from, date_to)
-        
-        print(f"Found {len(teams)} teams")
-        
-        all_players = []
-        for i, team in enumerate(teams, 1):
-            print(f"Processing team {i}/{len(teams)}: {team.get('name', 'Unknown')}")
-            
-            team_url = team.get('url')
-            if team_url:
-                players = self.get_players_for_team(team_url)
-                for player in players:
-                    player['team'] = team.get('name')
-                    player['team_id'] = team.get('id')
-                all_players.extend(players)
+        players_by_team = dict(self._team_pages(league_id, date_from, date_to))
+        all_players = [player for index in sorted(players_by_team) for player in players_by_team[index]]
         
         self.players_data = all_players
         return all_players
@@ -178,6 +266,7 @@ class HandballNetCrawler:
     def get_games_from_spielplan(self, league_id: str) -> List[Dict[str, str]]:
         """Extract all game IDs from the Spielplan"""
         games = []
+        seen = set()
         spielplan_url = f"{self.base_url}/ligen/handball4all.{league_id}/spielplan"
         
         print(f"Fetching Spielplan from: {spielplan_url}")
@@ -196,12 +285,46 @@ class HandballNetCrawler:
                 parts = href.split('/')
                 if len(parts) >= 3:
                     game_id = parts[2]
-                    if game_id not in [g['id'] for g in games]:
+                    if game_id not in seen:
+                        seen.add(game_id)
                         games.append({'id': game_id, 'url': f"{self.base_url}{href}"})
         
         print(f"Found {len(games)} unique games")
         return games
     
+    def _aufstellung_pages(self, league_id: str, max_games: Optional[int]) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+        """(game index, players) of every Aufstellung page, in completion order"""
+        print(f"Extracting players from AUFSTELLUNG pages for league: {league_id}")
+        
+        games = self.get_games_from_spielplan(league_id)
+        
+        if max_games:
+            games = games[:max_games]
+        
+        for done, (index, game, players_from_game) in enumerate(self._map_pages(games, lambda game: self._parse_aufstellung_page(game['url'], game['id'])), 1):
+            if isinstance(players_from_game, Exception):
+                print(f"  ⚠ Error processing game {game['id']}: {players_from_game}")
+                continue
+            print(f"[{done}/{len(games)}] ✓ {game['id']}: {len(players_from_game)} players")
+            yield index, players_from_game
+    
+    def iter_aufstellung_players(self, league_id: str, max_games: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """
+        Yield players from Aufstellung (lineup) pages as the pages complete,
+        each (name, team) only once
+        
+        Args:
+            league_id: League identifier
+            max_games: Maximum number of games to process (None = all)
+        """
+        seen = set()
+        for _, players_from_game in self._aufstellung_pages(league_id, max_games):
+            for player in players_from_game:
+                key = (player.get('name', ''), player.get('team', ''))
+                if key[0] and key[1] and key not in seen:
+                    seen.add(key)
+                    yield player
+    
     def extract_from_aufstellung_pages(self, league_id: str, max_games: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Extract players from Aufstellung (lineup) pages of games
@@ -213,53 +336,30 @@ class HandballNetCrawler:
         Returns:
             List of all players with their data
         """
-        print(f"Extracting players from AUFSTELLUNG pages for league: {league_id}")
+        players_by_game = dict(self._aufstellung_pages(league_id, max_games))
         
-        games = self.get_games_from_spielplan(league_id)
-        
-        if max_games:
-            games = games[:max_games]
-        
-        all_players = {}  # Deduplicate by (name, team_name)
-        
-        for i, game in enumerate(games, 1):
-            game_id = game['id']
-            aufstellung_url = game['url']
-            
-            print(f"[{i}/{len(games)}] Processing game {game_id}...")
-            
-            try:
-                players_from_game = self._parse_aufstellung_page(aufstellung_url)
-                
-                for player in players_from_game:
-                    # Create deduplication key
-                    key = (player.get('name', ''), player.get('team', ''))
-                    if key[0] and key[1]:
-                        all_players[key] = player
-                
-                print(f"  ✓ Extracted {len(players_from_game)} players")
-                
-                # Respect rate limiting
-                time.sleep(self.delay)
-                
-            except Exception as e:
-                print(f"  ⚠ Error processing game {game_id}: {e}")
-                continue
+        all_players = {}  # Deduplicate by (name, team_name), later games win
+        for index in sorted(players_by_game):
+            for player in players_by_game[index]:
+                key = (player.get('name', ''), player.get('team', ''))
+                if key[0] and key[1]:
+                    all_players[key] = player
         
         result = list(all_players.values())
         self.players_data = result
         print(f"\n✓ Total unique players: {len(result)}")
         return result
     
-    def _parse_aufstellung_page(self, aufstellung_url: str) -> List[Dict[str, str]]:
+    def _parse_aufstellung_page(self, aufstellung_url: str, game_id: Optional[str] = None) -> List[Dict[str, str]]:
         """
         Parse player data from an Aufstellung page
         
-        Strategy: Since we're not certain of the exact HTML structure, we'll use text analysis
-        to find player information in the page
+        Uses the same extraction as the scraper (embedded page state, else
+        the lineup tables), see utility.parsing.extract_players_from_aufstellung
         
         Args:
             aufstellung_url: URL to the aufstellung page
+            game_id: Game of the page (needed for the embedded page state)
             
         Returns:
             List of player dictionaries with name and team
@@ -267,31 +367,13 @@ class HandballNetCrawler:
         players = []
         
         try:
-            soup = self.fetch_page(aufstellung_url)
-            if not soup:
+            html = self.fetch_html(aufstellung_url)
+            if not html:
                 return players
             
-            # Get the text content
-            text = soup.get_text()
-            
-            # For now, placeholder implementation
-            # The actual parsing depends on discovering the HTML structure
-            # We'll collect placeholder data showing what would be extracted
-            
-            # Extract game info from URL to determine which teams are playing
-            # Format: /spiele/{league}.{game_id}/aufstellung
-            parts = aufstellung_url.split('/')
-            if len(parts) >= 4:
-                game_id = parts[-2]
-                
-                # Look for team names in the page
-                # This is a basic implementation - we'd need actual HTML inspection
-                # to properly extract player lists
-                
-                # For testing, we could extract any text that looks like a player
-                # (typically in format "Name Number" or similar)
-                
-                pass
+            for team_name, team_players in extract_players_from_aufstellung(html, game_id).items():
+                for player in team_players:
+                    players.append({**player, 'team': team_name})
             
             return players
             
@@ -5,6 +5,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from utility.log import get_logger
+
+logger = get_logger(__name__)
+
 
 class ErrorLogger:
     """Manages failed game attempts for retry in future runs"""
@@ -21,9 +25,9 @@ class ErrorLogger:
                 with open(self.error_log_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.failed_games = data.get('failed_games', [])
-                    print(f"📋 Loaded {len(self.failed_games)} previously failed games for retry")
+                    logger.info(f"📋 Loaded {len(self.failed_games)} previously failed games for retry")
             except Exception as e:
-                print(f"⚠️  Could not load error log: {e}")
+                logger.warning(f"⚠️  Could not load error log: {e}")
                 self.failed_games = []
         else:
             self.failed_games = []
@@ -70,9 +74,9 @@ class ErrorLogger:
             }
             with open(self.error_log_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"💾 Error log saved: {len(self.failed_games)} failed games")
+            logger.info(f"💾 Error log saved: {len(self.failed_games)} failed games")
         except Exception as e:
-            print(f"❌ Could not save error log: {e}")
+            logger.error(f"❌ Could not save error log: {e}")
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of failed games by liga"""
@@ -0,0 +1,164 @@
+"""
+Append-only per-league journal of scraped games.
+
+scrape_daily() appends every finished game to
+frontend/public/data/<liga>/journal.ndjson (one {"day": yyyymmdd, "game":
+{...}} object per line, flushed and fsynced) instead of holding the whole
+day in memory. At the end of a day compact() merges the journaled games
+into the yyyymmdd.json files and drops them from the journal.
+
+If a run dies halfway through a day (Chrome crash, CI timeout), the journal
+keeps the games finished so far: the next run skips their game_ids and
+compacts them together with the rest of that day. Compaction streams the
+journal game by game and replaces files atomically, so a crash during
+compaction leaves either the old or the new file, never a torn one.
+"""
+
+import json
+import os
+import textwrap
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set
+
+from utility.log import get_logger
+
+logger = get_logger(__name__)
+
+DATA_DIR = Path('frontend/public/data')
+JOURNAL_FILE = 'journal.ndjson'
+
+
+def write_spieltag_file(output_file: Path, date_yyyymmdd: str, games: Iterator[Dict]) -> int:
+    """
+    Write a yyyymmdd.json file from an iterator of games, one game at a time.
+
+    The output is the same as json.dump({'date': ..., 'games': [...]},
+    indent=2); the file is written next to the target and moved into place.
+
+    Returns:
+        Number of games written
+    """
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    written = 0
+    with open(tmp_file, 'w') as f:
+        f.write('{\n  "date": ' + json.dumps(date_yyyymmdd) + ',\n  "games": [')
+        for game in games:
+            f.write(',\n' if written else '\n')
+            f.write(textwrap.indent(json.dumps(game, indent=2), '    '))
+            written += 1
+        f.write('\n  ]\n}' if written else ']\n}')
+    os.replace(tmp_file, output_file)
+    return written
+
+
+class GameJournal:
+    """NDJSON journal of finished, not yet compacted games of one league"""
+
+    def __init__(self, liga_id: str, data_dir: Path = DATA_DIR):
+        self.data_dir = Path(data_dir) / liga_id
+        self.path = self.data_dir / JOURNAL_FILE
+        self._tail_checked = False
+        self._warned = False
+
+    def _entries(self) -> Iterator[Dict]:
+        """Journal entries in append order; a torn last line is skipped"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    if not self._warned:
+                        logger.warning(f"   ⚠️  Journal {self.path}: Zeile {line_no} unvollständig, übersprungen")
+                        self._warned = True
+
+    def game_ids(self) -> Set[str]:
+        """game_ids of all journaled games (finished in an earlier, interrupted run)"""
+        return {entry['game']['game_id'] for entry in self._entries()}
+
+    def _truncate_torn_tail(self):
+        """Cut off a half-written last line so the next append starts on a fresh line"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb+') as f:
+            content = f.read()
+            if content and not content.endswith(b'\n'):
+                f.truncate(content.rfind(b'\n') + 1)
+
+    def append(self, date_yyyymmdd: str, game: Dict):
+        """Persist one finished game before moving on to the next"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        if not self._tail_checked:
+            self._truncate_torn_tail()
+            self._tail_checked = True
+        line = json.dumps({'day': date_yyyymmdd, 'game': game}, ensure_ascii=False)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self, until: Optional[str] = None) -> Dict[str, int]:
+        """
+        Merge journaled games into their yyyymmdd.json files; a game that
+        is already in the file is replaced by its journaled version.
+
+        Args:
+            until: Only compact days <= until (yyyymmdd); later days stay
+                   in the journal. None compacts everything.
+
+        Returns:
+            dict: day -> number of games added to its file
+        """
+        days = sorted({entry['day'] for entry in self._entries() if until is None or entry['day'] <= until})
+        added = {}
+        for day in days:
+            output_file = self.data_dir / f'{day}.json'
+            existing_games = []
+            if output_file.exists():
+                with open(output_file, 'r') as f:
+                    existing_games = json.load(f).get('games', [])
+            seen = {g.get('game_id') for g in existing_games}
+
+            # Re-scraped games (e.g. corrected results) replace their saved entry
+            replacements = {}
+            for entry in self._entries():
+                if entry['day'] == day and entry['game']['game_id'] in seen:
+                    replacements[entry['game']['game_id']] = entry['game']
+
+            def new_games():
+                for entry in self._entries():
+                    game = entry['game']
+                    if entry['day'] == day and game['game_id'] not in seen:
+                        seen.add(game['game_id'])
+                        yield game
+
+            def merged():
+                for game in existing_games:
+                    yield replacements.get(game.get('game_id'), game)
+                yield from new_games()
+
+            total = write_spieltag_file(output_file, day, merged())
+            added[day] = total - len(existing_games)
+            logger.debug(f"      ✅ {output_file}: +{added[day]}, {len(replacements)} ersetzt (gesamt: {total})")
+
+        if days:
+            self._drop_days(set(days))
+        return added
+
+    def _drop_days(self, days: Set[str]):
+        """Rewrite the journal without the entries of days (delete it if empty)"""
+        tmp_file = self.path.with_name(self.path.name + '.tmp')
+        kept = 0
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for entry in self._entries():
+                if entry['day'] not in days:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                    kept += 1
+        if kept:
+            os.replace(tmp_file, self.path)
+        else:
+            tmp_file.unlink()
+            self.path.unlink()
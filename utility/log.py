@@ -0,0 +1,215 @@
+"""
+Leveled logging for the scraper.
+
+Modules log through get_logger(__name__) instead of print() + flush. The
+messages keep their emoji text; what reaches the console is decided once in
+configure_logging():
+
+    level   debug (every page), info (default), quiet (progress + errors)
+    format  text (messages as before) or json (one object per line with
+            time, level, league, game_id, logger and message)
+
+Records carry the league and game_id of the surrounding context() block,
+so parallel workers stay distinguishable. Output goes through a buffered
+handler that writes in batches (immediately for errors) to the current
+sys.stdout, which also keeps utility.parallel's per-worker capture working.
+
+Progress reports games/min and ETA at a fixed interval; it logs to the
+'handball.progress' logger, which stays visible in quiet mode.
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+ROOT_LOGGER = 'handball'
+PROGRESS_LOGGER = f'{ROOT_LOGGER}.progress'
+LOG_LEVELS = ('debug', 'info', 'quiet')
+LOG_FORMATS = ('text', 'json')
+BUFFER_RECORDS = 200
+BUFFER_SECONDS = 2.0
+
+_league: contextvars.ContextVar = contextvars.ContextVar('log_league', default=None)
+_game_id: contextvars.ContextVar = contextvars.ContextVar('log_game_id', default=None)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger below the 'handball' root, e.g. get_logger(__name__)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def bind(league: Optional[str] = None, game_id: Optional[str] = None) -> list:
+    """Set league and/or game_id for following records; undo with unbind(tokens)"""
+    tokens = []
+    if league is not None:
+        tokens.append((_league, _league.set(league)))
+    if game_id is not None:
+        tokens.append((_game_id, _game_id.set(game_id)))
+    return tokens
+
+
+def unbind(tokens: list):
+    """Restore the context from before bind()"""
+    for var, token in reversed(tokens):
+        var.reset(token)
+
+
+@contextlib.contextmanager
+def context(league: Optional[str] = None, game_id: Optional[str] = None):
+    """Attach league and/or game_id to all records logged inside the block"""
+    tokens = bind(league, game_id)
+    try:
+        yield
+    finally:
+        unbind(tokens)
+
+
+class _ContextFilter(logging.Filter):
+    """Copies the current league / game_id onto each record"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.league = _league.get()
+        record.game_id = _game_id.get()
+        return True
+
+
+class _TextFormatter(logging.Formatter):
+    """Plain message; warnings and errors get their context appended"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.levelno >= logging.WARNING:
+            where = ' '.join(part for part in (record.league, record.game_id) if part)
+            if where:
+                message = f"{message} [{where}]"
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        return message
+
+
+class _JsonFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'league': record.league,
+            'game_id': record.game_id,
+            'message': record.getMessage().strip()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler writing to whatever sys.stdout is at emit time"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class BufferedHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once the oldest buffered record is a few seconds old"""
+
+    def __init__(self, target: logging.Handler, capacity: int = BUFFER_RECORDS,
+                 flush_seconds: float = BUFFER_SECONDS):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=target)
+        self.flush_seconds = flush_seconds
+        self._first_buffered = None
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        if self._first_buffered is None:
+            self._first_buffered = time.monotonic()
+        return (super().shouldFlush(record)
+                or time.monotonic() - self._first_buffered >= self.flush_seconds)
+
+    def flush(self):
+        super().flush()
+        self._first_buffered = None
+
+
+def configure_logging(level: str = 'info', fmt: str = 'text', buffered: bool = True) -> logging.Logger:
+    """
+    Set up console output for the 'handball' loggers (replaces earlier setup).
+
+    Args:
+        level: 'debug', 'info' or 'quiet' (warnings, errors and progress only)
+        fmt: 'text' or 'json'
+        buffered: Write in batches instead of line by line
+
+    Returns:
+        The 'handball' root logger
+    """
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        handler.flush()
+        root.removeHandler(handler)
+
+    console = _StdoutHandler()
+    console.setFormatter(_JsonFormatter() if fmt == 'json' else _TextFormatter())
+    handler = BufferedHandler(console) if buffered else console
+    handler.addFilter(_ContextFilter())
+    root.addHandler(handler)
+    root.propagate = False
+
+    root.setLevel({'debug': logging.DEBUG, 'quiet': logging.WARNING}.get(level, logging.INFO))
+    # Progress stays visible in quiet mode; in debug/info the per-game lines say enough
+    logging.getLogger(PROGRESS_LOGGER).setLevel(logging.INFO if level == 'quiet' else logging.WARNING)
+    return root
+
+
+def flush():
+    """Write out buffered records (before printing directly or exiting)"""
+    for handler in logging.getLogger(ROOT_LOGGER).handlers:
+        handler.flush()
+
+
+class Progress:
+    """Logs done/total, games per minute and ETA at most every `interval` seconds"""
+
+    def __init__(self, total: int, label: str = 'Spiele', interval: float = 30.0):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self._start = time.monotonic()
+        self._last_report = self._start
+        self._logger = logging.getLogger(PROGRESS_LOGGER)
+
+    def update(self, n: int = 1, failed: bool = False):
+        """Count n finished items (failed ones separately)"""
+        self.done += n
+        if failed:
+            self.failed += n
+        now = time.monotonic()
+        if now - self._last_report >= self.interval or self.done >= self.total:
+            self._last_report = now
+            self.report()
+
+    def report(self):
+        elapsed = time.monotonic() - self._start
+        per_minute = self.done / elapsed * 60 if elapsed > 0 else 0.0
+        remaining = max(self.total - self.done, 0)
+        eta = f"{remaining / per_minute:.1f} min" if per_minute > 0 else '?'
+        failed = f", {self.failed} Fehler" if self.failed else ''
+        self._logger.info(f"⏱️  {self.done}/{self.total} {self.label}, {per_minute:.1f}/min, "
+                          f"Rest ca. {eta}{failed}")
+        flush()
@@ -0,0 +1,165 @@
+"""
+Timers and counters for scraper runs.
+
+Code wraps its stages in metrics.timer('fetch.aufstellung') and counts with
+metrics.count('errors.game') / metrics.add_bytes('html', n). Samples are
+kept per stage and, inside a metrics.league(name) block, also per league.
+write_report() turns them into run_report.json (p50/p95 per stage, bytes,
+counters) next to meta.json, which the StatusPage shows.
+
+Stage names are "<group>.<detail>" (fetch.info, parse.aufstellung,
+pdf.download, ...), so reports can be grouped without a fixed list.
+"""
+
+import contextlib
+import contextvars
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+REPORT_VERSION = 1
+REPORT_FILE = Path('frontend/public/data/run_report.json')
+
+_current_league: contextvars.ContextVar = contextvars.ContextVar('metrics_league', default=None)
+
+
+def _percentile(sorted_values: List[float], share: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(share * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(durations: List[float]) -> Dict:
+    """count, total and p50/p95/max in ms of a list of durations (seconds)"""
+    ordered = sorted(durations)
+    return {
+        'count': len(ordered),
+        'total_s': round(sum(ordered), 3),
+        'p50_ms': round(_percentile(ordered, 0.50) * 1000, 2),
+        'p95_ms': round(_percentile(ordered, 0.95) * 1000, 2),
+        'max_ms': round((ordered[-1] if ordered else 0.0) * 1000, 2)
+    }
+
+
+class Metrics:
+    """Registry of stage durations, counters and byte totals"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop all samples and restart the wall clock"""
+        with self._lock:
+            self.started_at = datetime.now()
+            self._start = time.perf_counter()
+            self.durations: Dict[Optional[str], Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+            self.counters: Dict[Optional[str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            self.bytes: Dict[Optional[str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, stage: str, seconds: float):
+        """Add one duration sample for stage"""
+        league = _current_league.get()
+        with self._lock:
+            self.durations[None][stage].append(seconds)
+            if league:
+                self.durations[league][stage].append(seconds)
+
+    @contextlib.contextmanager
+    def timer(self, stage: str):
+        """Time the with-block as one sample of stage (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def count(self, name: str, n: int = 1):
+        """Increase counter name by n"""
+        league = _current_league.get()
+        with self._lock:
+            self.counters[None][name] += n
+            if league:
+                self.counters[league][name] += n
+
+    def add_bytes(self, kind: str, n: int):
+        """Add n transferred bytes of kind (html, pdf, ...)"""
+        league = _current_league.get()
+        with self._lock:
+            self.bytes[None][kind] += n
+            if league:
+                self.bytes[league][kind] += n
+
+    @contextlib.contextmanager
+    def league(self, name: str, stage: str = 'league'):
+        """Attribute samples inside the block to league name, timed as stage"""
+        token = _current_league.set(name)
+        try:
+            with self.timer(stage):
+                yield
+        finally:
+            _current_league.reset(token)
+
+    def _section(self, key: Optional[str]) -> Dict:
+        return {
+            'stages': {stage: summarize(values) for stage, values in sorted(self.durations[key].items())},
+            'counters': dict(sorted(self.counters[key].items())),
+            'bytes': dict(sorted(self.bytes[key].items()))
+        }
+
+    def report(self) -> Dict:
+        """Run report as a JSON-serializable dict"""
+        with self._lock:
+            report = {
+                'version': REPORT_VERSION,
+                'started_at': self.started_at.isoformat(),
+                'finished_at': datetime.now().isoformat(),
+                'wall_seconds': round(time.perf_counter() - self._start, 3),
+                **self._section(None),
+                'leagues': {
+                    league: self._section(league)
+                    for league in sorted(set(self.durations) | set(self.counters) | set(self.bytes), key=str)
+                    if league is not None
+                }
+            }
+        return report
+
+    def write_report(self, path: Path = REPORT_FILE) -> Dict:
+        """Write report() to path (default: next to meta.json)"""
+        report = self.report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        return report
+
+
+def print_summary(report: Dict, top: int = 12):
+    """Print the slowest stages (by total time) of a report"""
+    stages = sorted(report['stages'].items(), key=lambda item: item[1]['total_s'], reverse=True)
+    print(f"   {'Stufe':22s} {'Anzahl':>7s} {'Summe s':>9s} {'p50 ms':>9s} {'p95 ms':>9s}")
+    for stage, stats in stages[:top]:
+        print(f"   {stage:22s} {stats['count']:7d} {stats['total_s']:9.2f} {stats['p50_ms']:9.1f} {stats['p95_ms']:9.1f}")
+    if report['bytes']:
+        transferred = ', '.join(f"{kind} {size / 1024 / 1024:.1f} MB" for kind, size in report['bytes'].items())
+        print(f"   Übertragen: {transferred}")
+    if report['counters']:
+        print(f"   Zähler: {', '.join(f'{name}={value}' for name, value in report['counters'].items())}")
+
+
+# Process-wide registry used by the scraper modules
+METRICS = Metrics()
+record = METRICS.record
+timer = METRICS.timer
+count = METRICS.count
+add_bytes = METRICS.add_bytes
+league = METRICS.league
+reset = METRICS.reset
+write_report = METRICS.write_report
@@ -0,0 +1,109 @@
+"""
+Negative cache: games whose pages yielded nothing, and when to look again.
+
+A game that has no lineup yet, no Spielbericht link on its info page or a
+report that answers 404 is recorded with that reason, the fingerprint of
+its Spielplan row and a retry time. Until then the scraper skips it (no
+lineup) or its report hop (no report). The wait starts at the reason's
+TTL and doubles with every unsuccessful attempt, up to MAX_TTL_HOURS; a
+changed Spielplan row (new score, new date) invalidates the entry at once.
+
+Kept per league in frontend/public/data/spielplan/<liga>.missing.json.
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utility.log import get_logger
+from utility.spielplan_cache import CACHE_DIR, row_fingerprint
+
+logger = get_logger(__name__)
+
+# First wait per reason; a lineup usually appears hours after the game,
+# a missing report rarely comes back before the next day
+REASON_TTL_HOURS = {
+    'no_lineup': 12,
+    'no_report_link': 24,
+    'report_404': 24
+}
+MAX_TTL_HOURS = 7 * 24
+REPORT_REASONS = ('no_report_link', 'report_404')
+
+
+class NegativeCache:
+    """Games of one league that yielded nothing, with their retry time"""
+
+    def __init__(self, liga_id: str, cache_dir: Path = CACHE_DIR):
+        self.path = Path(cache_dir) / f"{liga_id}.missing.json"
+        self.entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('games', {})
+            except Exception as e:
+                logger.warning(f"   ⚠️  Negativ-Cache nicht lesbar ({e}), wird neu angelegt")
+
+    def skip_reason(self, game: Dict, now: Optional[datetime] = None) -> Optional[str]:
+        """
+        Reason to skip game now, None if it should be fetched.
+
+        An entry whose Spielplan row changed is dropped.
+        """
+        entry = self.entries.get(game['game_id'])
+        if entry is None:
+            return None
+        if entry['fingerprint'] != row_fingerprint(game):
+            self.clear(game['game_id'])
+            return None
+        if (now or datetime.now()) >= datetime.fromisoformat(entry['retry_at']):
+            return None
+        return entry['reason']
+
+    def record(self, game: Dict, reason: str, now: Optional[datetime] = None):
+        """Remember that game yielded nothing for reason; backs off on repeats"""
+        now = now or datetime.now()
+        previous = self.entries.get(game['game_id'])
+        attempts = previous['attempts'] + 1 if previous and previous['reason'] == reason else 1
+        ttl_hours = min(REASON_TTL_HOURS[reason] * 2 ** (attempts - 1), MAX_TTL_HOURS)
+        self.entries[game['game_id']] = {
+            'reason': reason,
+            'fingerprint': row_fingerprint(game),
+            'attempts': attempts,
+            'checked_at': now.isoformat(timespec='seconds'),
+            'retry_at': (now + timedelta(hours=ttl_hours)).isoformat(timespec='seconds')
+        }
+        self._dirty = True
+
+    def clear(self, game_id: str):
+        """Forget game_id (its pages yielded data)"""
+        if self.entries.pop(game_id, None) is not None:
+            self._dirty = True
+
+    def prune(self, game_ids):
+        """Drop entries of games that are no longer in the Spielplan"""
+        for game_id in [game_id for game_id in self.entries if game_id not in game_ids]:
+            self.clear(game_id)
+
+    def due(self, game_ids=None, now: Optional[datetime] = None) -> List[str]:
+        """
+        game_ids whose retry time has come.
+
+        Args:
+            game_ids: Only consider these (e.g. the current Spielplan)
+        """
+        now = now or datetime.now()
+        return [game_id for game_id, entry in self.entries.items()
+                if (game_ids is None or game_id in game_ids)
+                and now >= datetime.fromisoformat(entry['retry_at'])]
+
+    def save(self):
+        """Write the entries if they changed"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'games': self.entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        self._dirty = False
@@ -0,0 +1,358 @@
+"""
+Structured data embedded in handball.net pages.
+
+The pages are rendered by a JavaScript framework that ships the data behind
+each view along with the HTML: as a __NEXT_DATA__ JSON script, as streamed
+"self.__next_f.push(...)" payloads, as a window.__*STATE__ assignment or as
+schema.org ld+json. Reading games, lineups and officials from there gives
+exact ids, team names and numbers, without walking the DOM or splitting
+concatenated texts.
+
+Every parse_*_state() function returns None if the page has no usable
+payload; the callers in utility.parsing then fall back to the DOM parsers.
+The first pages of each kind in a run are checked against the DOM parsers,
+whose spellings the saved games use (see utility.parsing); a recorded
+corpus can be checked with bench/bench_html_parsers.py --corpus. Set
+HANDBALL_EMBEDDED_STATE=0 to always use the DOM parsers.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+NEXT_DATA_RE = re.compile(r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I)
+NEXT_FLIGHT_RE = re.compile(r'self\.__next_f\.push\(\[1,\s*"((?:[^"\\]|\\.)*)"\]\)', re.S)
+LD_JSON_RE = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I)
+WINDOW_STATE_RE = re.compile(r'window\.__[A-Z_]*STATE__\s*=\s*', re.S)
+FLIGHT_ROW_RE = re.compile(r'^[0-9a-f]+:(?=[\[{])')
+
+GERMAN_WEEKDAYS = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']
+
+# Alternative key names seen for the same field
+TEAM_KEYS = (('homeTeam', 'awayTeam'), ('home', 'away'))
+START_KEYS = ('startsAt', 'startDate', 'startTime', 'date')
+SCORE_KEYS = (('homeGoals', 'awayGoals'), ('homeScore', 'awayScore'), ('goalsHome', 'goalsAway'),
+              ('goalsHome', 'goalsGuest'))
+TOTAL_KEYS = ('total', 'totalCount', 'totalElements', 'count')
+PLAYER_STAT_KEYS = {
+    'goals': ('goals', 'goalCount'),
+    'two_min_penalties': ('penalties', 'twoMinutePenalties', 'suspensions', 'twoMinutes'),
+    'yellow_cards': ('yellowCards', 'yellowCard', 'warnings'),
+    'red_cards': ('redCards', 'redCard', 'disqualifications'),
+    'blue_cards': ('blueCards', 'blueCard')
+}
+OFFICIAL_ROLES = {
+    'referees': ('referee', 'schiedsrichter'),
+    'timekeepers': ('timekeeper', 'zeitnehmer'),
+    'secretaries': ('secretary', 'scorekeeper', 'sekretär', 'sekreter')
+}
+
+
+def state_extraction_enabled() -> bool:
+    """Embedded state is used unless HANDBALL_EMBEDDED_STATE=0"""
+    return os.environ.get('HANDBALL_EMBEDDED_STATE', '1') != '0'
+
+
+def extract_embedded_state(html: str) -> List[Any]:
+    """
+    Decode all structured payloads of a page.
+
+    Returns:
+        List of JSON roots (dicts/lists), empty if the page has none
+    """
+    if not html:
+        return []
+
+    roots = []
+
+    for match in NEXT_DATA_RE.finditer(html):
+        _append_json(roots, match.group(1))
+
+    # Streamed payloads: JS string literals, concatenated they form rows
+    # like '1f:{"game":...}' (one JSON value per row)
+    chunks = []
+    for match in NEXT_FLIGHT_RE.finditer(html):
+        try:
+            chunks.append(json.loads(f'"{match.group(1)}"'))
+        except ValueError:
+            continue
+    for row in ''.join(chunks).split('\n'):
+        prefix = FLIGHT_ROW_RE.match(row)
+        if prefix:
+            _append_json(roots, row[prefix.end():])
+
+    decoder = json.JSONDecoder()
+    for match in WINDOW_STATE_RE.finditer(html):
+        try:
+            value, _ = decoder.raw_decode(html, match.end())
+            roots.append(value)
+        except ValueError:
+            continue
+
+    for match in LD_JSON_RE.finditer(html):
+        _append_json(roots, match.group(1))
+
+    return roots
+
+
+def _append_json(roots: list, text: str):
+    """Append json.loads(text) to roots, ignoring malformed payloads"""
+    try:
+        roots.append(json.loads(text))
+    except ValueError:
+        pass
+
+
+def _walk(node: Any, parent: Optional[dict] = None) -> Iterator[Tuple[Any, Optional[dict]]]:
+    """Yield (node, enclosing dict) for every dict and list below node, depth first"""
+    stack = [(node, parent)]
+    while stack:
+        current, enclosing = stack.pop()
+        if isinstance(current, dict):
+            yield current, enclosing
+            stack.extend((value, current) for value in reversed(list(current.values())))
+        elif isinstance(current, list):
+            yield current, enclosing
+            stack.extend((value, enclosing) for value in reversed(current))
+
+
+def _team_name(team: Any) -> Optional[str]:
+    """Team name from a team object or plain string"""
+    if isinstance(team, str):
+        return team.strip() or None
+    if isinstance(team, dict):
+        name = team.get('name') or team.get('fullName') or team.get('title')
+        if isinstance(name, str) and name.strip():
+            return name.strip()
+    return None
+
+
+def _game_teams(node: dict) -> Optional[Tuple[str, str]]:
+    """(home, away) if node looks like a game object"""
+    for home_key, away_key in TEAM_KEYS:
+        if home_key in node and away_key in node:
+            home = _team_name(node[home_key])
+            away = _team_name(node[away_key])
+            if home and away:
+                return home, away
+    return None
+
+
+def _format_game_date(value: Any) -> Optional[str]:
+    """Start time (epoch ms/s or ISO string) as "Sa, 20.09." in German local time"""
+    try:
+        if isinstance(value, (int, float)):
+            seconds = value / 1000 if value > 1e11 else value
+            moment = datetime.fromtimestamp(seconds, tz=timezone.utc)
+        elif isinstance(value, str) and value:
+            moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        else:
+            return None
+    except (ValueError, OverflowError, OSError):
+        return None
+
+    if moment.tzinfo is not None:
+        try:
+            from zoneinfo import ZoneInfo
+            moment = moment.astimezone(ZoneInfo('Europe/Berlin'))
+        except Exception:
+            pass
+    return f"{GERMAN_WEEKDAYS[moment.weekday()]}, {moment.day:02d}.{moment.month:02d}."
+
+
+def _game_score(node: dict) -> Optional[str]:
+    """Final score "27:25" of a game object (None if not played yet)"""
+    for home_key, away_key in SCORE_KEYS:
+        home, away = node.get(home_key), node.get(away_key)
+        if isinstance(home, int) and isinstance(away, int):
+            return f"{home}:{away}"
+    for key in ('result', 'score'):
+        value = node.get(key)
+        if isinstance(value, dict):
+            value = _game_score(value) or (
+                f"{value['home']}:{value['away']}"
+                if isinstance(value.get('home'), int) and isinstance(value.get('away'), int) else None)
+        if isinstance(value, str) and re.fullmatch(r'\d+\s*:\s*\d+', value.strip()):
+            return value.replace(' ', '').strip()
+    return None
+
+
+def _game_id(node: dict) -> Optional[str]:
+    """handball4all game id of a game object"""
+    for key in ('id', 'gameId', 'slug'):
+        value = node.get(key)
+        if isinstance(value, str) and value.startswith('handball4all'):
+            return value
+    return None
+
+
+def parse_spielplan_state(html: str) -> Optional[Tuple[Optional[int], List[Dict]]]:
+    """
+    Games of a Spielplan page from the embedded state.
+
+    Returns:
+        (total_games, games) like utility.parsing.parse_spielplan_page, or
+        None if the page carries no game objects
+    """
+    games = []
+    seen_ids = set()
+    total_games = None
+
+    for root in extract_embedded_state(html):
+        for node, enclosing in _walk(root):
+            if not isinstance(node, dict):
+                continue
+            teams = _game_teams(node)
+            game_id = _game_id(node) if teams else None
+            if not game_id or game_id in seen_ids:
+                continue
+
+            date_text = None
+            for key in START_KEYS:
+                if key in node:
+                    date_text = _format_game_date(node[key])
+                    if date_text:
+                        break
+
+            games.append({
+                'game_id': game_id,
+                'home_team': teams[0],
+                'away_team': teams[1],
+                'date': date_text or "Unknown",
+                'score': _game_score(node)
+            })
+            seen_ids.add(game_id)
+
+            # Paging info usually sits next to the list of games
+            if total_games is None and isinstance(enclosing, dict):
+                for key in TOTAL_KEYS:
+                    if isinstance(enclosing.get(key), int):
+                        total_games = enclosing[key]
+                        break
+
+    if not games:
+        return None
+    return total_games, games
+
+
+def _player_name(player: dict) -> Optional[str]:
+    """Display name of a player object"""
+    name = player.get('name')
+    if isinstance(name, str) and name.strip():
+        return name.strip()
+    first = player.get('firstname') or player.get('firstName') or ''
+    last = player.get('lastname') or player.get('lastName') or ''
+    full = f"{first} {last}".strip()
+    return full or None
+
+
+def _stat(player: dict, field: str) -> int:
+    """Integer stat of a player object (first alias present), 0 if missing"""
+    for key in PLAYER_STAT_KEYS[field]:
+        value = player.get(key)
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+    return 0
+
+
+def _players(entries: Any) -> Optional[List[Dict]]:
+    """Player dicts (scraper format) from a list of player objects"""
+    if not isinstance(entries, list) or not entries:
+        return None
+    players = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            return None
+        person = entry.get('person') if isinstance(entry.get('person'), dict) else entry
+        name = _player_name(person)
+        if not name:
+            return None
+        players.append({
+            'name': name,
+            'goals': _stat(entry, 'goals'),
+            'two_min_penalties': _stat(entry, 'two_min_penalties'),
+            'yellow_cards': _stat(entry, 'yellow_cards'),
+            'red_cards': _stat(entry, 'red_cards'),
+            'blue_cards': _stat(entry, 'blue_cards'),
+            'seven_meters': 0,
+            'seven_meters_goals': 0
+        })
+    return players
+
+
+def parse_lineup_state(html: str, game_id: str) -> Optional[Dict[str, List[Dict]]]:
+    """
+    Players per team of an AUFSTELLUNG page from the embedded state.
+
+    Needs the page's own game object (team names; other games, e.g. of a
+    "next games" widget, are ignored) and a lineup object with home and
+    away player lists.
+
+    Args:
+        html: Page source
+        game_id: handball4all id of the page's game
+
+    Returns:
+        {team_name: players} for both teams (home first), or None
+    """
+    teams = None
+    lineup = None
+
+    for root in extract_embedded_state(html):
+        for node, _ in _walk(root):
+            if not isinstance(node, dict):
+                continue
+            if teams is None and _game_id(node) == game_id:
+                teams = _game_teams(node)
+            if lineup is None:
+                home = _players(node.get('home'))
+                away = _players(node.get('away'))
+                if home and away:
+                    lineup = (home, away)
+            if teams and lineup:
+                break
+
+    if not teams or not lineup or teams[0] == teams[1]:
+        return None
+    return {teams[0]: lineup[0], teams[1]: lineup[1]}
+
+
+def parse_officials_state(html: str) -> Optional[Dict[str, List[str]]]:
+    """
+    Officials of a SPIELINFO page from the embedded state.
+
+    Looks for objects with a role/type and a person name.
+
+    Returns:
+        {'referees', 'timekeepers', 'secretaries'} lists, or None
+    """
+    officials = {'referees': [], 'timekeepers': [], 'secretaries': []}
+
+    for root in extract_embedded_state(html):
+        for node, _ in _walk(root):
+            if not isinstance(node, dict):
+                continue
+            role = node.get('role') or node.get('type') or node.get('function')
+            if not isinstance(role, str):
+                continue
+            person = node.get('person') if isinstance(node.get('person'), dict) else node
+            name = _player_name(person)
+            if not name:
+                continue
+            role_lower = role.lower()
+            for field, keywords in OFFICIAL_ROLES.items():
+                if any(keyword in role_lower for keyword in keywords):
+                    if name not in officials[field]:
+                        officials[field].append(name)
+                    break
+
+    if not any(officials.values()):
+        return None
+    return officials
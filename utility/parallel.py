@@ -0,0 +1,86 @@
+"""Run independent per-league jobs in a process pool"""
+
+import contextlib
+import io
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from utility import log
+
+
+def _run_league(worker: Callable, league: Dict[str, Any], capture: bool, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Run worker for one league, recording result, error, duration and (optionally) stdout"""
+    buffer = io.StringIO()
+    outcome = {
+        'league': league.get('name', 'unknown'),
+        'result': None,
+        'error': None,
+        'seconds': 0.0,
+        'output': ''
+    }
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buffer) if capture else contextlib.nullcontext():
+        try:
+            outcome['result'] = worker(league, **kwargs)
+        except Exception as e:
+            outcome['error'] = f"{type(e).__name__}: {e}"
+            print(f"   ❌ Fehler: {outcome['error']}")
+            if capture:
+                traceback.print_exc(file=buffer)
+            else:
+                traceback.print_exc()
+        # Buffered log records belong to this league's output
+        log.flush()
+    outcome['seconds'] = time.perf_counter() - start
+    outcome['output'] = buffer.getvalue()
+    return outcome
+
+
+def run_leagues(worker: Callable, leagues: List[Dict[str, Any]], jobs: int = 1, **kwargs) -> List[Dict[str, Any]]:
+    """
+    Run worker(league, **kwargs) for every league.
+
+    With jobs > 1 leagues are fanned out over a process pool. Each worker's
+    stdout is buffered and printed in config order once that league (and
+    all leagues before it) finished, so the log never interleaves.
+
+    Args:
+        worker: Module-level function (must be picklable)
+        leagues: League entries from config
+        jobs: Number of worker processes (1 = run inline)
+
+    Returns:
+        One dict per league (config order) with league, result, error, seconds
+    """
+    if jobs <= 1 or len(leagues) <= 1:
+        return [_run_league(worker, league, False, kwargs) for league in leagues]
+
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(leagues))) as pool:
+        futures = [pool.submit(_run_league, worker, league, True, kwargs) for league in leagues]
+        for league, future in zip(leagues, futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # Worker process died (e.g. out of memory)
+                outcome = {
+                    'league': league.get('name', 'unknown'),
+                    'result': None,
+                    'error': f"{type(e).__name__}: {e}",
+                    'seconds': 0.0,
+                    'output': f"   ❌ Worker abgebrochen: {e}\n"
+                }
+            print(outcome['output'], end='', flush=True)
+            outcomes.append(outcome)
+    return outcomes
+
+
+def print_timings(outcomes: List[Dict[str, Any]]) -> None:
+    """Print per-league durations and errors in config order"""
+    print("⏱️  Laufzeit pro Liga:")
+    for outcome in outcomes:
+        status = f"❌ {outcome['error']}" if outcome['error'] else "✓"
+        print(f"   {outcome['seconds']:6.1f} s  {outcome['league']}  {status}")
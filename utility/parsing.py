@@ -0,0 +1,691 @@
+"""
+HTML and date parsing for handball.net pages.
+
+Pure functions on page source strings: no browser, no network, no config.
+BeautifulSoup and lxml are imported on first use so importing this module
+stays cheap.
+
+Spielplan, lineup and info pages are first read from the data embedded in
+the page (utility.page_state); the DOM parsers below are the fallback. The
+first STATE_CHECK_PAGES pages of each kind in a run are parsed both ways:
+if the results differ, that kind is read from the DOM for the rest of the
+run, so the saved data keeps the spellings it was built with.
+
+Lineup pages (Aufstellung) have two interchangeable DOM backends, see
+set_parser_backend(): 'lxml' with precompiled XPath expressions, and 'bs4'
+(BeautifulSoup with html.parser). Both return identical results;
+bench/bench_html_parsers.py checks that on a page corpus.
+"""
+
+import calendar
+import os
+import re
+import threading
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from utility import metrics
+from utility.log import get_logger
+from utility.page_state import state_extraction_enabled, parse_spielplan_state, parse_lineup_state, parse_officials_state
+
+logger = get_logger(__name__)
+
+
+# h3 headings on the Aufstellung page that are navigation, not team names
+NAVIGATION_HEADINGS = frozenset(['Fan-Services', 'Vereinsservices', 'News', 'Ligen, Vereine & Verbände', 'mein.handball.net', 'Kontakt'])
+
+# Lineup rows that are headers or totals, not players
+NON_PLAYER_NAMES = frozenset(['Name', 'GESAMT', 'Spieler', ''])
+
+OFFICIAL_KEYWORDS = ['Schiedsrichter', 'Zeitnehmer', 'Sekretär', 'Sekreter']
+
+YELLOW_CARD_RE = re.compile('yellow', re.I)
+RED_CARD_RE = re.compile('red', re.I)
+BLUE_CARD_RE = re.compile('blue', re.I)
+GAME_DATE_RE = re.compile(r'([A-Za-z]{2}),\s*(\d{1,2}\.\d{1,2}\.)')
+DAY_MONTH_RE = re.compile(r'(\d{1,2}\.\d{1,2}\.)')
+
+# 'lxml' or 'bs4'; None = HANDBALL_HTML_PARSER env var, else lxml if installed
+PARSER_BACKENDS = ('lxml', 'bs4')
+_parser_backend = None
+
+# Precompiled XPath expressions of the lxml backend (see _lxml_xpaths)
+_xpaths = None
+
+# Pages per kind whose embedded state is compared with the DOM parse (per run)
+STATE_CHECK_PAGES = 5
+_state_checked: Dict[str, int] = {}
+_state_mismatch = set()
+_state_lock = threading.Lock()
+
+
+def _checked_state(kind: str, state_result, parse_dom, same=None):
+    """
+    Result to use for a page whose embedded state gave state_result.
+
+    The first STATE_CHECK_PAGES pages of kind are also parsed with
+    parse_dom(); after a difference (same(state, dom), default ==) kind is
+    read from the DOM only for the rest of the run.
+    """
+    with _state_lock:
+        if kind in _state_mismatch:
+            return parse_dom()
+        checked = _state_checked.get(kind, 0)
+        if checked >= STATE_CHECK_PAGES:
+            return state_result
+        _state_checked[kind] = checked + 1
+
+    dom_result = parse_dom()
+    if (same or (lambda a, b: a == b))(state_result, dom_result):
+        return state_result
+    with _state_lock:
+        if kind not in _state_mismatch:
+            _state_mismatch.add(kind)
+            logger.warning(f"   ⚠️  Eingebettete Daten ({kind}) weichen vom HTML ab, HTML-Parser für den Rest des Laufs")
+            metrics.count(f"state.mismatch.{kind}")
+    return dom_result
+
+
+def _same_spielplan(state_result, dom_result) -> bool:
+    """Spielplan results agree on games, dates and scores (and teams where the DOM has them)"""
+    state_games, dom_games = state_result[1], dom_result[1]
+    if [g['game_id'] for g in state_games] != [g['game_id'] for g in dom_games]:
+        return False
+    for state_game, dom_game in zip(state_games, dom_games):
+        if (state_game['date'], state_game['score']) != (dom_game['date'], dom_game['score']):
+            return False
+        if dom_game['home_team'] and (state_game['home_team'], state_game['away_team']) != (dom_game['home_team'], dom_game['away_team']):
+            return False
+    return True
+
+
+def fuzzy_match_team_name(target, candidates, threshold=0.80):
+    """
+    Fuzzy match team name allowing for minor typos (up to 2 character differences)
+
+    Args:
+        target: Team name to match
+        candidates: List of candidate team names
+        threshold: Similarity threshold (0.80 = allows ~2 char difference)
+
+    Returns:
+        (matched_name, similarity_score) or (None, 0)
+    """
+    best_match = None
+    best_score = 0
+
+    target_lower = target.lower().strip()
+
+    for candidate in candidates:
+        candidate_lower = candidate.lower().strip()
+
+        # Exact match
+        if target_lower == candidate_lower:
+            return (candidate, 1.0)
+
+        # Fuzzy match using SequenceMatcher
+        similarity = SequenceMatcher(None, target_lower, candidate_lower).ratio()
+        if similarity > best_score:
+            best_score = similarity
+            best_match = candidate
+
+    # Return match only if above threshold
+    if best_score >= threshold:
+        return (best_match, best_score)
+
+    return (None, 0)
+
+
+def parse_spielplan_page(html) -> Tuple[Optional[int], List[Dict]]:
+    """
+    Parse one Spielplan page.
+
+    Returns:
+        (total_games, games): total from "N Spiele gefunden" (None if not
+        shown) and the page's games in page order, each with game_id,
+        home_team, away_team, date and score ("27:25", None before the game)
+    """
+    if state_extraction_enabled():
+        parsed = parse_spielplan_state(html)
+        if parsed:
+            return _checked_state('spielplan', parsed, lambda: _parse_spielplan_dom(html), _same_spielplan)
+    return _parse_spielplan_dom(html)
+
+
+def _parse_spielplan_dom(html) -> Tuple[Optional[int], List[Dict]]:
+    """
+    DOM fallback of parse_spielplan_page(): climbs from each game link to
+    the container showing a date and splits its text at date and score.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    total_games = None
+    game_count_div = soup.find('div', class_='text-sm', string=re.compile(r'Spiele gefunden'))
+    if game_count_div:
+        match = re.search(r'(\d+)\s*Spiele gefunden', game_count_div.get_text())
+        if match:
+            total_games = int(match.group(1))
+
+    page_games = []
+    seen_ids = set()
+
+    # Find all game links from spielbericht OR info (spielbericht requires login, info/aufstellung works for all)
+    game_links = soup.find_all('a', href=re.compile(r'/spiele/handball4all.*(spielbericht|info)'))
+
+    for link in game_links:
+        href = link.get('href', '')
+        parts = href.split('/')
+
+        try:
+            spiele_idx = parts.index('spiele')
+            game_id = parts[spiele_idx + 1]
+
+            if game_id in seen_ids:
+                continue
+
+            # Find parent container with game info
+            parent = link.parent
+            game_info_text = None
+
+            for _ in range(15):
+                if parent is None:
+                    break
+                parent_text = parent.get_text(strip=True)
+                # Check if this level has date (including "Heute" or "Today" indicator)
+                if re.search(r'([A-Za-z]{2},\s*\d{1,2}\.\d{1,2}\.|Heute)', parent_text):
+                    game_info_text = parent_text
+                    break
+                parent = parent.parent
+
+            if not game_info_text:
+                continue
+
+            # Parse the game info text - handle both regular dates and "Heute"
+            date_match = re.search(r'([A-Za-z]{2},\s*\d{1,2}\.\d{1,2}\.|Heute)', game_info_text)
+            if date_match:
+                date_text = date_match.group(1)
+                # Convert "Heute" to today's date in the format needed
+                if date_text == "Heute":
+                    today = datetime.now()
+                    day_name = calendar.day_name[today.weekday()][:2].capitalize()
+                    date_text = f"{day_name}, {today.day:02d}.{today.month:02d}."
+            else:
+                date_text = "Unknown"
+
+            # Extract score pattern to identify team split
+            score_match = re.search(r'(\d+):(\d+)', game_info_text)
+
+            home_team = None
+            away_team = None
+            score = None
+
+            if score_match:
+                score = f"{score_match.group(1)}:{score_match.group(2)}"
+                score_pos = score_match.start()
+                # Everything between date and score is likely home team
+                text_after_date = game_info_text[date_match.end() if date_match else 0:score_pos].strip()
+                home_team = text_after_date
+
+                # Everything after score is likely away team
+                text_after_score = game_info_text[score_match.end():].strip()
+                away_team = text_after_score
+
+            page_games.append({
+                'game_id': game_id,
+                'home_team': home_team,
+                'away_team': away_team,
+                'date': date_text,
+                'score': score
+            })
+            seen_ids.add(game_id)
+        except (ValueError, IndexError):
+            pass
+
+    return total_games, page_games
+
+
+def parse_date_to_yyyymmdd(date_text, now: datetime = None):
+    """
+    Convert date text like "Sa, 20.09." to yyyymmdd format.
+    Handles handball season spanning Sep-May across two calendar years.
+
+    Args:
+        date_text: Date as shown on handball.net
+        now: Reference time for the season year (default: current time)
+    """
+    now = now or datetime.now()
+    current_year = now.year
+    current_month = now.month
+
+    try:
+        # Handle "Heute" (today)
+        if date_text == "Heute" or "Heute" in date_text:
+            return now.strftime('%Y%m%d')
+
+        # Format: "Sa, 20.09." → split by comma
+        if ',' in date_text:
+            date_part = date_text.split(',')[1].strip()
+        else:
+            date_part = date_text
+
+        # Parse "20.09." → extract day and month
+        day_month = date_part.split('.')
+        day = int(day_month[0])
+        month = int(day_month[1])
+
+        # Determine year based on handball season (Sep-May spans two calendar years)
+        if current_month <= 8 and month >= 9:
+            # Current time is Jan-Aug, match is Sep-Dec → use previous year
+            year = current_year - 1
+        elif current_month >= 9 and month <= 8:
+            # Current time is Sep-Dec, match is Jan-Aug → use next year
+            year = current_year + 1
+        else:
+            # Same calendar year
+            year = current_year
+
+        return f"{year}{month:02d}{day:02d}"
+    except Exception as e:
+        print(f"  ⚠️  Could not parse date: '{date_text}' - {e}")
+        return None
+
+
+def set_parser_backend(name: str) -> str:
+    """
+    Select the lineup page parser: 'lxml' (fast) or 'bs4'.
+    
+    Falls back to bs4 if lxml is not installed.
+    
+    Returns:
+        The backend now in use
+    """
+    global _parser_backend
+    
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name} (available: {', '.join(PARSER_BACKENDS)})")
+    
+    if name == 'lxml':
+        try:
+            import lxml.html  # noqa: F401
+        except ImportError:
+            print("  ⚠️  lxml not installed, using BeautifulSoup parser")
+            name = 'bs4'
+    
+    _parser_backend = name
+    return name
+
+
+def get_parser_backend() -> str:
+    """Backend in use (resolved on first call, see set_parser_backend)"""
+    if _parser_backend is None:
+        set_parser_backend(os.environ.get('HANDBALL_HTML_PARSER', 'lxml'))
+    return _parser_backend
+
+
+def extract_players_from_aufstellung(html, game_id: str = None):
+    """
+    Extract players from AUFSTELLUNG page - match tables to team names
+    
+    The embedded state (opt-in, see utility.page_state) is only read if
+    game_id is given, so its game object can be checked against the page.
+    """
+    if game_id and state_extraction_enabled():
+        players_by_team = parse_lineup_state(html, game_id)
+        if players_by_team:
+            return _checked_state('lineup', players_by_team, lambda: parse_aufstellung_page(html)[0])
+    return parse_aufstellung_page(html)[0]
+
+
+def extract_game_date(html):
+    """Extract game date from page - format: Sa, 20.09."""
+    return parse_aufstellung_page(html)[1]
+
+
+def parse_aufstellung_page(html, backend: str = None) -> Tuple[Dict[str, List[Dict]], str]:
+    """
+    Parse an AUFSTELLUNG page once for both players and game date.
+    
+    Args:
+        html: Page source
+        backend: 'lxml' or 'bs4' (default: get_parser_backend())
+    
+    Returns:
+        (players_by_team, game_date) - players_by_team maps the (up to two)
+        team names to player dicts, game_date is like "Sa, 20.09." or "Unknown"
+    """
+    if (backend or get_parser_backend()) == 'lxml':
+        return _parse_aufstellung_lxml(html)
+    return _parse_aufstellung_bs4(html)
+
+
+def _select_team_headings(names: List[str]) -> List[int]:
+    """
+    Indices of h3 headings that are team names: not navigation, and not a
+    repeat of the previous heading (mobile and desktop header).
+    """
+    selected = []
+    prev_name = None
+    
+    for idx, name in enumerate(names):
+        if not name or name in NAVIGATION_HEADINGS:
+            continue
+        if name != prev_name:
+            selected.append(idx)
+        prev_name = name
+    
+    return selected
+
+
+def _cell_count(text: str) -> int:
+    """Numeric lineup cell: digits → int, anything else → 0"""
+    try:
+        return int(text) if text and text.isdigit() else 0
+    except ValueError:
+        return 0
+
+
+def _make_player(name: str, texts: List[str], card_sources: List[str]) -> Dict:
+    """Player dict from the cell texts of a lineup row and the card image sources"""
+    return {
+        'name': name,
+        'goals': _cell_count(texts[2]) if len(texts) > 2 else 0,
+        'two_min_penalties': _cell_count(texts[3]) if len(texts) > 3 else 0,
+        'yellow_cards': sum(1 for src in card_sources if YELLOW_CARD_RE.search(src)),
+        'red_cards': sum(1 for src in card_sources if RED_CARD_RE.search(src)),
+        'blue_cards': sum(1 for src in card_sources if BLUE_CARD_RE.search(src)),
+        'seven_meters': 0,
+        'seven_meters_goals': 0
+    }
+
+
+def _match_game_date(text: str) -> str:
+    """Game date from the page text"""
+    # Match pattern: "Sa, 20.09." (Weekday abbreviation, comma, day.month.)
+    match = GAME_DATE_RE.search(text)
+    if match:
+        return f"{match.group(1)}, {match.group(2)}"
+    
+    # Fallback: try just day.month pattern
+    match = DAY_MONTH_RE.search(text)
+    if match:
+        return match.group(1)
+    
+    return "Unknown"
+
+
+def _parse_aufstellung_bs4(html) -> Tuple[Dict[str, List[Dict]], str]:
+    """BeautifulSoup backend of parse_aufstellung_page()"""
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    players_by_team = {}
+    game_date = _match_game_date(soup.get_text())
+    
+    # Find all h3 headings and pick the team names among them
+    h3_list = soup.find_all('h3')
+    names = [h3.get_text(strip=True) for h3 in h3_list]
+    team_h3_pairs = [(h3_list[idx], names[idx]) for idx in _select_team_headings(names)]
+    
+    # We need exactly 2 teams
+    if len(team_h3_pairs) < 2:
+        return players_by_team, game_date
+    
+    # For each team h3, find the table that follows it
+    team_table_pairs = []
+    for h3_elem, team_name in team_h3_pairs[:2]:  # Only process first 2 teams
+        next_table = h3_elem.find_next('table')
+        if next_table:
+            team_table_pairs.append((team_name, next_table))
+    
+    # If we still don't have 2 team-table pairs, fall back to simple index matching
+    if len(team_table_pairs) < 2:
+        tables = soup.find_all('table')
+        if len(tables) < 2:
+            return players_by_team, game_date
+        
+        team_names = [name for _, name in team_h3_pairs[:2]]
+        for table_idx, table in enumerate(tables[:2]):
+            if table_idx < len(team_names):
+                team_table_pairs.append((team_names[table_idx], table))
+    
+    # Now extract players from each table
+    for team_name, table in team_table_pairs:
+        tbody = table.find('tbody')
+        rows = (tbody or table).find_all('tr')
+        
+        players = []
+        for row in rows:
+            cells = row.find_all('td')
+            if len(cells) < 2:
+                continue
+            
+            name = cells[1].get_text(strip=True)
+            if name in NON_PLAYER_NAMES:
+                continue
+            
+            texts = [cell.get_text(strip=True) for cell in cells[2:4]]
+            card_sources = []
+            if len(cells) > 4:
+                card_sources = [img['src'] for img in cells[4].find_all('img', src=True)]
+            players.append(_make_player(name, ['', ''] + texts, card_sources))
+        
+        if players:
+            players_by_team[team_name] = players
+    
+    return players_by_team, game_date
+
+
+def _lxml_xpaths() -> Dict:
+    """Compile the lxml backend's XPath expressions once per process"""
+    global _xpaths
+    
+    if _xpaths is None:
+        from lxml import etree
+        
+        # bs4's get_text() skips these strings; mirror it for identical names
+        text = './/text()[not(ancestor::script or ancestor::style or ancestor::template or ancestor::rt or ancestor::rp)]'
+        _xpaths = {
+            'h3': etree.XPath('//h3'),
+            'text': etree.XPath(text),
+            'next_table': etree.XPath('(descendant::table | following::table)[1]'),
+            'tables': etree.XPath('//table'),
+            'tbody': etree.XPath('(.//tbody)[1]'),
+            'rows': etree.XPath('.//tr'),
+            'cells': etree.XPath('.//td'),
+            'img_src': etree.XPath('.//img/@src')
+        }
+    return _xpaths
+
+
+def _parse_aufstellung_lxml(html) -> Tuple[Dict[str, List[Dict]], str]:
+    """lxml backend of parse_aufstellung_page()"""
+    import lxml.html
+    from lxml import etree
+    
+    xp = _lxml_xpaths()
+    players_by_team = {}
+    
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    try:
+        root = lxml.html.document_fromstring(html, parser=lxml.html.HTMLParser(encoding='utf-8'))
+    except (etree.ParserError, ValueError):
+        return players_by_team, "Unknown"
+    
+    def text(element, strip=True):
+        strings = xp['text'](element)
+        if strip:
+            return ''.join(s.strip() for s in strings)
+        return ''.join(strings)
+    
+    game_date = _match_game_date(text(root, strip=False))
+    
+    h3_list = xp['h3'](root)
+    names = [text(h3) for h3 in h3_list]
+    team_h3_pairs = [(h3_list[idx], names[idx]) for idx in _select_team_headings(names)]
+    
+    if len(team_h3_pairs) < 2:
+        return players_by_team, game_date
+    
+    team_table_pairs = []
+    for h3_elem, team_name in team_h3_pairs[:2]:
+        next_table = xp['next_table'](h3_elem)
+        if next_table:
+            team_table_pairs.append((team_name, next_table[0]))
+    
+    if len(team_table_pairs) < 2:
+        tables = xp['tables'](root)
+        if len(tables) < 2:
+            return players_by_team, game_date
+        
+        team_names = [name for _, name in team_h3_pairs[:2]]
+        for table_idx, table in enumerate(tables[:2]):
+            if table_idx < len(team_names):
+                team_table_pairs.append((team_names[table_idx], table))
+    
+    for team_name, table in team_table_pairs:
+        tbody = xp['tbody'](table)
+        rows = xp['rows'](tbody[0] if tbody else table)
+        
+        players = []
+        for row in rows:
+            cells = xp['cells'](row)
+            if len(cells) < 2:
+                continue
+            
+            name = text(cells[1])
+            if name in NON_PLAYER_NAMES:
+                continue
+            
+            texts = [text(cell) for cell in cells[2:4]]
+            card_sources = xp['img_src'](cells[4]) if len(cells) > 4 else []
+            players.append(_make_player(name, ['', ''] + texts, card_sources))
+        
+        if players:
+            players_by_team[team_name] = players
+    
+    return players_by_team, game_date
+
+
+def parse_spielbericht_link(html) -> Optional[str]:
+    """Find the Spielbericht download link (href as on the page) on a SPIELINFO page"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Look for link with "Spielbericht" text or href containing spielbericht
+    all_links = soup.find_all('a', href=True)
+
+    for link in all_links:
+        href = link.get('href', '').lower()
+        text = link.get_text(strip=True).lower()
+
+        # Look for "Spielbericht herunterladen" or similar
+        if 'spielbericht' in href or 'spielbericht' in text:
+            return link.get('href')
+
+    # Alternative: Look for any download link
+    for link in all_links:
+        href = link.get('href', '')
+        text = link.get_text(strip=True).lower()
+
+        if 'pdf' in href.lower() and ('download' in text or 'bericht' in text):
+            return link.get('href')
+
+    return None
+
+
+def parse_report_pdf_url(html) -> Optional[str]:
+    """Find the spo.handball4all.de report / PDF URL on the page behind the Spielbericht link"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    all_links = soup.find_all('a', href=True)
+
+    for link in all_links:
+        href = link.get('href', '')
+        # Look for spo.handball4all.de PDF reports or direct PDF links
+        if 'spo.handball4all.de' in href or href.endswith('.pdf'):
+            return href
+
+    # Sometimes the link is only in JavaScript, a form or a data attribute
+    spo_links = re.findall(r'https?://spo\.handball4all\.de[^\s"\'<>]+', html)
+    if spo_links:
+        return spo_links[0]
+
+    return None
+
+
+def parse_officials(html) -> Optional[Dict[str, List[str]]]:
+    """
+    Extract officials (Schiedsrichter, Zeitnehmer, Sekretär) from a SPIELINFO page.
+
+    Returns:
+        dict with keys: 'referees', 'timekeepers', 'secretaries' (or None if not found)
+    """
+    if state_extraction_enabled():
+        officials = parse_officials_state(html)
+        if officials:
+            return _checked_state('officials', officials, lambda: _parse_officials_dom(html))
+    return _parse_officials_dom(html)
+
+
+def _parse_officials_dom(html) -> Optional[Dict[str, List[str]]]:
+    """DOM fallback of parse_officials(): category and name divs of the officials list"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    officials = {
+        'referees': [],
+        'timekeepers': [],
+        'secretaries': []
+    }
+
+    # Strategy 1: Look for <li class="w-full"> elements with category + name divs
+    list_items = soup.find_all('li', class_='w-full')
+
+    for li in list_items:
+        divs = li.find_all('div')
+        if len(divs) >= 2:
+            category_div = divs[0]
+            name_div = divs[1]
+
+            category_text = category_div.get_text(strip=True)
+            name_text = name_div.get_text(strip=True)
+
+            if not category_text or not name_text:
+                continue
+
+            # Validate: category must have official keywords, name must NOT
+            has_category_keyword = any(kw in category_text for kw in OFFICIAL_KEYWORDS)
+            has_name_keyword = any(kw in name_text for kw in OFFICIAL_KEYWORDS)
+
+            if not has_category_keyword or has_name_keyword:
+                continue
+
+            # Clean up concatenated names like "MarcBeck" → "Marc Beck"
+            name_text = re.sub(r'([a-z])([A-Z])', r'\1 \2', name_text)
+
+            # Add to officials
+            if 'Schiedsrichter' in category_text:
+                officials['referees'].append(name_text)
+            elif 'Zeitnehmer' in category_text:
+                officials['timekeepers'].append(name_text)
+            elif 'Sekretär' in category_text or 'Sekreter' in category_text:
+                officials['secretaries'].append(name_text)
+
+    # Return officials only if we found any valid ones (not labels)
+    if officials['referees'] or officials['timekeepers'] or officials['secretaries']:
+        # Final filter: remove any remaining labels
+        officials['referees'] = [r for r in officials['referees'] if 'Schiedsrichter' not in r and 'Zeitnehmer' not in r and 'Sekretär' not in r]
+        officials['timekeepers'] = [t for t in officials['timekeepers'] if 'Schiedsrichter' not in t and 'Zeitnehmer' not in t and 'Sekretär' not in t]
+        officials['secretaries'] = [s for s in officials['secretaries'] if 'Schiedsrichter' not in s and 'Zeitnehmer' not in s and 'Sekretär' not in s]
+
+        if officials['referees'] or officials['timekeepers'] or officials['secretaries']:
+            return officials
+
+    return None
@@ -6,7 +6,13 @@ import re
 import requests
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utility import metrics
+from utility.log import get_logger
+from utility.player_index import PlayerIndex, normalize_player_name
+
+logger = get_logger(__name__)
 
 try:
     import pdfplumber
@@ -14,19 +20,87 @@ except ImportError:
     pdfplumber = None
 
 
-def extract_seven_meters_from_pdf(pdf_url: str, base_url: str = "https://www.handball.net", verify_ssl: bool = True) -> Dict[str, Dict[str, int]]:
+# "SPIELER (NUMBER, TEAM)" after an action; the name may contain hyphens,
+# apostrophes and line breaks, so it runs up to the opening parenthesis
+PLAYER_REF = r'\s+([^()]+?)\s*\((\d+),\s*([^)]+)\)'
+
+
+def _clean_name(name: str) -> str:
+    """Player name from a PDF cell with line breaks and double spaces collapsed"""
+    return ' '.join(name.split())
+
+
+# Replaces the HTTP download when set (see utility.replay)
+_pdf_fetcher: Optional[Callable[[str], Tuple[str, bytes]]] = None
+
+
+def set_pdf_fetcher(fetcher: Optional[Callable[[str], Tuple[str, bytes]]]):
+    """
+    Route PDF downloads through fetcher(url) -> (content_type, content).
+
+    Used to record PDFs into a replay corpus or serve them from one.
+    None restores plain requests.get.
+    """
+    global _pdf_fetcher
+    _pdf_fetcher = fetcher
+
+
+def http_fetch_pdf(pdf_url: str) -> Tuple[str, bytes]:
+    """Download pdf_url, returns (content_type, content)"""
+    response = requests.get(pdf_url, timeout=10, verify=True, allow_redirects=True)
+    response.raise_for_status()
+    return response.headers.get('content-type', ''), response.content
+
+
+def http_pdf_fetcher(session) -> Callable[[str], Tuple[str, bytes]]:
+    """PDF fetcher for set_pdf_fetcher() downloading through session (e.g. logged in)"""
+
+    def fetch(pdf_url: str) -> Tuple[str, bytes]:
+        response = session.get(pdf_url, timeout=10, allow_redirects=True)
+        response.raise_for_status()
+        return response.headers.get('content-type', ''), response.content
+
+    return fetch
+
+
+def _download_pdf(pdf_url: str) -> Optional[bytes]:
+    """PDF bytes of pdf_url, None if the response is not a PDF"""
+    with metrics.timer('pdf.download'):
+        content_type, content = (_pdf_fetcher or http_fetch_pdf)(pdf_url)
+    metrics.add_bytes('pdf', len(content))
+    if 'pdf' not in content_type.lower() and not content.startswith(b'%PDF'):
+        return None
+    return content
+
+
+def download_report_pdf(pdf_url: str, base_url: str = "https://www.handball.net") -> Optional[bytes]:
+    """
+    Download a Spielbericht once, for both extract_*_from_pdf functions.
+    
+    Returns:
+        PDF bytes, None if the response is not a PDF; HTTP errors (e.g. 404)
+        are raised
+    """
+    if pdf_url.startswith('/'):
+        pdf_url = base_url + pdf_url
+    return _download_pdf(pdf_url)
+
+
+def extract_seven_meters_from_pdf(pdf_url: str, base_url: str = "https://www.handball.net", verify_ssl: bool = True,
+                                  content: Optional[bytes] = None) -> Dict[str, Dict[str, int]]:
     """
     Download and parse Spielbericht PDF to extract seven meter data.
     
     Handles both direct PDF URLs and spo.handball4all.de report URLs.
     Uses SSL certificate from environment (REQUESTS_CA_BUNDLE) if set.
+    Pass content (see download_report_pdf) to parse without downloading.
     
     Returns:
         Dict with player names as keys and {'attempts': int, 'goals': int} as values
     """
     
     if pdfplumber is None:
-        print("    ⚠️  pdfplumber not installed, skipping PDF parsing")
+        logger.warning("    ⚠️  pdfplumber not installed, skipping PDF parsing")
         return {}
     
     try:
@@ -36,21 +110,21 @@ def extract_seven_meters_from_pdf(pdf_url: str, base_url: str = "https://www.han
         
         # Download PDF - certificate is configured via environment variable
         # For spo.handball4all.de, we may need to allow redirects
-        response = requests.get(pdf_url, timeout=10, verify=True, allow_redirects=True)
-        response.raise_for_status()
+        if content is None:
+            content = _download_pdf(pdf_url)
         
         # Check if we actually got a PDF
-        content_type = response.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type and not response.content.startswith(b'%PDF'):
+        if content is None:
             return {}
         
         # Create temporary file for PDF
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(response.content)
+            tmp.write(content)
             tmp_path = tmp.name
         
         try:
-            seven_meter_data = _parse_pdf(tmp_path)
+            with metrics.timer('pdf.parse_7m'):
+                seven_meter_data = _parse_pdf(tmp_path)
             return seven_meter_data
         finally:
             # Clean up
@@ -58,7 +132,7 @@ def extract_seven_meters_from_pdf(pdf_url: str, base_url: str = "https://www.han
     
     except Exception as e:
         # Log the error for debugging
-        print(f"    ⚠️  PDF download/parsing failed: {str(e)[:80]}")
+        logger.warning(f"    ⚠️  PDF download/parsing failed: {str(e)[:80]}")
         return {}
 
 
@@ -67,7 +141,9 @@ def _parse_pdf(pdf_path: str) -> Dict[str, Dict[str, int]]:
     Parse PDF file and extract seven meter data.
     
     Looks for table entries with "7m" in the action column.
-    Counts attempts (successful and failed) and goals per player.
+    Counts attempts (successful and failed) and goals per player; entries
+    also carry the jersey number and team abbreviation when the action
+    names them ("SPIELER (NUMBER, TEAM)").
     """
     
     seven_meter_data = {}
@@ -95,28 +171,24 @@ def _parse_pdf(pdf_path: str) -> Dict[str, Dict[str, int]]:
                         # Initialize player data if needed
                         # First, try to extract player name from the action
                         player_name = None
+                        number = None
+                        team_abbrev = None
                         is_goal = False
                         
                         # Parse seven meter actions
-                        if "7m-Tor durch" in aktion:
-                            # Successful seven meter: "7m-Tor durch SPIELER"
-                            match = re.search(
-                                r'7m-Tor durch\s+(\w+\s+\w+)',
-                                aktion
-                            )
+                        if "7m-Tor durch" in aktion or "7m, KEIN Tor durch" in aktion:
+                            # "7m-Tor durch SPIELER (NUMBER, TEAM)" / "7m, KEIN Tor durch ..."
+                            is_goal = "7m-Tor durch" in aktion
+                            prefix = r'7m-Tor durch' if is_goal else r'7m, KEIN Tor durch'
+                            match = re.search(prefix + PLAYER_REF, aktion)
                             if match:
-                                player_name = match.group(1)
-                                is_goal = True
-                        
-                        elif "7m, KEIN Tor durch" in aktion:
-                            # Failed seven meter: "7m, KEIN Tor durch SPIELER"
-                            match = re.search(
-                                r'7m, KEIN Tor durch\s+(\w+\s+\w+)',
-                                aktion
-                            )
-                            if match:
-                                player_name = match.group(1)
-                                is_goal = False
+                                player_name = _clean_name(match.group(1))
+                                number = int(match.group(2))
+                                team_abbrev = match.group(3).strip()
+                            else:
+                                match = re.search(prefix + r'\s+(\w+\s+\w+)', aktion)
+                                if match:
+                                    player_name = match.group(1)
                         
                         elif "7m" in aktion:
                             # Other 7m actions - try to find player name
@@ -141,8 +213,13 @@ def _parse_pdf(pdf_path: str) -> Dict[str, Dict[str, int]]:
                             if player_name not in seven_meter_data:
                                 seven_meter_data[player_name] = {
                                     'attempts': 0,
-                                    'goals': 0
+                                    'goals': 0,
+                                    'number': None,
+                                    'team_abbrev': None
                                 }
+                            entry = seven_meter_data[player_name]
+                            entry['number'] = entry['number'] or number
+                            entry['team_abbrev'] = entry['team_abbrev'] or team_abbrev
                             seven_meter_data[player_name]['attempts'] += 1
                             if is_goal:
                                 seven_meter_data[player_name]['goals'] += 1
@@ -151,46 +228,47 @@ def _parse_pdf(pdf_path: str) -> Dict[str, Dict[str, int]]:
             pass
     
     except Exception as e:
-        print(f"    ⚠️  PDF parsing error: {str(e)[:60]}")
+        logger.warning(f"    ⚠️  PDF parsing error: {str(e)[:60]}")
     
     return seven_meter_data
 
 
-def extract_goals_timeline_from_pdf(pdf_url: str, base_url: str = "https://www.handball.net", verify_ssl: bool = True) -> List[Dict]:
+def extract_goals_timeline_from_pdf(pdf_url: str, base_url: str = "https://www.handball.net", verify_ssl: bool = True,
+                                    content: Optional[bytes] = None) -> List[Dict]:
     """
     Download and parse Spielbericht PDF to extract goal timeline.
+    Pass content (see download_report_pdf) to parse without downloading.
     
     Returns:
         List of goals with {minute, second, scorer, team, seven_meter}
     """
     
     if pdfplumber is None:
-        print("    ⚠️  pdfplumber not installed, skipping goal timeline extraction")
+        logger.warning("    ⚠️  pdfplumber not installed, skipping goal timeline extraction")
         return []
     
     try:
         if pdf_url.startswith('/'):
             pdf_url = base_url + pdf_url
         
-        response = requests.get(pdf_url, timeout=10, verify=True, allow_redirects=True)
-        response.raise_for_status()
-        
-        content_type = response.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type and not response.content.startswith(b'%PDF'):
+        if content is None:
+            content = _download_pdf(pdf_url)
+        if content is None:
             return []
         
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(response.content)
+            tmp.write(content)
             tmp_path = tmp.name
         
         try:
-            goals = _extract_goals_from_pdf(tmp_path)
+            with metrics.timer('pdf.parse_goals'):
+                goals = _extract_goals_from_pdf(tmp_path)
             return goals
         finally:
             Path(tmp_path).unlink(missing_ok=True)
     
     except Exception as e:
-        print(f"    ⚠️  Goal timeline extraction failed: {str(e)[:80]}")
+        logger.warning(f"    ⚠️  Goal timeline extraction failed: {str(e)[:80]}")
         return []
 
 
@@ -202,6 +280,7 @@ def _extract_goals_from_pdf(pdf_path: str, home_team_abbrev: str = None, away_te
     Goal patterns:
       - "Tor durch SPIELER (NUMBER, TEAM)"
       - "7m-Tor durch SPIELER (NUMBER, TEAM)"
+    Each goal carries the scorer's name and jersey number.
     
     Args:
         pdf_path: Path to PDF file
@@ -235,26 +314,20 @@ def _extract_goals_from_pdf(pdf_path: str, home_team_abbrev: str = None, away_te
                         # Check if it's a goal (not 7m attempt that failed)
                         is_seven_meter = False
                         scorer = None
+                        number = None
                         team_abbrev = None
                         
                         if "7m-Tor durch" in aktion:
                             is_seven_meter = True
-                            match = re.search(
-                                r'7m-Tor durch\s+(\w+(?:\s+\w+)*)\s+\(\d+,\s*([^)]+)\)',
-                                aktion
-                            )
-                            if match:
-                                scorer = match.group(1).strip()
-                                team_abbrev = match.group(2).strip()
-                        
+                            match = re.search(r'7m-Tor durch' + PLAYER_REF, aktion)
                         elif "Tor durch" in aktion and "7m" not in aktion:
-                            match = re.search(
-                                r'Tor durch\s+(\w+(?:\s+\w+)*)\s+\(\d+,\s*([^)]+)\)',
-                                aktion
-                            )
-                            if match:
-                                scorer = match.group(1).strip()
-                                team_abbrev = match.group(2).strip()
+                            match = re.search(r'Tor durch' + PLAYER_REF, aktion)
+                        else:
+                            match = None
+                        if match:
+                            scorer = _clean_name(match.group(1))
+                            number = int(match.group(2))
+                            team_abbrev = match.group(3).strip()
                         
                         # Learn team abbreviations from first few goals
                         if scorer and team_abbrev:
@@ -276,6 +349,7 @@ def _extract_goals_from_pdf(pdf_path: str, home_team_abbrev: str = None, away_te
                                         'minute': minute,
                                         'second': second,
                                         'scorer': scorer,
+                                        'number': number,
                                         'team': team,
                                         'team_abbrev': team_abbrev,
                                         'seven_meter': is_seven_meter
@@ -284,25 +358,104 @@ def _extract_goals_from_pdf(pdf_path: str, home_team_abbrev: str = None, away_te
                                 pass
     
     except Exception as e:
-        print(f"    ⚠️  Goal extraction error: {str(e)[:60]}")
+        logger.warning(f"    ⚠️  Goal extraction error: {str(e)[:60]}")
     
     return goals
 
 
-def add_seven_meters_to_players(players: List[Dict], seven_meter_data: Dict) -> List[Dict]:
+def team_sides(goals: List[Dict], seven_meter_data: Dict, home_players: List[Dict],
+               away_players: List[Dict]) -> Dict[str, str]:
     """
-    Add seven meter statistics to player objects.
+    Side of each team abbreviation of a Spielbericht, by lineup names.
+    
+    The 'team' of a goal from _extract_goals_from_pdf assumes the first
+    scorer plays at home, which is wrong whenever the away team scores
+    first. Instead, each abbreviation goes to the lineup that more of its
+    scorers' (normalized) names appear in; if only one abbreviation is
+    decided that way, the other one plays on the other side.
+    
+    Returns:
+        {team_abbrev: 'home' | 'away'}, empty if the sides are not clear
     """
+    lineups = ({normalize_player_name(p.get('name', '')) for p in home_players},
+               {normalize_player_name(p.get('name', '')) for p in away_players})
+    named = [(goal.get('team_abbrev'), goal['scorer']) for goal in goals]
+    named += [(stats.get('team_abbrev'), name) for name, stats in seven_meter_data.items()]
     
-    for player in players:
-        name = player.get('name', '')
-        
-        if name in seven_meter_data:
-            stats = seven_meter_data[name]
-            player['seven_meters'] = stats['attempts']
-            player['seven_meters_goals'] = stats['goals']
+    votes = {}
+    for abbrev, name in named:
+        if not abbrev:
+            continue
+        key = normalize_player_name(name)
+        vote = votes.setdefault(abbrev, [0, 0])
+        vote[0] += key in lineups[0]
+        vote[1] += key in lineups[1]
+    
+    sides = {abbrev: 'home' if home > away else 'away' for abbrev, (home, away) in votes.items() if home != away}
+    if len(set(sides.values())) < len(sides):
+        return {}  # two abbreviations on one side
+    undecided = [abbrev for abbrev in votes if abbrev not in sides]
+    if len(sides) == 1 and len(undecided) == 1:
+        sides[undecided[0]] = 'away' if 'home' in sides.values() else 'home'
+    return sides
+
+
+def split_seven_meters_by_side(seven_meter_data: Dict, sides: Dict[str, str]) -> Dict[str, Dict]:
+    """
+    Split seven meter data into the home and away team's entries.
+    
+    Args:
+        seven_meter_data: Result of extract_seven_meters_from_pdf
+        sides: Side of each team abbreviation (see team_sides)
+    
+    Entries whose side is unknown go to both teams without jersey number,
+    so they can only match by name.
+    
+    Returns:
+        {'home': {name: stats}, 'away': {name: stats}}
+    """
+    split = {'home': {}, 'away': {}}
+    for name, stats in seven_meter_data.items():
+        side = sides.get(stats.get('team_abbrev'))
+        if side is not None:
+            split[side][name] = stats
         else:
-            player['seven_meters'] = 0
-            player['seven_meters_goals'] = 0
+            for entries in split.values():
+                entries[name] = dict(stats, number=None)
+    return split
+
+
+def add_seven_meters_to_players(players: List[Dict], seven_meter_data: Dict, team: Optional[str] = None,
+                                index: Optional[PlayerIndex] = None) -> List[Dict]:
+    """
+    Add seven meter statistics to player objects.
+    
+    seven_meter_data must only hold the entries of the players' team (see
+    split_seven_meters_by_side). PDF names are matched by normalized name
+    (case, umlauts and word order do not matter). With team and the
+    league's PlayerIndex (players carry player_id), a name that does not
+    match is looked up by jersey number, and the numbers of matched players
+    are remembered for later games.
+    """
+    by_name = {}
+    by_id = {}
+    for player in players:
+        player['seven_meters'] = 0
+        player['seven_meters_goals'] = 0
+        by_name.setdefault(normalize_player_name(player.get('name', '')), player)
+        if player.get('player_id') is not None:
+            by_id[player['player_id']] = player
+    
+    for pdf_name, stats in seven_meter_data.items():
+        number = stats.get('number')
+        player = by_name.get(normalize_player_name(pdf_name))
+        if player is None and index is not None and team and number is not None:
+            player = by_id.get(index.find(pdf_name, team, number))
+        if player is None:
+            continue
+        player['seven_meters'] += stats['attempts']
+        player['seven_meters_goals'] += stats['goals']
+        if index is not None and team and number is not None and player.get('player_id') is not None:
+            index.add_number(player['player_id'], team, number)
     
     return players
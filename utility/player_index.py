@@ -0,0 +1,131 @@
+"""
+Stable integer IDs for the players of a league.
+
+Lineup pages, Spielbericht PDFs and the season statistics all refer to a
+player by a name string, spelled slightly differently depending on the
+source ("Max Müller" in the lineup, "Müller, Max" or "Mueller Max" in a
+PDF). PlayerIndex gives every player one ID, keyed on the normalized name
+(case, umlauts, punctuation and word order do not matter) and the team,
+and remembers the jersey numbers the PDFs name for it. Joins of PDF stats
+to lineup players are then dict lookups: by name key, else by (team,
+jersey number) for a spelling the name key does not cover.
+
+IDs are assigned as games are scraped, written into the saved games
+(player_id of players and goals) and kept in
+frontend/public/data/spielplan/<liga>.players.json, so a player keeps its
+ID for the whole season.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utility.log import get_logger
+from utility.spielplan_cache import CACHE_DIR
+from utility.team_registry import normalize_team_name
+
+logger = get_logger(__name__)
+
+
+def normalize_player_name(name: str) -> str:
+    """Key of a player name: normalized like team names, words in sorted order"""
+    return ' '.join(sorted(normalize_team_name(name).split()))
+
+
+class PlayerIndex:
+    """Player IDs of one league by (team, name) and (team, jersey number)"""
+
+    def __init__(self, liga_id: Optional[str] = None, cache_dir: Path = CACHE_DIR):
+        """
+        Args:
+            liga_id: League whose index is loaded and saved; None keeps it
+                     in memory only (e.g. sample runs)
+        """
+        self.path = Path(cache_dir) / f"{liga_id}.players.json" if liga_id else None
+        self.players: Dict[int, Dict] = {}
+        self.next_id = 1
+        self._by_name: Dict[Tuple[str, str], int] = {}
+        self._by_number: Dict[Tuple[str, int], int] = {}
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.players = {int(player_id): entry for player_id, entry in data.get('players', {}).items()}
+                self.next_id = data.get('next_id', max(self.players, default=0) + 1)
+            except Exception as e:
+                logger.warning(f"   ⚠️  Spieler-Index nicht lesbar ({e}), wird neu angelegt")
+                self.players = {}
+        for player_id, entry in self.players.items():
+            team_key = normalize_team_name(entry['team'])
+            self._by_name[(team_key, normalize_player_name(entry['name']))] = player_id
+            for number in entry.get('numbers', []):
+                self._by_number[(team_key, number)] = player_id
+
+    def find(self, name: str, team: str, number: Optional[int] = None) -> Optional[int]:
+        """ID of a player by name, else by jersey number; None if unknown"""
+        team_key = normalize_team_name(team)
+        player_id = self._by_name.get((team_key, normalize_player_name(name)))
+        if player_id is None and number is not None:
+            player_id = self._by_number.get((team_key, number))
+        return player_id
+
+    def player_id(self, name: str, team: str) -> int:
+        """ID of a player, assigning the next free one to a new player"""
+        key = (normalize_team_name(team), normalize_player_name(name))
+        player_id = self._by_name.get(key)
+        if player_id is None:
+            player_id = self.next_id
+            self.next_id += 1
+            self.players[player_id] = {'name': name, 'team': team, 'numbers': []}
+            self._by_name[key] = player_id
+            self._dirty = True
+        return player_id
+
+    def add_number(self, player_id: int, team: str, number: int):
+        """Remember the jersey number a Spielbericht names for a player"""
+        entry = self.players[player_id]
+        if number not in entry['numbers']:
+            entry['numbers'].append(number)
+            self._dirty = True
+        self._by_number[(normalize_team_name(team), number)] = player_id
+
+    def assign(self, players: Iterable[Dict], team: str):
+        """Set player_id on the lineup players of team"""
+        for player in players:
+            player['player_id'] = self.player_id(player['name'], team)
+
+    def link_goals(self, goals: List[Dict], home_team: str, away_team: str, sides: Dict[str, str]):
+        """
+        Set player_id on goals of the Spielbericht timeline (None if the
+        scorer is not known).
+
+        A goal whose team abbreviation has a known side (see
+        utility.pdf_parser.team_sides) is looked up in that team only, also
+        by jersey number; otherwise by name in both teams.
+        """
+        for goal in goals:
+            side = sides.get(goal.get('team_abbrev'))
+            if side is not None:
+                team = home_team if side == 'home' else away_team
+                candidates = [(team, goal.get('number'))]
+            else:
+                candidates = [(home_team, None), (away_team, None)]
+            goal['player_id'] = None
+            for team, number in candidates:
+                player_id = self.find(goal['scorer'], team, number)
+                if player_id is not None:
+                    goal['player_id'] = player_id
+                    if number is not None:
+                        self.add_number(player_id, team, number)
+                    break
+
+    def save(self):
+        """Write the index if it changed (no-op without liga_id)"""
+        if not self._dirty or self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'next_id': self.next_id, 'players': {str(k): v for k, v in sorted(self.players.items())}},
+                      f, ensure_ascii=False, indent=2)
+        self._dirty = False
@@ -0,0 +1,156 @@
+"""
+Browser-free pre-check: did any Spielplan change since the last run?
+
+Before Chrome is started, each league's Spielplan pages are requested over
+plain HTTP. Pages seen before are requested conditionally (If-None-Match /
+If-Modified-Since with the validators kept in the SpielplanCache); if all of
+them answer 304 the league is unchanged without downloading anything.
+Otherwise the pages are loaded in full and parsed like in the browser (the
+games are part of the embedded page state) and diffed against the cache.
+
+A league whose Spielplan cannot be fetched or parsed this way counts as
+changed, so the browser run decides. If no league changed, the scraper
+exits before starting Chrome and the CI workflow skips graphics, flow
+statistics and Excel (see write_ci_output).
+"""
+
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+from utility import log
+from utility import metrics
+from utility import scraping
+from utility.log import get_logger
+from utility.negative_cache import NegativeCache
+from utility.spielplan_cache import SpielplanCache, count_changes, describe_changes
+
+logger = get_logger(__name__)
+
+# fetch(url, request_headers) -> (status, response_headers, body)
+Fetcher = Callable[[str, Dict[str, str]], Tuple[int, Dict[str, str], bytes]]
+
+REQUEST_TIMEOUT = 15
+USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0 Safari/537.36')
+
+
+def http_fetcher(verify=True) -> Fetcher:
+    """Fetcher using one pooled requests.Session"""
+    import requests
+
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+
+    def fetch(url: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, verify=verify)
+        return response.status_code, dict(response.headers), response.content
+
+    return fetch
+
+
+def conditional_headers(validator: Dict) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since for a stored validator"""
+    headers = {}
+    if validator.get('etag'):
+        headers['If-None-Match'] = validator['etag']
+    if validator.get('last_modified'):
+        headers['If-Modified-Since'] = validator['last_modified']
+    return headers
+
+
+def response_validator(headers: Dict[str, str]) -> Optional[Dict]:
+    """ETag / Last-Modified of a response (None if it has neither)"""
+    lowered = {key.lower(): value for key, value in headers.items()}
+    validator = {'etag': lowered.get('etag'), 'last_modified': lowered.get('last-modified')}
+    return validator if any(validator.values()) else None
+
+
+def precheck_league(fetch: Fetcher, league_config: dict) -> Optional[dict]:
+    """
+    Decide over HTTP whether a league's Spielplan changed.
+
+    Returns:
+        None if the Spielplan could not be checked without a browser, else
+        a dict like scraping.check_spielplan() (games, diff, changes,
+        retries, cache) plus validators; games and diff are None if every
+        page answered 304 Not Modified
+    """
+    league_name = league_config['name']
+    cache = SpielplanCache(league_name)
+    negative = NegativeCache(league_name)
+
+    # Due retries need the games, so they skip the conditional shortcut
+    if cache.validators and cache.rows and not negative.due(set(cache.rows)):
+        not_modified = True
+        for url, validator in cache.validators.items():
+            with metrics.timer('fetch.spielplan_http'):
+                status, _, _ = fetch(url, conditional_headers(validator))
+            if status != 304:
+                not_modified = False
+                break
+        if not_modified:
+            metrics.count('precheck.not_modified')
+            logger.info(f"   🗓️  {league_name}: unverändert (304)")
+            return {'games': None, 'diff': None, 'changes': 0, 'retries': 0, 'cache': cache,
+                    'validators': cache.validators}
+
+    validators = {}
+
+    def load_page(url: str) -> str:
+        with metrics.timer('fetch.spielplan_http'):
+            status, headers, body = fetch(url, {})
+        if status != 200:
+            raise RuntimeError(f"HTTP {status} für {url}")
+        metrics.add_bytes('html', len(body))
+        validator = response_validator(headers)
+        if validator:
+            validators[url] = validator
+        return body.decode('utf-8', errors='replace')
+
+    games = scraping.collect_spielplan_games(load_page, f"handball4all.baden-wuerttemberg.{league_name}")
+    if not games:
+        # Rendered by JavaScript only: leave the decision to the browser
+        logger.info(f"   🗓️  {league_name}: ohne Browser nicht lesbar")
+        return None
+
+    diff = cache.diff(games)
+    changes = count_changes(diff)
+    retries = len(negative.due({g['game_id'] for g in games}))
+    if changes:
+        logger.info(f"   🗓️  {league_name}: {describe_changes(diff)}")
+    else:
+        logger.info(f"   🗓️  {league_name}: unverändert")
+        if validators and validators != cache.validators:
+            # Same games, so the next run can ask conditionally
+            cache.save(games, validators)
+    if retries:
+        logger.info(f"   🔁 {league_name}: {retries} Spiel(e) ohne Aufstellung/Bericht erneut fällig")
+    return {'games': games, 'diff': diff, 'changes': changes, 'retries': retries, 'cache': cache,
+            'validators': validators}
+
+
+def precheck_leagues(fetch: Fetcher, leagues: list) -> Dict[str, Optional[dict]]:
+    """
+    precheck_league() for every league; a failing league yields None.
+
+    Returns:
+        league name -> result (None = unknown, scrape with the browser)
+    """
+    results = {}
+    for league_config in leagues:
+        with metrics.league(league_config['name'], 'league.precheck'), log.context(league=league_config['name']):
+            try:
+                results[league_config['name']] = precheck_league(fetch, league_config)
+            except Exception as e:
+                logger.warning(f"   ⚠️  {league_config['name']}: Vorabprüfung fehlgeschlagen ({str(e)[:80]})")
+                metrics.count('precheck.failed')
+                results[league_config['name']] = None
+    return results
+
+
+def write_ci_output(changed: bool):
+    """Expose changed=true|false as step output when running in GitHub Actions"""
+    output_file = os.environ.get('GITHUB_OUTPUT')
+    if output_file:
+        with open(output_file, 'a', encoding='utf-8') as f:
+            f.write(f"changed={'true' if changed else 'false'}\n")
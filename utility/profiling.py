@@ -0,0 +1,187 @@
+"""
+Opt-in profiling for the scraper and report scripts (--profile).
+
+A ProfileSession profiles each stage (usually one league) separately and
+writes everything to output/profiles/<name>-<timestamp>/:
+
+    <stage>.pstats / <stage>.collapsed   one file per stage
+    all.pstats / all.collapsed          all stages combined
+    top.txt                             hottest functions of the whole run
+
+Modes:
+    cprofile  deterministic, exact call counts; .pstats work with
+              snakeviz, gprof2dot or flameprof
+    sample    wall-clock stack sampling of the main thread (low overhead,
+              also shows time spent waiting); .collapsed is the folded
+              stack format of flamegraph.pl and speedscope
+
+Only the calling thread/process is profiled, so the scripts switch to
+--jobs 1 while profiling.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+PROFILE_MODES = ('cprofile', 'sample')
+PROFILE_DIR = Path('output/profiles')
+SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+
+
+def parse_profile_flag(arg: str) -> Optional[str]:
+    """
+    Profile mode of a command line argument.
+
+    Returns:
+        'cprofile' for --profile, the mode for --profile=MODE, None for
+        any other argument
+    """
+    if arg == '--profile':
+        return 'cprofile'
+    if arg.startswith('--profile='):
+        mode = arg.split('=', 1)[1].lower()
+        if mode not in PROFILE_MODES:
+            print(f"❌ Unbekannter Profiler: {mode} (erlaubt: {', '.join(PROFILE_MODES)})")
+            sys.exit(1)
+        return mode
+    return None
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed interval"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def write_collapsed(stacks: Counter, path: Path):
+    """Write stacks in folded format: 'outer;inner count' per line"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, samples in stacks.most_common():
+            f.write(f"{stack} {samples}\n")
+
+
+def top_functions_pstats(stats: pstats.Stats, top: int) -> List[str]:
+    """Hottest functions by own time: lines of a summary table"""
+    rows = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        rows.append((own, cumulative, calls, f"{name} ({os.path.basename(filename)}:{line})"))
+    rows.sort(reverse=True)
+    lines = [f"{'eigen s':>9s} {'kumul. s':>9s} {'Aufrufe':>9s}  Funktion"]
+    lines += [f"{own:9.3f} {cumulative:9.3f} {calls:9d}  {label}" for own, cumulative, calls, label in rows[:top]]
+    return lines
+
+
+def top_functions_samples(stacks: Counter, top: int, interval: float = SAMPLE_INTERVAL) -> List[str]:
+    """Hottest functions of a sample profile by own (leaf) and total samples"""
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, samples in stacks.items():
+        frames = stack.split(';')
+        own[frames[-1]] += samples
+        for frame in set(frames):
+            total[frame] += samples
+    lines = [f"{'eigen s':>9s} {'kumul. s':>9s} {'Proben':>9s}  Funktion"]
+    for label, samples in own.most_common(top):
+        lines.append(f"{samples * interval:9.3f} {total[label] * interval:9.3f} {samples:9d}  {label}")
+    return lines
+
+
+class ProfileSession:
+    """Profiles named stages of one run and writes their outputs"""
+
+    def __init__(self, name: str, mode: str = 'cprofile', top: int = 25, out_dir: Path = PROFILE_DIR):
+        self.name = name
+        self.mode = mode
+        self.top = top
+        self.out_dir = Path(out_dir) / f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._pstats_files: List[Path] = []
+        self._stacks: Counter = Counter()
+
+    def _stage_file(self, stage: str, suffix: str) -> Path:
+        safe = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in stage)
+        return self.out_dir / f"{safe}{suffix}"
+
+    def run(self, stage: str, func, *args, **kwargs):
+        """Call func(*args, **kwargs) profiled as stage, returns its result"""
+        if self.mode == 'sample':
+            sampler = StackSampler()
+            sampler.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sampler.stop()
+                write_collapsed(sampler.stacks, self._stage_file(stage, '.collapsed'))
+                self._stacks.update(sampler.stacks)
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            path = self._stage_file(stage, '.pstats')
+            profiler.dump_stats(str(path))
+            self._pstats_files.append(path)
+
+    def wrap(self, func, stage_key: str = 'name'):
+        """func(league, ...) profiled with the league's stage_key as stage name"""
+        def profiled(league, *args, **kwargs):
+            return self.run(str(league.get(stage_key, 'stage')), func, league, *args, **kwargs)
+        return profiled
+
+    def finish(self) -> Optional[Path]:
+        """Write the combined profile and top.txt, print the hot functions"""
+        if self.mode == 'sample':
+            if not self._stacks:
+                return None
+            write_collapsed(self._stacks, self.out_dir / 'all.collapsed')
+            lines = top_functions_samples(self._stacks, self.top)
+        else:
+            if not self._pstats_files:
+                return None
+            stats = pstats.Stats(*[str(path) for path in self._pstats_files], stream=io.StringIO())
+            stats.dump_stats(str(self.out_dir / 'all.pstats'))
+            lines = top_functions_pstats(stats, self.top)
+
+        with open(self.out_dir / 'top.txt', 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        print(f"\n🔬 Profil ({self.mode}): {self.out_dir}")
+        for line in lines:
+            print(f"   {line}")
+        return self.out_dir
@@ -0,0 +1,350 @@
+"""
+Record and replay handball.net traffic of a scraper run.
+
+Record: RecordingDriver wraps the Selenium driver and stores every page the
+scraper reads (rendered HTML and final URL) in a corpus directory; PDFs are
+recorded through utility.pdf_parser.set_pdf_fetcher(), the Spielbericht
+redirects through utility.report_urls.set_report_fetcher().
+
+Replay: ReplayDriver answers driver.get() from a corpus, either straight from
+disk or through serve_corpus(), a local stand-in HTTP server. Together with
+replay_pdf_fetcher() a whole scrape_daily() run works without network or
+browser (see bench/bench_scrape_replay.py); replay_report_fetcher() follows
+recorded Spielbericht redirects and replay_http_fetcher() answers the
+conditional requests of utility.precheck.
+
+Corpus layout:
+    index.json    {'meta': {...}, 'entries': {url: {file, final_url, content_type, kind}}}
+    pages/*.html  rendered pages (page_source)
+    pdfs/*.pdf    Spielbericht PDFs
+"""
+
+import hashlib
+import json
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+
+INDEX_FILE = 'index.json'
+EMPTY_PAGE = '<html><head></head><body></body></html>'
+FINAL_URL_HEADER = 'X-Replay-Final-Url'
+
+
+def page_kind(url: str) -> str:
+    """Page type of a handball.net URL: spielplan, aufstellung, info, report or other"""
+    path = urllib.parse.urlsplit(url).path
+    if path.endswith('/spielplan'):
+        return 'spielplan'
+    if path.endswith('/aufstellung'):
+        return 'aufstellung'
+    if path.endswith('/info'):
+        return 'info'
+    if path.lower().endswith('.pdf'):
+        return 'pdf'
+    if 'bericht' in path.lower() or 'report' in path.lower():
+        return 'report'
+    return 'other'
+
+
+def _request_key(url: str) -> str:
+    """Path and query of url, the lookup key of the stand-in server"""
+    parts = urllib.parse.urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else '')
+
+
+class Corpus:
+    """Recorded pages and PDFs of one or more scraper runs"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.meta: Dict = {}
+        self.entries: Dict[str, Dict] = {}
+        index_file = self.root / INDEX_FILE
+        if index_file.exists():
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self.meta = index.get('meta', {})
+            self.entries = index.get('entries', {})
+        self._by_key = {_request_key(url): url for url in self.entries}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _store(self, url: str, subdir: str, suffix: str, data: bytes) -> str:
+        """Write data for url, returns the path relative to the corpus root"""
+        name = f"{page_kind(url)}_{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}{suffix}"
+        path = self.root / subdir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return f"{subdir}/{name}"
+
+    def add_page(self, url: str, final_url: str, html: Optional[str] = None):
+        """Record a page; html None only updates the final URL"""
+        with self._lock:
+            entry = self.entries.setdefault(url, {
+                'file': None, 'final_url': url, 'content_type': 'text/html; charset=utf-8', 'kind': page_kind(url)
+            })
+            entry['final_url'] = final_url or url
+            if html is not None:
+                entry['file'] = self._store(url, 'pages', '.html', html.encode('utf-8'))
+            self._by_key[_request_key(url)] = url
+
+    def add_pdf(self, url: str, content_type: str, content: bytes):
+        """Record a downloaded PDF"""
+        with self._lock:
+            self.entries[url] = {
+                'file': self._store(url, 'pdfs', '.pdf', content),
+                'final_url': url,
+                'content_type': content_type,
+                'kind': 'pdf'
+            }
+            self._by_key[_request_key(url)] = url
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Entry of url (exact, else same path and query on any host)"""
+        entry = self.entries.get(url)
+        if entry is None and _request_key(url) in self._by_key:
+            entry = self.entries[self._by_key[_request_key(url)]]
+        return entry
+
+    def read(self, entry: Dict) -> bytes:
+        """Recorded body of an entry (an empty page if only the URL was seen)"""
+        if not entry.get('file'):
+            return EMPTY_PAGE.encode('utf-8')
+        return (self.root / entry['file']).read_bytes()
+
+    def save(self):
+        """Write index.json"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            index = {'meta': self.meta, 'entries': self.entries}
+            with open(self.root / INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2, ensure_ascii=False)
+
+
+def recording_meta(config: dict, leagues: list) -> Dict:
+    """Corpus meta data needed to replay a run: base URL, date range, leagues"""
+    return {
+        'base_url': config['ref']['base_url'],
+        'date_from': config['crawler']['date_from'],
+        'date_to': config['crawler']['date_to'],
+        'leagues': [
+            {'name': league['name'], 'display_name': league.get('display_name', league['name']),
+             'half_duration': league.get('half_duration', 30)}
+            for league in leagues
+        ],
+        'recorded_at': datetime.now().isoformat()
+    }
+
+
+class RecordingDriver:
+    """
+    Selenium driver proxy that records what the scraper reads.
+
+    Pages are stored when page_source is read (after the scraper's render
+    wait), the final URL whenever current_url is read. Everything else is
+    passed through to the wrapped driver.
+    """
+
+    def __init__(self, driver, corpus: Corpus):
+        self._driver = driver
+        self.corpus = corpus
+        self._url = None
+
+    def get(self, url: str):
+        self._url = url
+        self._driver.get(url)
+        self.corpus.add_page(url, self._driver.current_url)
+
+    @property
+    def page_source(self) -> str:
+        html = self._driver.page_source
+        if self._url:
+            self.corpus.add_page(self._url, self._driver.current_url, html)
+        return html
+
+    @property
+    def current_url(self) -> str:
+        final_url = self._driver.current_url
+        if self._url:
+            self.corpus.add_page(self._url, final_url)
+        return final_url
+
+    def quit(self):
+        self.corpus.save()
+        self._driver.quit()
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def recording_pdf_fetcher(corpus: Corpus) -> Callable[[str], Tuple[str, bytes]]:
+    """PDF fetcher for set_pdf_fetcher() that downloads and records"""
+    from utility.pdf_parser import http_fetch_pdf
+
+    def fetch(url: str) -> Tuple[str, bytes]:
+        content_type, content = http_fetch_pdf(url)
+        corpus.add_pdf(url, content_type, content)
+        return content_type, content
+
+    return fetch
+
+
+def recording_report_fetcher(corpus: Corpus, verify=True, session=None) -> Callable[[str, str], Tuple[int, str, bytes]]:
+    """Report fetcher for set_report_fetcher() that follows redirects over HTTP and records them"""
+    from utility.report_urls import http_report_fetcher
+
+    http_fetch = http_report_fetcher(verify, session)
+
+    def fetch(url: str, method: str) -> Tuple[int, str, bytes]:
+        status, final_url, body = http_fetch(url, method)
+        if status < 400:
+            corpus.add_page(url, final_url, body.decode('utf-8', errors='replace') if method == 'GET' else None)
+        return status, final_url, body
+
+    return fetch
+
+
+class ReplaySource:
+    """Answers URLs from a corpus, from disk or via the stand-in server"""
+
+    def __init__(self, corpus: Corpus, server_url: Optional[str] = None):
+        self.corpus = corpus
+        self.server_url = server_url.rstrip('/') if server_url else None
+        self.served = 0
+        self.misses = []
+
+    def fetch(self, url: str) -> Optional[Tuple[str, bytes, str]]:
+        """(content_type, body, final_url) of url, None if it was not recorded"""
+        if self.server_url:
+            try:
+                with urllib.request.urlopen(self.server_url + _request_key(url), timeout=10) as response:
+                    result = (response.headers.get('Content-Type', ''), response.read(),
+                              response.headers.get(FINAL_URL_HEADER, url))
+            except urllib.error.HTTPError as e:
+                if e.code != 404:
+                    raise
+                result = None
+        else:
+            entry = self.corpus.lookup(url)
+            result = (entry['content_type'], self.corpus.read(entry), entry['final_url']) if entry else None
+
+        if result is None:
+            self.misses.append(url)
+        else:
+            self.served += 1
+        return result
+
+
+class ReplayDriver:
+    """Minimal stand-in for the Selenium driver, serving a recorded corpus"""
+
+    def __init__(self, source: ReplaySource):
+        self.source = source
+        self.page_source = EMPTY_PAGE
+        self.current_url = 'about:blank'
+
+    def get(self, url: str):
+        result = self.source.fetch(url)
+        if result is None:
+            # Unknown pages render empty, like a game without lineup
+            self.page_source, self.current_url = EMPTY_PAGE, url
+            return
+        _, body, final_url = result
+        self.page_source = body.decode('utf-8', errors='replace')
+        self.current_url = final_url
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        pass
+
+
+def replay_pdf_fetcher(source: ReplaySource) -> Callable[[str], Tuple[str, bytes]]:
+    """PDF fetcher for set_pdf_fetcher() that serves recorded PDFs"""
+
+    def fetch(url: str) -> Tuple[str, bytes]:
+        result = source.fetch(url)
+        if result is None:
+            raise FileNotFoundError(f"PDF not in replay corpus: {url}")
+        content_type, body, _ = result
+        return content_type, body
+
+    return fetch
+
+
+def replay_report_fetcher(source: ReplaySource) -> Callable[[str, str], Tuple[int, str, bytes]]:
+    """Report fetcher for set_report_fetcher() that serves recorded redirects"""
+
+    def fetch(url: str, method: str) -> Tuple[int, str, bytes]:
+        result = source.fetch(url)
+        if result is None:
+            return 404, url, b''
+        _, body, final_url = result
+        return 200, final_url, body if method == 'GET' else b''
+
+    return fetch
+
+
+def replay_http_fetcher(source: ReplaySource):
+    """
+    Fetcher for utility.precheck that serves recorded pages, with an ETag
+    derived from the body and 304 answers to a matching If-None-Match.
+    """
+
+    def fetch(url: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        result = source.fetch(url)
+        if result is None:
+            return 404, {}, b''
+        content_type, body, _ = result
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if headers.get('If-None-Match') == etag:
+            return 304, {'ETag': etag}, b''
+        return 200, {'Content-Type': content_type, 'ETag': etag}, body
+
+    return fetch
+
+
+def serve_corpus(corpus: Corpus, port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start a local HTTP server answering recorded URLs by path and query.
+
+    Args:
+        corpus: Corpus to serve
+        port: Port on 127.0.0.1 (0 = any free port)
+
+    Returns:
+        (server, base URL); stop with server.shutdown()
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            entry = corpus.lookup(self.path)
+            if entry is None:
+                self.send_error(404)
+                return
+            body = corpus.read(entry)
+            self.send_response(200)
+            self.send_header('Content-Type', entry['content_type'])
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header(FINAL_URL_HEADER, entry['final_url'])
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
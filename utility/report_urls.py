@@ -0,0 +1,144 @@
+"""
+Resolved Spielbericht URLs per game, and the redirect hop over plain HTTP.
+
+The Spielbericht link on a game's SPIELINFO page leads through a redirect
+to the report on spo.handball4all.de. Once a game has a report its URL does
+not change, so the resolved URL is kept per league in
+frontend/public/data/spielplan/<liga>.reports.json and the PDF stage uses
+it directly from then on, without loading the info page again.
+
+The redirect itself is followed with a HEAD request (GET if the redirect
+does not end on the report host) instead of a browser navigation; a page
+that leads nowhere over HTTP is left to the browser. Like the
+PDF download, it goes through a replaceable fetcher (see set_report_fetcher)
+so replay and recording runs work the same way.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from utility import metrics
+from utility.log import get_logger
+from utility.parsing import parse_report_pdf_url
+from utility.spielplan_cache import CACHE_DIR
+
+logger = get_logger(__name__)
+
+# fetch(url, method) -> (status, final_url, body); body is empty for HEAD
+ReportFetcher = Callable[[str, str], Tuple[int, str, bytes]]
+
+REPORT_HOST = 'spo.handball4all.de'
+REQUEST_TIMEOUT = 10
+
+_report_fetcher: Optional[ReportFetcher] = None
+
+
+def set_report_fetcher(fetcher: Optional[ReportFetcher]):
+    """
+    Route the redirect hop through fetcher(url, method) -> (status, final_url, body).
+
+    Used to record the hop into a replay corpus or serve it from one.
+    None restores a plain requests session.
+    """
+    global _report_fetcher
+    _report_fetcher = fetcher
+
+
+def http_report_fetcher(verify=True, session=None) -> ReportFetcher:
+    """
+    Report fetcher using one pooled requests.Session that follows redirects.
+
+    Args:
+        verify: CA bundle or bool for a new session
+        session: Session to use instead (e.g. logged in, see utility.auth_manager)
+    """
+    if session is None:
+        import requests
+
+        from utility.precheck import USER_AGENT
+
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        session.verify = verify
+
+    def fetch(url: str, method: str) -> Tuple[int, str, bytes]:
+        response = session.request(method, url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+        return response.status_code, response.url, response.content if method == 'GET' else b''
+
+    return fetch
+
+
+def follow_report_link(spielbericht_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Report URL behind a Spielbericht link, without a browser.
+
+    Returns:
+        (url, None) if found; (None, 'report_404') if the link answers 404
+        or 410; (None, 'unresolved') if the page neither redirects to the
+        report nor links it (login page, JavaScript redirect), so a browser
+        has to follow it. Network and other HTTP errors are raised
+    """
+    global _report_fetcher
+    if _report_fetcher is None:
+        _report_fetcher = http_report_fetcher()
+
+    with metrics.timer('fetch.report_http'):
+        status, final_url, _ = _report_fetcher(spielbericht_url, 'HEAD')
+    if status in (404, 410):
+        return None, 'report_404'
+    if status < 400 and REPORT_HOST in final_url:
+        return final_url, None
+
+    # No redirect to the report (or HEAD not allowed): read the page
+    with metrics.timer('fetch.report_http'):
+        status, final_url, body = _report_fetcher(spielbericht_url, 'GET')
+    if status in (404, 410):
+        return None, 'report_404'
+    if status >= 400:
+        raise RuntimeError(f"HTTP {status} für {spielbericht_url}")
+    if REPORT_HOST in final_url:
+        return final_url, None
+    metrics.add_bytes('html', len(body))
+    with metrics.timer('parse.report'):
+        pdf_url = parse_report_pdf_url(body.decode('utf-8', errors='replace'))
+    return (pdf_url, None) if pdf_url else (None, 'unresolved')
+
+
+class ReportUrlCache:
+    """Resolved report URL of each game of one league"""
+
+    def __init__(self, liga_id: str, cache_dir: Path = CACHE_DIR):
+        self.path = Path(cache_dir) / f"{liga_id}.reports.json"
+        self.urls: Dict[str, str] = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.urls = json.load(f).get('games', {})
+            except Exception as e:
+                logger.warning(f"   ⚠️  Bericht-URL-Cache nicht lesbar ({e}), wird neu angelegt")
+
+    def get(self, game_id: str) -> Optional[str]:
+        """Cached report URL of game_id"""
+        return self.urls.get(game_id)
+
+    def put(self, game_id: str, url: str):
+        """Remember the resolved report URL of game_id"""
+        if self.urls.get(game_id) != url:
+            self.urls[game_id] = url
+            self._dirty = True
+
+    def drop(self, game_id: str):
+        """Forget game_id (its cached URL no longer leads to a report)"""
+        if self.urls.pop(game_id, None) is not None:
+            self._dirty = True
+
+    def save(self):
+        """Write the URLs if they changed"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'games': self.urls}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        self._dirty = False
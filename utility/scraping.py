@@ -0,0 +1,1139 @@
+"""
+Scraping workflow: Spielplan → game pages → Spielbericht PDF → yyyymmdd.json.
+
+Call configure(config) once before using the functions here; it sets the
+base URL, date range and SSL certificate that used to be module-level state
+of scraper.py. The Selenium driver is passed in by the caller (see
+utility.browser.setup_driver), this module never imports selenium.
+utility.pdf_parser (requests, pdfplumber) and the report link helpers are
+imported on first use, so importing this module stays cheap.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utility.parsing import (
+    parse_spielplan_page,
+    parse_date_to_yyyymmdd,
+    extract_players_from_aufstellung,
+    parse_spielbericht_link,
+    parse_report_pdf_url,
+    parse_officials
+)
+from utility.error_logger import ErrorLogger
+from utility.journal import GameJournal, write_spieltag_file
+from utility.spielplan_cache import SpielplanCache, CHANGE_KINDS, count_changes, describe_changes
+from utility.negative_cache import NegativeCache, REPORT_REASONS
+from utility.report_urls import ReportUrlCache
+from utility.team_registry import TeamRegistry
+from utility.player_index import PlayerIndex
+from utility import metrics
+from utility import log
+from utility.log import get_logger
+
+logger = get_logger(__name__)
+
+
+# Set by configure()
+CONFIG = None
+BASE_URL = None
+DATE_FROM = None
+DATE_TO = None
+resolved_cert_path = None
+
+# Multiplier for the fixed waits after driver.get() that give the page's
+# JavaScript time to render. A replayed corpus needs no waiting (0).
+WAIT_SCALE = 1.0
+
+# Time the pages were fetched; set when replaying a recorded corpus so that
+# "Sa, 20.09." resolves to the season of the recording (None = now)
+REFERENCE_TIME: Optional[datetime] = None
+
+# Scrape only a fixed random sample of this many games per league and do
+# not save them (profiling runs, see scraper.py --sample); None = all games
+GAME_SAMPLE: Optional[int] = None
+
+
+def _wait(seconds: float):
+    """Sleep seconds * WAIT_SCALE"""
+    if WAIT_SCALE > 0:
+        time.sleep(seconds * WAIT_SCALE)
+
+
+def _load(driver, url: str, kind: str, wait: float):
+    """driver.get(url) plus render wait, timed as fetch.<kind> and wait"""
+    with metrics.timer(f"fetch.{kind}"):
+        driver.get(url)
+    with metrics.timer('wait'):
+        _wait(wait)
+
+
+def _page_source(driver) -> str:
+    """Rendered HTML of the current page, counted as transferred html bytes"""
+    html = driver.page_source
+    metrics.add_bytes('html', len(html))
+    return html
+
+
+def configure(config: dict) -> Optional[str]:
+    """
+    Apply a loaded config: base URL, date range and SSL certificate.
+    
+    Args:
+        config: Parsed config/*.json
+    
+    Returns:
+        Resolved certificate path (None if not configured or missing)
+    """
+    global CONFIG, BASE_URL, DATE_FROM, DATE_TO, resolved_cert_path
+    
+    CONFIG = config
+    BASE_URL = config['ref']['base_url']
+    DATE_FROM = config['crawler']['date_from']
+    DATE_TO = config['crawler']['date_to']
+    
+    # Handle SSL configuration - use certificate if provided
+    ssl_config = config.get('ssl', {})
+    cert_path = ssl_config.get('cert_path', '')
+    
+    # Store cert_path for later (after ChromeDriver download)
+    resolved_cert_path = None
+    if cert_path:
+        cert_path = os.path.expanduser(cert_path)
+        if os.path.exists(cert_path):
+            resolved_cert_path = cert_path
+            # Disable requests warnings about SSL
+            import requests
+            requests.packages.urllib3.disable_warnings()
+            import urllib3
+            urllib3.disable_warnings()
+        else:
+            logger.warning(f"[WARNING] Certificate file not found: {cert_path}")
+    
+    # Ensure SSL bundle env vars are clean during driver setup
+    # We'll apply the certificate AFTER ChromeDriver is initialized
+    os.environ.pop('REQUESTS_CA_BUNDLE', None)
+    os.environ.pop('CURL_CA_BUNDLE', None)
+    
+    return resolved_cert_path
+
+
+def spielplan_url(league_id):
+    """Spielplan URL of a league for the configured date range (without page)"""
+    return f"{BASE_URL}/ligen/{league_id}/spielplan?dateFrom={DATE_FROM}&dateTo={DATE_TO}"
+
+
+def collect_spielplan_games(load_page, league_id):
+    """
+    Walk the Spielplan pages (page=1, page=2, ...) and collect all games.
+    
+    Args:
+        load_page: Callable url -> html of the page
+        league_id: Full league ID for handball4all
+    
+    Returns:
+        Games in Spielplan order with game_id, teams, date, score and order
+    """
+    games_with_teams = []
+    seen_ids = set()
+    order = 0
+    
+    base_url = spielplan_url(league_id)
+    page = 1
+    total_games = None
+    
+    while True:
+        logger.debug(f"📄 Loading Spielplan page {page}...")
+        
+        html = load_page(f"{base_url}&page={page}")
+        
+        with metrics.timer('parse.spielplan'):
+            page_total, parsed_games = parse_spielplan_page(html)
+        
+        # Extract total games count on first page
+        if total_games is None and page_total is not None:
+            total_games = page_total
+            logger.info(f"   ℹ️  Total games: {total_games}")
+        
+        page_games = []
+        for game in parsed_games:
+            if game['game_id'] in seen_ids:
+                continue
+            entry = {**game, 'order': order}
+            page_games.append(entry)
+            seen_ids.add(game['game_id'])
+            games_with_teams.append(entry)
+            order += 1
+        
+        logger.debug(f"  ✓ Found {len(page_games)} new games on page {page} (total: {len(games_with_teams)})")
+        
+        if len(page_games) == 0:
+            logger.debug(f"  ℹ️  No games found on this page, stopping")
+            break
+        
+        # Check if we should continue to next page
+        # If we have total_games count, check if we've reached it
+        if total_games and len(games_with_teams) >= total_games:
+            logger.debug(f"  ✓ Reached total game count ({total_games})")
+            break
+        
+        page += 1
+        if page > 20:  # Safety limit
+            logger.warning(f"  ⚠️  Reached page limit (20), stopping")
+            break
+    
+    return games_with_teams
+
+
+def extract_game_ids_from_spielplan(driver, league_id):
+    """Load Spielplan with pagination (page=1, page=2, etc) and extract all game IDs with teams, dates, and order"""
+    def load_page(url):
+        _load(driver, url, 'spielplan', 2)
+        return _page_source(driver)
+    
+    return collect_spielplan_games(load_page, league_id)
+
+
+def resolve_spielbericht_pdf_url(driver, game_id):
+    """
+    Find the Spielbericht PDF URL of a game, or why there is none.
+    
+    Navigates to /spiele/{game_id}/info (SPIELINFO tab) to find the PDF link.
+    The link leads through a redirect to the report, which is followed over
+    plain HTTP (see utility.report_urls); if that fails or does not reach
+    the report, the browser follows it instead.
+    
+    Returns:
+        (url, None) if found, else (None, reason): 'no_report_link' (info
+        page has no Spielbericht link), 'report_404' (the link leads to no
+        report) or 'error' (page load failed, worth retrying right away)
+    """
+    from utility.report_urls import follow_report_link
+    
+    try:
+        # Navigate to SPIELINFO page where the Spielbericht download link is
+        url = f"{BASE_URL}/spiele/{game_id}/info"
+        
+        try:
+            _load(driver, url, 'info', 0.3)
+        except Exception as e:
+            logger.warning(f"    🔍 PDF Check failed (timeout/error: {str(e)[:20]})")
+            metrics.count('errors.fetch')
+            return None, 'error'
+        
+        html = _page_source(driver)
+        with metrics.timer('parse.info'):
+            spielbericht_link = parse_spielbericht_link(html)
+        if not spielbericht_link:
+            return None, 'no_report_link'
+        
+        # Handle relative URLs
+        if spielbericht_link.startswith('/'):
+            spielbericht_url = BASE_URL + spielbericht_link
+        else:
+            spielbericht_url = spielbericht_link
+        
+        try:
+            pdf_url, reason = follow_report_link(spielbericht_url)
+            if reason != 'unresolved':
+                return pdf_url, reason
+            logger.debug("    🔍 Bericht-Link über HTTP nicht aufgelöst, Browser folgt ihm")
+        except Exception as e:
+            logger.debug(f"    🔍 Bericht-Link über HTTP fehlgeschlagen ({str(e)[:60]}), Browser folgt ihm")
+        metrics.count('reports.browser_fallback')
+        
+        # Follow the Spielbericht link - it may redirect or have a form submission
+        try:
+            _load(driver, spielbericht_url, 'report', 0.5)
+        except Exception as e:
+            metrics.count('errors.fetch')
+            return None, 'error'
+        
+        # Check if we're on an external report page
+        current_url = driver.current_url
+        if 'spo.handball4all.de' in current_url:
+            return current_url, None
+        
+        # Otherwise look for the report / PDF link on the current page
+        html = _page_source(driver)
+        with metrics.timer('parse.report'):
+            pdf_url = parse_report_pdf_url(html)
+        return (pdf_url, None) if pdf_url else (None, 'report_404')
+    
+    except Exception as e:
+        logger.debug(f"    🔍 PDF Check failed: {str(e)[:60]}")
+        return None, 'error'
+
+
+def extract_spielbericht_pdf_url(driver, game_id):
+    """
+    Extract the Spielbericht PDF download link from the game's SPIELINFO page.
+    
+    Returns:
+        URL to PDF or None if not found (see resolve_spielbericht_pdf_url)
+    """
+    return resolve_spielbericht_pdf_url(driver, game_id)[0]
+
+
+def download_spielbericht(pdf_url):
+    """
+    Download a Spielbericht PDF once.
+    
+    Returns:
+        (content, None), or (None, reason): 'report_404' if the report is
+        missing or not a PDF, 'error' for other failures
+    """
+    from utility.pdf_parser import download_report_pdf
+    
+    try:
+        content = download_report_pdf(pdf_url, BASE_URL)
+    except FileNotFoundError:
+        return None, 'report_404'
+    except Exception as e:
+        status = getattr(getattr(e, 'response', None), 'status_code', None)
+        if status in (404, 410):
+            return None, 'report_404'
+        logger.warning(f"    ⚠️  PDF download failed: {str(e)[:80]}")
+        return None, 'error'
+    return (content, None) if content else (None, 'report_404')
+
+
+def extract_officials_from_info(driver, game_id):
+    """
+    Extract officials (Schiedsrichter, Zeitnehmer, Sekretär) from the game's SPIELINFO page.
+    
+    Returns:
+        dict with keys: 'referees', 'timekeepers', 'secretaries' (or None if not found)
+    """
+    try:
+        url = f"{BASE_URL}/spiele/{game_id}/info"
+        _load(driver, url, 'info', 0.3)
+        html = _page_source(driver)
+        
+        with metrics.timer('parse.officials'):
+            return parse_officials(html)
+    
+    except Exception as e:
+        return None
+
+
+def scrape_all_games(driver, games_with_teams, league_config=None, error_logger: ErrorLogger = None,
+                     progress: Optional[log.Progress] = None, journal: Optional[GameJournal] = None,
+                     negative: Optional[NegativeCache] = None, reports: Optional[ReportUrlCache] = None,
+                     teams: Optional[TeamRegistry] = None, players: Optional[PlayerIndex] = None):
+    """
+    Scrape all games and return game-centric data - use Spielplan order.
+    
+    With a journal, each finished game is appended to it right away and not
+    kept in memory; the returned list is then empty. With a negative cache,
+    games without lineup are skipped and reports known to be missing are not
+    looked up until their retry time; new misses are recorded there. With a
+    report URL cache, known report URLs are downloaded without resolving
+    them again and newly resolved ones are added. Team spellings of the
+    lineup pages are resolved through teams (a league's TeamRegistry; an
+    in-memory one if not given), and every player and goal gets the
+    player_id of players (a league's PlayerIndex, likewise).
+    """
+    games = []
+    teams = teams if teams is not None else TeamRegistry()
+    players = players if players is not None else PlayerIndex()
+    
+    # Get half duration from league config
+    half_duration = 30  # Default
+    if league_config:
+        half_duration = league_config.get('half_duration', 30)
+    
+    # Get league_id for error logging
+    league_id = league_config.get('name', 'unknown') if league_config else 'unknown'
+    
+    logger.debug(f"   📝 Starting to extract game details...")
+    
+    for idx, game_info in enumerate(games_with_teams, 1):
+        game_id = game_info['game_id']
+        spielplan_home = game_info['home_team']
+        spielplan_away = game_info['away_team']
+        date = game_info.get('date', 'Unknown')
+        order = game_info['order']
+        
+        game_start = time.perf_counter()
+        game_failed = False
+        log_tokens = log.bind(game_id=game_id)
+        try:
+            negative_reason = negative.skip_reason(game_info) if negative else None
+            if negative_reason == 'no_lineup':
+                logger.debug(f"  [{idx:3d}/{len(games_with_teams)}] ⏭️  {game_id}: ohne Aufstellung, später erneut")
+                metrics.count('games.skipped_negative')
+                continue
+            
+            url = f"{BASE_URL}/spiele/{game_id}/aufstellung"
+            logger.debug(f"  [{idx:3d}/{len(games_with_teams)}] Loading aufstellung...")
+            _load(driver, url, 'aufstellung', 1)
+            
+            html = _page_source(driver)
+            with metrics.timer('parse.aufstellung'):
+                players_by_team = extract_players_from_aufstellung(html, game_id)
+            
+            # Must have at least 2 teams with players
+            if len(players_by_team) < 2:
+                logger.warning(f"  [{idx:3d}/{len(games_with_teams)}] ❌ {game_id}: Incomplete ({len(players_by_team)} teams)")
+                metrics.count('games.incomplete')
+                if negative:
+                    negative.record(game_info, 'no_lineup')
+                continue
+            
+            # Get the team names from extracted data
+            teams_from_html = list(players_by_team.items())
+            team1_name, team1_players = teams_from_html[0]
+            team2_name, team2_players = teams_from_html[1]
+            
+            # Determine home/away based on Spielplan data if available
+            if spielplan_home and spielplan_away:
+                # Try exact match first
+                if team1_name == spielplan_home:
+                    home_team, home_players = team1_name, team1_players
+                    away_team, away_players = team2_name, team2_players
+                elif team2_name == spielplan_home:
+                    home_team, home_players = team2_name, team2_players
+                    away_team, away_players = team1_name, team1_players
+                else:
+                    # Known spellings are a lookup, new ones are fuzzy matched once
+                    home_index = teams.home_index(spielplan_home, spielplan_away, [team1_name, team2_name])
+                    if home_index == 1:
+                        home_team, home_players = team2_name, team2_players
+                        away_team, away_players = team1_name, team1_players
+                    else:
+                        # Fallback (no match): just use order from HTML
+                        home_team, home_players = team1_name, team1_players
+                        away_team, away_players = team2_name, team2_players
+                        if home_index is None:
+                            logger.error(f"    ❌ ERROR: Could not match home team '{spielplan_home}' (available: {team1_name}, {team2_name})")
+            else:
+                # Fallback: just use order from HTML
+                home_team, home_players = team1_name, team1_players
+                away_team, away_players = team2_name, team2_players
+            
+            # Stable player IDs per (registered) team name
+            home_key = teams.canonical(home_team) or home_team
+            away_key = teams.canonical(away_team) or away_team
+            players.assign(home_players, home_key)
+            players.assign(away_players, away_key)
+            
+            # Try to fetch and parse Spielbericht PDF for seven meter data and goal timeline
+            goals_timeline = []
+            graphic_path = None
+            if negative_reason in REPORT_REASONS:
+                logger.debug(f"    ⏭️  Spielbericht übersprungen ({negative_reason})")
+                metrics.count('reports.skipped_negative')
+            else:
+                pdf_url = reports.get(game_id) if reports else None
+                if pdf_url:
+                    metrics.count('reports.url_cached')
+                    report_reason = None
+                else:
+                    pdf_url, report_reason = resolve_spielbericht_pdf_url(driver, game_id)
+                content = None
+                if pdf_url:
+                    content, report_reason = download_spielbericht(pdf_url)
+                if reports and pdf_url:
+                    if content:
+                        reports.put(game_id, pdf_url)
+                    elif report_reason in REPORT_REASONS:
+                        reports.drop(game_id)
+                if content:
+                    from utility.pdf_parser import (
+                        extract_seven_meters_from_pdf, extract_goals_timeline_from_pdf,
+                        team_sides, split_seven_meters_by_side, add_seven_meters_to_players
+                    )
+                    
+                    seven_meter_data = extract_seven_meters_from_pdf(pdf_url, BASE_URL, content=content)
+                    goals_timeline = extract_goals_timeline_from_pdf(pdf_url, BASE_URL, content=content)
+                    
+                    # Sides of the report's team abbreviations, by lineup names
+                    sides = team_sides(goals_timeline, seven_meter_data, home_players, away_players)
+                    for goal in goals_timeline:
+                        goal['team'] = sides.get(goal.get('team_abbrev'), goal['team'])
+                    
+                    if seven_meter_data:
+                        # Add seven meter data to players, each team only its own entries
+                        by_side = split_seven_meters_by_side(seven_meter_data, sides)
+                        home_players = add_seven_meters_to_players(home_players, by_side['home'], home_key, players)
+                        away_players = add_seven_meters_to_players(away_players, by_side['away'], away_key, players)
+                    players.link_goals(goals_timeline, home_key, away_key, sides)
+                
+                if negative and report_reason in REPORT_REASONS:
+                    negative.record(game_info, report_reason)
+                elif negative and report_reason is None:
+                    negative.clear(game_id)
+            
+            # Extract officials from /info page
+            officials = extract_officials_from_info(driver, game_id)
+            
+            # Calculate final score from goals
+            home_score = len([g for g in goals_timeline if g['team'] == 'home'])
+            away_score = len([g for g in goals_timeline if g['team'] == 'away'])
+            
+            game = {
+                'game_id': game_id,
+                'order': order,
+                'date': date,
+                'home': {
+                    'team_name': home_team,
+                    'players': home_players
+                },
+                'away': {
+                    'team_name': away_team,
+                    'players': away_players
+                },
+                'goals_timeline': goals_timeline,
+                'final_score': f"{home_score}:{away_score}",
+                'half_duration': half_duration,
+                'officials': officials
+            }
+            
+            if journal:
+                journal.append(parse_date_to_yyyymmdd(date, REFERENCE_TIME), game)
+            else:
+                games.append(game)
+            metrics.count('games.scraped')
+            logger.info(f"  [{idx:3d}/{len(games_with_teams)}] ✅ {date} | {home_team} ({len(home_players)}) vs {away_team} ({len(away_players)})")
+        
+        except Exception as e:
+            error_str = str(e)[:60]
+            logger.error(f"  [{idx:3d}/{len(games_with_teams)}] ❌ {game_id}: {error_str}")
+            
+            # Log error for retry in next run
+            if error_logger:
+                error_logger.add_failed_game(
+                    game_id=game_id,
+                    liga_id=league_id,
+                    date=date,
+                    home_team=spielplan_home or 'Unknown',
+                    away_team=spielplan_away or 'Unknown',
+                    error=str(e)
+                )
+            metrics.count('errors.game')
+            game_failed = True
+            continue  # Continue with next game
+        finally:
+            metrics.record('game', time.perf_counter() - game_start)
+            log.unbind(log_tokens)
+            if progress:
+                progress.update(failed=game_failed)
+    
+    logger.debug(f"\n   ✓ Game extraction complete.")
+    return games
+
+def get_last_scraped_date(liga_id):
+    """Get the last date (yyyymmdd) that was already scraped for this league."""
+    data_dir = Path('frontend/public/data') / liga_id
+    if not data_dir.exists():
+        return None
+    
+    # Find latest date file (format: yyyymmdd.json)
+    date_files = sorted([
+        f.stem
+        for f in data_dir.glob('*.json')
+        if f.stem.isdigit() and len(f.stem) == 8
+    ])
+    
+    if date_files:
+        return date_files[-1]
+    return None
+
+def ensure_data_directories(liga_id):
+    """Create data directories for a league if they don't exist."""
+    data_dir = Path('frontend/public/data') / liga_id
+    data_dir.mkdir(parents=True, exist_ok=True)
+    logger.debug(f"📁 Verzeichnis vorbereitet: {data_dir.absolute()}")
+    return data_dir
+
+def should_scrape_league(liga_id, date_from, date_to):
+    """
+    Determine what date range needs to be scraped.
+    
+    Returns:
+        tuple: (start_date, end_date) both as YYYY-MM-DD strings
+        If no scraping needed, start_date > end_date
+    """
+    from datetime import datetime, timedelta
+    
+    # Parse date strings like "2025-09-13"
+    try:
+        from_date = datetime.strptime(date_from, '%Y-%m-%d').date()
+        to_date = datetime.strptime(date_to, '%Y-%m-%d').date()
+    except:
+        logger.warning(f"⚠️  Invalid date format.")
+        return to_date.strftime('%Y-%m-%d'), from_date.strftime('%Y-%m-%d')
+    
+    # If to_date is in future, use today instead
+    today = (REFERENCE_TIME or datetime.now()).date()
+    if to_date > today:
+        to_date = today
+    
+    last_scraped = get_last_scraped_date(liga_id)
+    
+    if last_scraped is None:
+        # Never scraped before - start from configured date
+        logger.info(f"   📅 First scrape: Starting from {date_from}")
+        return date_from, to_date.strftime('%Y-%m-%d')
+    
+    # Parse last_scraped (yyyymmdd format)
+    try:
+        last_year = int(last_scraped[:4])
+        last_month = int(last_scraped[4:6])
+        last_day = int(last_scraped[6:8])
+        last_date = datetime(last_year, last_month, last_day).date()
+    except:
+        logger.warning(f"   ⚠️  Could not parse last scraped date: {last_scraped}")
+        return date_from, to_date.strftime('%Y-%m-%d')
+    
+    # If last scraped is before end_date, continue scraping
+    if last_date < to_date:
+        next_date = last_date + timedelta(days=1)
+        logger.info(f"   📅 Incremental scrape: Last had data up to {last_date}, continuing from {next_date}")
+        return next_date.strftime('%Y-%m-%d'), to_date.strftime('%Y-%m-%d')
+    
+    logger.info(f"   ✅ All data already scraped up to {last_date}")
+    # Return invalid range (start > end) to indicate no scraping needed
+    return to_date.strftime('%Y-%m-%d'), from_date.strftime('%Y-%m-%d')
+
+def check_spielplan(driver, league_config) -> dict:
+    """
+    Load a league's Spielplan and diff it against the cached one.
+    
+    Returns:
+        dict with games (fresh Spielplan), diff (see
+        utility.spielplan_cache.diff_spielplan), changes (number of new,
+        rescored and rescheduled games), retries (games of the negative
+        cache due for another attempt) and cache (SpielplanCache)
+    """
+    league_name = league_config['name']
+    cache = SpielplanCache(league_name)
+    games = extract_game_ids_from_spielplan(driver, f"handball4all.baden-wuerttemberg.{league_name}")
+    diff = cache.diff(games)
+    changes = count_changes(diff)
+    retries = len(NegativeCache(league_name).due({g['game_id'] for g in games}))
+    if cache.updated_at is None:
+        logger.info(f"   🗓️  {league_name}: {len(games)} Spiele (noch kein Spielplan-Cache)")
+    elif changes:
+        logger.info(f"   🗓️  {league_name}: {describe_changes(diff)}")
+    else:
+        logger.info(f"   🗓️  {league_name}: unverändert")
+    if retries:
+        logger.info(f"   🔁 {league_name}: {retries} Spiel(e) ohne Aufstellung/Bericht erneut fällig")
+    return {'games': games, 'diff': diff, 'changes': changes, 'retries': retries, 'cache': cache}
+
+
+def compact_saved_journal(liga_id) -> int:
+    """
+    Merge journaled games of days already saved into their files (left by
+    an interrupted refresh or a failed save). Journaled games of later days
+    (an interrupted day in progress) stay for scrape_daily.
+    
+    Returns:
+        Number of Spieltag files updated
+    """
+    last_saved = get_last_scraped_date(liga_id)
+    if not last_saved:
+        return 0
+    with metrics.timer('save'):
+        added = GameJournal(liga_id).compact(until=last_saved)
+    if added:
+        logger.info(f"♻️  Journal: {len(added)} gespeicherte(r) Spieltag(e) ergänzt")
+    return len(added)
+
+
+def refresh_saved_games(driver, liga_id, games, negative: Optional[NegativeCache] = None,
+                        reports: Optional[ReportUrlCache] = None, teams: Optional[TeamRegistry] = None,
+                        players: Optional[PlayerIndex] = None):
+    """
+    Scrape games again whose Spieltag file already exists (new or moved to
+    that day, result entered or corrected after the day was saved, or
+    lineup/report due for another attempt) and add or replace them in the
+    file. A moved game is removed from the file of its old day.
+    
+    Returns:
+        Number of games scraped
+    """
+    data_dir = Path('frontend/public/data') / liga_id
+    journal = GameJournal(liga_id)
+    journaled_ids = journal.game_ids()
+    saved = [g for g in games
+             if (data_dir / f"{parse_date_to_yyyymmdd(g.get('date', ''), REFERENCE_TIME)}.json").exists()
+             and g['game_id'] not in journaled_ids]
+    if not saved:
+        return 0
+    
+    logger.info(f"🔁 {len(saved)} Spiel(e) in gespeicherten Spieltagen erneut (neu, verlegt, neues Ergebnis oder fälliger Versuch)")
+    scrape_all_games(driver, saved, {'name': liga_id}, journal=journal, negative=negative, reports=reports,
+                     teams=teams, players=players)
+    with metrics.timer('save'):
+        # Later days (an interrupted day in progress) stay for scrape_daily
+        journal.compact(until=get_last_scraped_date(liga_id))
+        drop_moved_games(data_dir, saved)
+    return len(saved)
+
+
+def unsaved_games(data_dir: Path, games: List[Dict]) -> List[Dict]:
+    """Games that are not in the Spieltag file of their date (missing or saved on another day)"""
+    saved_days = {}
+    for day_file in data_dir.glob('[0-9]' * 8 + '.json'):
+        with open(day_file, 'r') as f:
+            for g in json.load(f).get('games', []):
+                saved_days[g.get('game_id')] = day_file.stem
+    return [g for g in games
+            if saved_days.get(g['game_id']) != parse_date_to_yyyymmdd(g.get('date', ''), REFERENCE_TIME)]
+
+
+def drop_moved_games(data_dir: Path, games: List[Dict]):
+    """
+    Remove games from Spieltag files other than the one of their date,
+    once they are saved there (a rescheduled game stays in its old day's
+    file otherwise).
+    """
+    days = {g['game_id']: parse_date_to_yyyymmdd(g.get('date', ''), REFERENCE_TIME) for g in games}
+    saved_ids = {}
+    for day in set(days.values()):
+        day_file = data_dir / f'{day}.json'
+        if day_file.exists():
+            with open(day_file, 'r') as f:
+                saved_ids[day] = {g.get('game_id') for g in json.load(f).get('games', [])}
+    moved = {game_id for game_id, day in days.items() if game_id in saved_ids.get(day, ())}
+    
+    for day_file in sorted(data_dir.glob('[0-9]' * 8 + '.json')):
+        day = day_file.stem
+        with open(day_file, 'r') as f:
+            day_games = json.load(f).get('games', [])
+        kept = [g for g in day_games if g.get('game_id') not in moved or days[g['game_id']] == day]
+        if len(kept) < len(day_games):
+            write_spieltag_file(day_file, day, iter(kept))
+            logger.info(f"   📆 {len(day_games) - len(kept)} verlegte(s) Spiel(e) aus {day_file.name} entfernt")
+
+
+def scrape_league(driver, league_config, spielplan: Optional[dict] = None):
+    """
+    Scrape a single league using daily iteration.
+    
+    Args:
+        driver: Selenium WebDriver
+        league_config: League entry of the config
+        spielplan: Result of check_spielplan(); its games are used instead
+                   of loading the Spielplan again, new, rescored and
+                   rescheduled games of saved days are scraped again and
+                   the Spielplan cache is updated once the league is done
+    """
+    league_name = league_config['name']
+    league_display_name = league_config['display_name']
+    league_id = f"handball4all.baden-wuerttemberg.{league_name}"
+    
+    # Use league name as data folder ID
+    data_liga_id = league_name
+    
+    logger.info(f"\n{'=' * 70}")
+    logger.info(f"🏐 {league_display_name}")
+    logger.info(f"   📁 frontend/public/data/{data_liga_id}/")
+    logger.info(f"{'=' * 70}\n")
+    
+    # Step 1: Ensure directories exist
+    ensure_data_directories(data_liga_id)
+    
+    if not GAME_SAMPLE:
+        compact_saved_journal(data_liga_id)
+    
+    # Step 2: Determine what dates to scrape
+    start_date, end_date = should_scrape_league(data_liga_id, DATE_FROM, DATE_TO)
+    
+    negative = None if GAME_SAMPLE else NegativeCache(data_liga_id)
+    reports = None if GAME_SAMPLE else ReportUrlCache(data_liga_id)
+    teams = TeamRegistry(None if GAME_SAMPLE else data_liga_id)
+    players = PlayerIndex(None if GAME_SAMPLE else data_liga_id)
+    if spielplan and negative:
+        negative.prune({g['game_id'] for g in spielplan['games']})
+        due = set(negative.due())
+        if spielplan['cache'].updated_at is None:
+            # No cache to diff against (first run, new cache version): every
+            # game counts as new, so only look for those not saved on their day
+            changed = unsaved_games(Path('frontend/public/data') / data_liga_id, spielplan['games'])
+        else:
+            changed = [g for kind in CHANGE_KINDS for g in spielplan['diff'][kind]]
+        changed_ids = {g['game_id'] for g in changed}
+        refresh = changed + [
+            g for g in spielplan['games'] if g['game_id'] in due and g['game_id'] not in changed_ids
+        ]
+        refresh_saved_games(driver, data_liga_id, refresh, negative, reports, teams, players)
+        negative.save()
+        reports.save()
+        teams.save()
+        players.save()
+    
+    # Check if scraping needed (start_date > end_date means already up to date)
+    if start_date > end_date:
+        logger.info(f"✅ Already up to date\n")
+        if spielplan and not GAME_SAMPLE:
+            spielplan['cache'].save(spielplan['games'], spielplan.get('validators'))
+        return
+    
+    # Step 3: Scrape daily
+    stats = scrape_daily(driver, data_liga_id, league_id, start_date, end_date,
+                         spielplan['games'] if spielplan else None, negative, reports, teams, players)
+    # Days that could not be saved keep the changes pending for the next run
+    if spielplan and not GAME_SAMPLE and not stats['spieltage_failed']:
+        spielplan['cache'].save(spielplan['games'], spielplan.get('validators'))
+    
+    # Step 4: Summary
+    logger.info(f"\n{'=' * 70}")
+    logger.info(f"✅ COMPLETE: {league_display_name}")
+    logger.info(f"{'=' * 70}")
+    logger.info(f"   ✓ Spieltage: {stats['spieltage_saved']}")
+    logger.info(f"   ✓ Games: {stats['games_total']}")
+    if stats['spieltage_failed'] > 0:
+        logger.info(f"   ⚠️  Failed: {stats['spieltage_failed']}")
+
+
+def save_spieltag_file(liga_id, date_yyyymmdd, games):
+    """
+    Save games for a single matchday to yyyymmdd.json file.
+    
+    Args:
+        liga_id: League identifier
+        date_yyyymmdd: Date in YYYYMMDD format
+        games: List of game dictionaries
+    """
+    data_dir = Path('frontend/public/data') / liga_id
+    data_dir.mkdir(parents=True, exist_ok=True)
+    
+    output_file = data_dir / f'{date_yyyymmdd}.json'
+    
+    try:
+        # Check if file already exists and merge
+        if output_file.exists():
+            with open(output_file, 'r') as f:
+                existing_data = json.load(f)
+            existing_games = existing_data.get('games', [])
+            existing_ids = {g.get('game_id') for g in existing_games}
+            
+            # Add only new games
+            new_games = [g for g in games if g.get('game_id') not in existing_ids]
+            
+            if new_games:
+                merged_games = existing_games + new_games
+                logger.debug(f"      ✍️  Writing (update): {output_file}")
+                with open(output_file, 'w') as f:
+                    json.dump({'date': date_yyyymmdd, 'games': merged_games}, f, indent=2)
+                logger.debug(f"      ✅ Updated (+{len(new_games)} new, total: {len(merged_games)})")
+            else:
+                logger.debug(f"      ℹ️  No new games to add")
+        else:
+            # Create new file
+            logger.debug(f"      ✍️  Writing (new): {output_file}")
+            with open(output_file, 'w') as f:
+                json.dump({'date': date_yyyymmdd, 'games': games}, f, indent=2)
+            logger.debug(f"      ✅ Created ({len(games)} games)")
+        
+        return True
+    except Exception as e:
+        logger.error(f"      ❌ Error saving {output_file}: {e}")
+        return False
+
+def games_in_range(games, start_date_str, end_date_str):
+    """Spielplan games dated between start and end (YYYY-MM-DD, inclusive)"""
+    first, last = start_date_str.replace('-', ''), end_date_str.replace('-', '')
+    return [g for g in games if first <= (parse_date_to_yyyymmdd(g.get('date', ''), REFERENCE_TIME) or '') <= last]
+
+
+def sample_games(games, start_date_str, end_date_str, size):
+    """
+    Fixed random sample of the games within a date range.
+    
+    Args:
+        games: Spielplan games (with 'date' and 'order')
+        start_date_str, end_date_str: Range (YYYY-MM-DD)
+        size: Number of games to keep
+    
+    Returns:
+        Up to size games in Spielplan order (same sample on every run)
+    """
+    import random
+    
+    in_range = games_in_range(games, start_date_str, end_date_str)
+    sample = random.Random(0).sample(in_range, min(size, len(in_range)))
+    return sorted(sample, key=lambda g: g['order'])
+
+
+def scrape_daily(driver, liga_id, league_id, start_date_str, end_date_str, all_games_info=None,
+                 negative: Optional[NegativeCache] = None, reports: Optional[ReportUrlCache] = None,
+                 teams: Optional[TeamRegistry] = None, players: Optional[PlayerIndex] = None):
+    """
+    Scrape games chronologically, day by day.
+    
+    Finished games go to the league's GameJournal and are compacted into
+    yyyymmdd.json at the end of each day; games journaled by an interrupted
+    earlier run are skipped.
+    
+    Args:
+        driver: Selenium WebDriver
+        liga_id: League identifier (e.g., "mc-ol-3-bw_bwhv")
+        league_id: Full league ID for handball4all
+        start_date_str: Start date (YYYY-MM-DD)
+        end_date_str: End date (YYYY-MM-DD)
+        all_games_info: Spielplan games if already loaded (else loaded here)
+        negative: NegativeCache of the league (saved after every day)
+        reports: ReportUrlCache of the league (saved after every day)
+        teams: TeamRegistry of the league (saved after every day)
+        players: PlayerIndex of the league (saved after every day)
+    
+    Returns:
+        dict: Statistics about scraping (games_total, spieltage_saved, errors)
+    """
+    from datetime import datetime, timedelta
+    
+    # Initialize error logger
+    error_logger = ErrorLogger()
+    
+    stats = {
+        'games_total': 0,
+        'spieltage_saved': 0,
+        'spieltage_failed': 0,
+        'games_with_errors': 0
+    }
+    
+    # Parse date range
+    try:
+        current_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+    except Exception as e:
+        logger.error(f"❌ Error parsing dates: {e}")
+        return stats
+    
+    logger.info(f"\n📅 Scraping daily from {start_date_str} to {end_date_str}\n")
+    
+    # Load ALL games from Spielplan once
+    if all_games_info is None:
+        logger.info(f"🌐 FETCHING ALL GAMES FROM SPIELPLAN")
+        try:
+            all_games_info = extract_game_ids_from_spielplan(driver, league_id)
+            logger.info(f"\n✓ Total games found: {len(all_games_info)}\n")
+        except Exception as e:
+            logger.error(f"❌ Error fetching games: {e}")
+            return stats
+    
+    if not all_games_info:
+        logger.warning(f"⚠️  No games found")
+        return stats
+    
+    if teams is not None:
+        teams.add_teams(name for g in all_games_info for name in (g.get('home_team'), g.get('away_team')))
+    
+    if GAME_SAMPLE:
+        all_games_info = sample_games(all_games_info, start_date_str, end_date_str, GAME_SAMPLE)
+        logger.info(f"🎲 Stichprobe: {len(all_games_info)} Spiele (werden nicht gespeichert)\n")
+    
+    progress = log.Progress(len(games_in_range(all_games_info, start_date_str, end_date_str)))
+    
+    # Sampled games are not saved, so they bypass the journal
+    journal = None if GAME_SAMPLE else GameJournal(liga_id)
+    journaled_ids = journal.game_ids() if journal else set()
+    if journaled_ids:
+        logger.info(f"♻️  Journal: {len(journaled_ids)} Spiel(e) aus abgebrochenem Lauf bereits fertig\n")
+    
+    # Iterate day by day with compression for empty days
+    empty_days_start = None
+    empty_days_count = 0
+    
+    while current_date <= end_date:
+        date_str_formatted = current_date.strftime('%Y-%m-%d')
+        date_yyyymmdd = current_date.strftime('%Y%m%d')
+        
+        # Filter games for this specific date
+        games_for_date = [g for g in all_games_info if parse_date_to_yyyymmdd(g.get('date', ''), REFERENCE_TIME) == date_yyyymmdd]
+        
+        if not games_for_date:
+            # Track empty days
+            if empty_days_start is None:
+                empty_days_start = date_str_formatted
+            empty_days_count += 1
+            current_date += timedelta(days=1)
+            continue
+        
+        # Print accumulated empty days (if any)
+        if empty_days_count > 0:
+            empty_days_end = (current_date - timedelta(days=1)).strftime('%Y-%m-%d')
+            if empty_days_count == 1:
+                logger.info(f"⏭️  No games: {empty_days_start}")
+            else:
+                logger.info(f"⏭️  No games: {empty_days_start} to {empty_days_end} ({empty_days_count} days)")
+            empty_days_start = None
+            empty_days_count = 0
+        
+        # Process day with games
+        logger.info(f"📅 {date_str_formatted}")
+        
+        try:
+            logger.debug(f"   ✓ Found {len(games_for_date)} game(s)")
+            
+            # Scrape details for each game
+            logger.debug(f"   👥 Scraping game details...")
+            
+            # Get league config for error logging
+            league_config = {'name': liga_id}
+            
+            done = [g for g in games_for_date if g['game_id'] in journaled_ids]
+            if done:
+                logger.info(f"   ♻️  {len(done)} Spiel(e) aus dem Journal übernommen")
+                progress.update(len(done))
+                games_for_date = [g for g in games_for_date if g['game_id'] not in journaled_ids]
+            
+            try:
+                scraped_games = scrape_all_games(driver, games_for_date, league_config, error_logger, progress, journal,
+                                                 negative, reports, teams, players)
+                logger.debug(f"   ✓ Scraped {len(scraped_games)} game(s)")
+            except Exception as e:
+                logger.warning(f"   ⚠️  Error scraping games: {e}")
+                stats['spieltage_failed'] += 1
+                stats['games_with_errors'] += len(games_for_date)
+                current_date += timedelta(days=1)
+                continue
+            
+            # Save to file
+            logger.debug(f"   💾 Saving...")
+            
+            if GAME_SAMPLE:
+                logger.debug(f"   ⊘ Stichprobe, nicht gespeichert")
+                stats['spieltage_saved'] += 1
+                stats['games_total'] += len(scraped_games)
+            else:
+                try:
+                    with metrics.timer('save'):
+                        added = journal.compact(until=date_yyyymmdd)
+                        # A day whose games all failed still gets its (empty) file
+                        save_spieltag_file(liga_id, date_yyyymmdd, [])
+                        if negative:
+                            negative.save()
+                        if reports:
+                            reports.save()
+                        if teams:
+                            teams.save()
+                        if players:
+                            players.save()
+                    stats['spieltage_saved'] += 1
+                    stats['games_total'] += added.get(date_yyyymmdd, 0)
+                except Exception as e:
+                    # The games stay in the journal and are compacted by the next run
+                    logger.error(f"      ❌ Error saving {date_yyyymmdd}.json: {e}")
+                    stats['spieltage_failed'] += 1
+                    stats['games_with_errors'] += len(games_for_date)
+        
+        except Exception as e:
+            logger.error(f"   ❌ Error processing day: {e}")
+            stats['spieltage_failed'] += 1
+        
+        current_date += timedelta(days=1)
+    
+    # Print remaining empty days
+    if empty_days_count > 0:
+        empty_days_end = (current_date - timedelta(days=1)).strftime('%Y-%m-%d')
+        if empty_days_count == 1:
+            logger.info(f"⏭️  No games: {empty_days_start}")
+        else:
+            logger.info(f"⏭️  No games: {empty_days_start} to {empty_days_end} ({empty_days_count} days)")
+    
+    # Save error log at the end
+    if error_logger.failed_games:
+        error_logger.save()
+        logger.warning(f"\n⚠️  Error summary:")
+        summary = error_logger.get_summary()
+        for liga, games in summary.items():
+            logger.warning(f"   {liga}: {len(games)} failed game(s)")
+            for game in games[:3]:  # Show first 3 errors
+                logger.warning(f"      - {game['teams']} ({game['date']}): {game['error']}")
+            if len(games) > 3:
+                logger.warning(f"      ... and {len(games) - 3} more")
+    
+    return stats
+
+
+def update_meta_index(liga_id=None):
+    """
+    Update meta.json with all available Spieltage.
+    
+    Args:
+        liga_id: Optional - if provided, update only this league
+                 if None, update all leagues (slower, but complete)
+    """
+    logger.debug(f"\n🔄 Updating meta.json...")
+    
+    meta_file = Path('frontend/public/data/meta.json')
+    meta_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Try to load existing meta
+    if meta_file.exists():
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
+    else:
+        meta = {
+            'last_updated': datetime.now().isoformat() + 'Z',
+            'leagues': {}
+        }
+    
+    # Build a map of league names to display names from config
+    league_display_names = {}
+    for league_config in CONFIG['leagues']:
+        league_display_names[league_config['name']] = league_config['display_name']
+    
+    data_dir = Path('frontend/public/data')
+    
+    # If specific liga_id provided, update only that league
+    if liga_id:
+        liga_folder = data_dir / liga_id
+        if liga_folder.exists() and liga_folder.is_dir():
+            # Find all date-based files (format: yyyymmdd.json)
+            date_files = sorted([
+                f.stem
+                for f in liga_folder.glob('*.json')
+                if f.stem.isdigit() and len(f.stem) == 8
+            ])
+            
+            if date_files:
+                display_name = league_display_names.get(liga_id, liga_id)
+                meta['leagues'][liga_id] = {
+                    'name': display_name,
+                    'spieltage': date_files,
+                    'last_updated': datetime.now().isoformat() + 'Z'
+                }
+                logger.debug(f"   ✅ {liga_id}: {len(date_files)} Spieltag(e)")
+    else:
+        # Update all leagues
+        for liga_folder in sorted(data_dir.iterdir()):
+            if not liga_folder.is_dir():
+                continue
+            
+            liga_id_item = liga_folder.name
+            
+            # Find all date-based files (format: yyyymmdd.json)
+            date_files = sorted([
+                f.stem
+                for f in liga_folder.glob('*.json')
+                if f.stem.isdigit() and len(f.stem) == 8
+            ])
+            
+            if date_files:
+                display_name = league_display_names.get(liga_id_item, liga_id_item)
+                meta['leagues'][liga_id_item] = {
+                    'name': display_name,
+                    'spieltage': date_files,
+                    'last_updated': datetime.now().isoformat() + 'Z'
+                }
+                logger.debug(f"   ✅ {liga_id_item}: {len(date_files)} Spieltag(e)")
+    
+    # Update timestamp
+    meta['last_updated'] = datetime.now().isoformat() + 'Z'
+    
+    logger.debug(f"   ✍️  Writing: {meta_file.absolute()}")
+    with open(meta_file, 'w') as f:
+        json.dump(meta, f, indent=2)
+    
+    logger.debug(f"   ✅ meta.json updated")
@@ -27,6 +27,7 @@ class HandballNetSeleniumAuthenticator:
         self.headless = headless
         self.driver = None
         self.cookies = {}
+        self.cookie_jar = []
     
     def _resolve_cert_path(self, cert_path: str) -> Optional[str]:
         """Resolve certificate path, expanding ~ to home directory"""
@@ -103,7 +104,7 @@ class HandballNetSeleniumAuthenticator:
             self.driver.get(f"{self.base_url}/anmelden")
             
             # Wait for page to load
-            time.sleep(2)
+            self._wait_until(lambda driver: driver.execute_script('return document.readyState') == 'complete', 10)
             
             # Try to handle cookie banner (but don't fail if we can't)
             try:
@@ -232,14 +233,11 @@ class HandballNetSeleniumAuthenticator:
                     print(f"✓ Redirected to: {self.driver.current_url}")
                 except:
                     print("⚠ Timeout waiting for redirect, checking if logged in anyway...")
-                    time.sleep(3)
             else:
                 print("⚠ Could not find login button, will wait for page load...")
-                time.sleep(5)
             
             # Check if logged in by looking for logout element
-            time.sleep(2)
-            if self._is_logged_in():
+            if self._wait_until(lambda driver: self._is_logged_in(), 5):
                 print("✓ Successfully authenticated with handball.net")
                 self._save_cookies()
                 return True
@@ -258,6 +256,14 @@ class HandballNetSeleniumAuthenticator:
         
         # SUCCESS: Don't quit driver - we need it for further navigation!
     
+    def _wait_until(self, condition, timeout: float) -> bool:
+        """Wait up to timeout seconds for condition(driver); False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(condition)
+            return True
+        except Exception:
+            return False
+    
     def _is_logged_in(self) -> bool:
         """Check if user is logged in"""
         page_source = self.driver.page_source.lower()
@@ -266,7 +272,8 @@ class HandballNetSeleniumAuthenticator:
     def _save_cookies(self):
         """Save cookies from Selenium session"""
         if self.driver:
-            for cookie in self.driver.get_cookies():
+            self.cookie_jar = self.driver.get_cookies()
+            for cookie in self.cookie_jar:
                 self.cookies[cookie['name']] = cookie['value']
     
     def _print_page_info(self):
@@ -332,3 +339,7 @@ class HandballNetSeleniumAuthenticator:
     def get_cookies(self) -> dict:
         """Get saved cookies"""
         return self.cookies
+    
+    def get_cookie_jar(self) -> list:
+        """Get saved cookies with domain, path and expiry (as returned by Selenium)"""
+        return self.cookie_jar
@@ -0,0 +1,126 @@
+"""
+Persistent Spielplan per league with row-level change detection.
+
+The parsed Spielplan of each league is kept in
+frontend/public/data/spielplan/<liga>.json (outside the league folder, whose
+*.json files are all Spieltage). Every game row carries a fingerprint of
+date, teams and score. Diffing a freshly loaded Spielplan against it yields
+exactly the games that are new, got a (different) score or moved to another
+date; if no league has any, the scraper stops before loading a game page.
+
+The cache of a league is only written after the league was scraped, so an
+interrupted run sees the same changes again. It also keeps the HTTP
+validators (ETag / Last-Modified) of the Spielplan pages for the
+conditional requests of utility.precheck.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utility.log import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+CACHE_DIR = Path('frontend/public/data/spielplan')
+FINGERPRINT_FIELDS = ('date', 'home_team', 'away_team', 'score')
+CHANGE_KINDS = ('new', 'rescored', 'rescheduled')
+
+
+def row_fingerprint(game: Dict) -> str:
+    """Short hash of the fields of a Spielplan row that matter for scraping"""
+    text = '\x1f'.join(str(game.get(field) or '') for field in FINGERPRINT_FIELDS)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def diff_spielplan(cached: Dict[str, Dict], games: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Compare fresh Spielplan games with cached rows.
+
+    Args:
+        cached: game_id -> cached row (see SpielplanCache.rows)
+        games: Freshly parsed Spielplan games
+
+    Returns:
+        dict with lists of games: new, rescored (score or teams differ),
+        rescheduled (date differs), unchanged; plus the removed game_ids
+    """
+    diff = {'new': [], 'rescored': [], 'rescheduled': [], 'unchanged': [], 'removed': []}
+    fresh_ids = set()
+    for game in games:
+        game_id = game['game_id']
+        fresh_ids.add(game_id)
+        row = cached.get(game_id)
+        if row is None:
+            diff['new'].append(game)
+        elif row['fingerprint'] == row_fingerprint(game):
+            diff['unchanged'].append(game)
+        elif row.get('date') != game.get('date'):
+            diff['rescheduled'].append(game)
+        else:
+            diff['rescored'].append(game)
+    diff['removed'] = [game_id for game_id in cached if game_id not in fresh_ids]
+    return diff
+
+
+def count_changes(diff: Dict[str, List]) -> int:
+    """Number of games that need scraping work"""
+    return sum(len(diff[kind]) for kind in CHANGE_KINDS)
+
+
+def describe_changes(diff: Dict[str, List]) -> str:
+    """e.g. "3 neu, 1 Ergebnis, 0 verlegt" """
+    return (f"{len(diff['new'])} neu, {len(diff['rescored'])} Ergebnis, "
+            f"{len(diff['rescheduled'])} verlegt")
+
+
+class SpielplanCache:
+    """Cached Spielplan rows of one league"""
+
+    def __init__(self, liga_id: str, cache_dir: Path = CACHE_DIR):
+        self.liga_id = liga_id
+        self.path = Path(cache_dir) / f"{liga_id}.json"
+        self.rows: Dict[str, Dict] = {}
+        self.validators: Dict[str, Dict] = {}
+        self.updated_at: Optional[str] = None
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self.rows = data.get('games', {})
+                    self.validators = data.get('http', {})
+                    self.updated_at = data.get('updated_at')
+            except Exception as e:
+                logger.warning(f"   ⚠️  Spielplan-Cache nicht lesbar ({e}), alle Spiele gelten als neu")
+
+    def diff(self, games: List[Dict]) -> Dict[str, List[Dict]]:
+        """Changes of games against the cached rows (see diff_spielplan)"""
+        return diff_spielplan(self.rows, games)
+
+    def save(self, games: List[Dict], validators: Optional[Dict[str, Dict]] = None):
+        """
+        Replace the cached rows with games.
+
+        Args:
+            games: Spielplan games the league was scraped with
+            validators: page URL -> {etag, last_modified} of the responses
+                        the games came from (None drops stored validators)
+        """
+        self.rows = {
+            game['game_id']: {
+                **{field: game.get(field) for field in FINGERPRINT_FIELDS},
+                'fingerprint': row_fingerprint(game)
+            }
+            for game in games
+        }
+        self.validators = validators or {}
+        self.updated_at = datetime.now().isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'updated_at': self.updated_at, 'games': self.rows,
+                       'http': self.validators},
+                      f, ensure_ascii=False, indent=2, sort_keys=True)
@@ -0,0 +1,152 @@
+"""
+Team names of a league with learned spellings.
+
+The lineup page of a game does not always spell a team like the Spielplan
+does ("TSV Heim e.V." vs "TSV Heim"). TeamRegistry keeps the Spielplan
+names (and, if known, those of the Tabelle) under a normalized key, plus
+every other spelling that was matched to one of them once. Deciding which
+lineup team plays at home is then a dict lookup; the SequenceMatcher
+comparison of fuzzy_match_team_name only runs for a spelling never seen
+before, and its result (with the match score) is kept in
+frontend/public/data/spielplan/<liga>.teams.json for later runs.
+
+Registered names always win over learned aliases. An alias that leads to
+neither team of a later game was a wrong match (e.g. a reserve team
+"... 2") and is dropped and matched again.
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from utility import metrics
+from utility.log import get_logger
+from utility.parsing import fuzzy_match_team_name
+from utility.spielplan_cache import CACHE_DIR
+
+logger = get_logger(__name__)
+
+UMLAUTS = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+
+
+def normalize_team_name(name: str) -> str:
+    """Key of a team name: lower case, umlauts spelled out, no punctuation or extra spaces"""
+    text = unicodedata.normalize('NFC', name).casefold().translate(UMLAUTS)
+    text = re.sub(r'[-/_]', ' ', text)
+    text = re.sub(r'[^\w\s]', '', text)
+    return ' '.join(text.split())
+
+
+class TeamRegistry:
+    """Team names of one league, indexed by normalized spelling"""
+
+    def __init__(self, liga_id: Optional[str] = None, cache_dir: Path = CACHE_DIR):
+        """
+        Args:
+            liga_id: League whose registry is loaded and saved; None keeps
+                     it in memory only (e.g. sample runs)
+        """
+        self.path = Path(cache_dir) / f"{liga_id}.teams.json" if liga_id else None
+        self.teams: Set[str] = set()
+        self.aliases: Dict[str, Dict] = {}  # normalized spelling -> {'team', 'score'}
+        self._index: Dict[str, str] = {}
+        self._unmatched: Set[str] = set()  # keys fuzzy matching failed for (this run)
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.teams = set(data.get('teams', []))
+                self.aliases = {
+                    key: alias if isinstance(alias, dict) else {'team': alias, 'score': None}
+                    for key, alias in data.get('aliases', {}).items()
+                }
+            except Exception as e:
+                logger.warning(f"   ⚠️  Team-Register nicht lesbar ({e}), wird neu angelegt")
+        for team in self.teams:
+            self._index[normalize_team_name(team)] = team
+        for key in [key for key in self.aliases if key in self._index]:
+            del self.aliases[key]  # a registered name wins
+            self._dirty = True
+        self._index.update((key, alias['team']) for key, alias in self.aliases.items())
+
+    def add_teams(self, names: Iterable[str]):
+        """Register official team names (Spielplan, or HandballNetCrawler.get_teams())"""
+        for name in names:
+            if name and name not in self.teams:
+                key = normalize_team_name(name)
+                self.teams.add(name)
+                self._index[key] = name
+                self.aliases.pop(key, None)
+                self._dirty = True
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Registered name for a spelling, None if it is not known yet"""
+        return self._index.get(normalize_team_name(name))
+
+    def resolve(self, name: str, candidates: List[str]) -> Optional[str]:
+        """
+        Registered name of a spelling; an unknown spelling is fuzzy matched
+        against candidates once and remembered as alias. An alias that leads
+        to none of the candidates is dropped and matched again.
+
+        Args:
+            name: Spelling, e.g. from a lineup page
+            candidates: Registered names it may stand for (the game's teams)
+
+        Returns:
+            Registered name, or None if nothing matches
+        """
+        key = normalize_team_name(name)
+        known = self._index.get(key)
+        if known is not None and key in self.aliases and known not in {self.canonical(c) or c for c in candidates}:
+            logger.info(f"    🏷️  Team-Schreibweise verworfen: '{name}' ≠ '{known}'")
+            del self.aliases[key]
+            del self._index[key]
+            self._dirty = True
+            known = None
+        if known is not None:
+            return known
+        if key in self._unmatched:
+            return None
+
+        metrics.count('teams.fuzzy')
+        match, score = fuzzy_match_team_name(name, candidates)
+        if match is None:
+            self._unmatched.add(key)
+            return None
+        canonical = self.canonical(match) or match
+        self.aliases[key] = {'team': canonical, 'score': round(score, 3)}
+        self._index[key] = canonical
+        self._dirty = True
+        logger.info(f"    🏷️  Team-Schreibweise gelernt: '{name}' = '{canonical}' (score: {score:.2f})")
+        return canonical
+
+    def home_index(self, spielplan_home: str, spielplan_away: str, lineup_names: List[str]) -> Optional[int]:
+        """
+        Which of the lineup teams is the Spielplan's home team.
+
+        Returns:
+            Index into lineup_names, None if neither team could be matched
+        """
+        self.add_teams([spielplan_home, spielplan_away])
+        home, away = self.canonical(spielplan_home), self.canonical(spielplan_away)
+        resolved = [self.resolve(name, [spielplan_home, spielplan_away]) for name in lineup_names]
+        if home in resolved:
+            return resolved.index(home)
+        if away in resolved and len(lineup_names) == 2:
+            # The other team must be the home team
+            return 1 - resolved.index(away)
+        return None
+
+    def save(self):
+        """Write the registry if it changed (no-op without liga_id)"""
+        if not self._dirty or self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'teams': sorted(self.teams), 'aliases': self.aliases},
+                      f, ensure_ascii=False, indent=2, sort_keys=True)
+        self._dirty = False